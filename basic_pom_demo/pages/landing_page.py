@@ -1,8 +1,15 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from framework.adaptive_wait import AdaptiveWait, PollSchedule
+from framework.animation import wait_for_style_change
+from framework.instrumentation import step
+from framework.multi_wait import wait_for_all
+from framework.page_ready import navigate_until_ready
+from framework.snapshot import snapshot_elements
+from framework.site_urls import site_url
+from framework.traffic_replay import use_traffic
 
 
 class LandingPage:
@@ -10,6 +17,7 @@ class LandingPage:
 
     URL = "https://seleniumbase.io/demo_page"
     TIMEOUT = 10
+    POLL = PollSchedule()
 
     # --- Locators ---
     PAGE_HEADER = (By.XPATH, "//h1[text()='Demo Page']")
@@ -48,13 +56,21 @@ class LandingPage:
     READ_ONLY_INPUT = (By.ID, "readOnlyText")
     COLOR_TEXT_PARAGRAPH = (By.ID, "pText")
 
+    # open() returns once these are visible and the DOM is interactive
+    READY_LOCATORS = (PAGE_HEADER, TEXT_INPUT, BUTTON)
+    # "record", "replay" or "passthrough"; None follows --traffic
+    traffic_mode = None
+
     # --- Functions ---
-    def __init__(self, driver, timeout: int = TIMEOUT):
+    def __init__(self, driver, timeout=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+        self.wait = AdaptiveWait(driver, self.timeout, self.POLL)
+        self.open_seconds = None
 
     def _wait_for_element(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        with step(self.driver, "wait_visible", locator):
+            return self.wait.until(EC.visibility_of_element_located(locator))
 
     @staticmethod
     def _assert_equal(expected, actual, message_prefix=""):
@@ -68,21 +84,29 @@ class LandingPage:
             expected != actual
         ), f"{message_prefix}Expected: '{expected}', Actual: '{actual.strip()}'"
 
+    @property
+    def url(self):
+        return site_url(self.URL)
+
     def open(self):
-        self.driver.get(self.URL)
-        self._wait_for_element(self.PAGE_HEADER)
+        use_traffic(self.driver, type(self).__name__, self.traffic_mode)
+        self.open_seconds = navigate_until_ready(
+            self.driver, self.url, self.READY_LOCATORS, self.timeout
+        )
 
     def validate_text_input(self, label_expected_text, value_to_type):
-        input_elem = self._wait_for_element(self.TEXT_INPUT)
-        label_elem = self._wait_for_element(self.TEXT_INPUT_LABEL)
-        self._assert_equal(
-            label_elem.text.strip(), label_expected_text, "Label text mismatch: "
+        locators = [self.TEXT_INPUT, self.TEXT_INPUT_LABEL]
+        input_elem, _ = wait_for_all(
+            self.driver, locators, self.timeout, schedule=self.POLL
         )
         input_elem.clear()
         input_elem.send_keys(value_to_type)
+        # Label text and typed value read back together
+        input_snap, label_snap = snapshot_elements(self.driver, locators)
         self._assert_equal(
-            input_elem.get_attribute("value"), value_to_type, "Input value mismatch: "
+            label_snap.text, label_expected_text, "Label text mismatch: "
         )
+        self._assert_equal(input_snap.value, value_to_type, "Input value mismatch: ")
 
     def validate_pre_filled_text_input(
         self, label_expected_text, expected_prefill, text_to_append
@@ -131,11 +155,9 @@ class LandingPage:
         assert fill_attribute is not None, f"'fill' attribute missing on {svg_elem}"
         self._assert_equal(fill_attribute.lower(), expected_fill.lower())
         svg_elem.click()
-        initial_opacity = svg_elem.value_of_css_property("opacity")
-        ActionChains(self.driver).pause(1).perform()
-        final_opacity = svg_elem.value_of_css_property("opacity")
+        change = wait_for_style_change(self.driver, svg_elem, "opacity")
         self._assert_not_equal(
-            initial_opacity, final_opacity, "SVG opacity unchanged after click"
+            change.initial, change.final, "SVG opacity unchanged after click"
         )
 
     def validate_dropdown_menu_selection(self, expected_options, option_to_select):
@@ -173,21 +195,21 @@ class LandingPage:
             (self.COLOR_TEXT_PARAGRAPH, f"This Text is {expected_color}", "text"),
         ]
 
-        for locator, expected_text, source in elements:
-            element = self._wait_for_element(locator)
-
+        locators = [locator for locator, _, _ in elements]
+        wait_for_all(self.driver, locators, self.timeout, schedule=self.POLL)
+        snapshots = snapshot_elements(self.driver, locators, attributes=["style"])
+        for (locator, expected_text, source), snap in zip(elements, snapshots):
             if source == "value":
-                value_attr = element.get_attribute("value")
-                assert value_attr is not None, f"'value' attribute missing on {locator}"
-                actual_text = value_attr.strip()
+                assert snap.value is not None, f"'value' attribute missing on {locator}"
+                actual_text = snap.value.strip()
             elif source == "text":
-                actual_text = element.text.strip()
+                actual_text = snap.text
             else:
                 raise ValueError(f"Unknown source '{source}'")
 
             self._assert_equal(actual_text, expected_text)
 
-            style_attr = element.get_attribute("style")
+            style_attr = snap.attributes["style"]
             assert style_attr is not None, f"'style' attribute missing on {locator}"
             actual_style = style_attr.lower().replace(" ", "").rstrip(";")
 
@@ -0,0 +1,141 @@
+import json
+import pytest
+from pathlib import Path
+from typing import Callable, Generator, Optional
+from framework.baselines import BaselineStore, BenchmarkResult, measure
+from framework.local_server import LocalSiteServer
+from framework.locator_profiler import LocatorProfile, apply_candidate, report_lines
+from framework.site_urls import set_base_url, site_url
+from main_pom_project.pages.dynamic_table_page import DynamicTablePage
+
+results_key = pytest.StashKey[dict[str, BenchmarkResult]]()
+locator_profiles_key = pytest.StashKey[list[LocatorProfile]]()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_site(
+    request: pytest.FixtureRequest,
+) -> Generator[LocalSiteServer, None, None]:
+    # Benchmarks always run against the local stand-in pages so results do
+    # not depend on network conditions or third-party content
+    latency = request.config.getoption("--site-latency") / 1000
+    with LocalSiteServer(latency=latency) as server:
+        set_base_url(server.base_url)
+        yield server
+        set_base_url(None)
+
+
+@pytest.fixture(scope="session")
+def table_page_url() -> Callable[[int], str]:
+    return lambda row_count: f"{site_url(DynamicTablePage.URL)}?rows={row_count}"
+
+
+@pytest.fixture(scope="session")
+def baseline_store(
+    request: pytest.FixtureRequest,
+) -> Generator[BaselineStore, None, None]:
+    config = request.config
+    store = BaselineStore(Path(config.getoption("--baselines")))
+    results = config.stash.setdefault(results_key, {})
+    yield store
+
+    if config.getoption("--update-baselines") and results:
+        for result in results.values():
+            store.update(result)
+        store.save()
+    output = config.getoption("--benchmark-json")
+    if output:
+        data = {name: result.to_dict() for name, result in sorted(results.items())}
+        Path(output).write_text(json.dumps({"benchmarks": data}, indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def locator_profiles(
+    request: pytest.FixtureRequest,
+) -> Generator[dict[Path, list[LocatorProfile]], None, None]:
+    """Locator measurements, keyed by the page object's source file."""
+    config = request.config
+    by_source: dict[Path, list[LocatorProfile]] = {}
+    yield by_source
+
+    profiles = [p for source in by_source.values() for p in source]
+    config.stash[locator_profiles_key] = profiles
+    output = config.getoption("--locator-report")
+    if output:
+        data = [p.to_dict() for p in profiles]
+        Path(output).write_text(json.dumps({"locators": data}, indent=2) + "\n")
+    if config.getoption("--apply-locator-fixes"):
+        for source, source_profiles in by_source.items():
+            for profile in source_profiles:
+                saving = profile.saving
+                if saving and saving > 1 and apply_candidate(source, profile):
+                    print(f"[locators] {profile.page}.{profile.name} now uses CSS")
+
+
+class Benchmark:
+    """
+    Times a callable, records the result for the session and fails the
+    test when it regresses past the stored baseline's threshold.
+    """
+
+    def __init__(self, store: BaselineStore, config: pytest.Config) -> None:
+        self.store = store
+        self.results = config.stash[results_key]
+        self.updating = config.getoption("--update-baselines")
+
+    def __call__(
+        self,
+        name: str,
+        func: Callable[[], object],
+        rounds: int = 5,
+        warmup: int = 1,
+        setup: Optional[Callable[[], None]] = None,
+        teardown: Optional[Callable[[object], None]] = None,
+    ) -> BenchmarkResult:
+        return self.record(name, measure(func, rounds, warmup, setup, teardown))
+
+    def record(self, name: str, samples: list[float]) -> BenchmarkResult:
+        """Record samples timed elsewhere, e.g. inside an async event loop."""
+        result = BenchmarkResult(name, samples)
+        self.results[name] = result
+        print(
+            f"[benchmark] {name}: median={result.median * 1000:.2f}ms "
+            f"min={result.minimum * 1000:.2f}ms rounds={len(result.samples)}"
+        )
+        failure = None if self.updating else self.store.check(result)
+        if failure:
+            pytest.fail(failure)
+        return result
+
+
+@pytest.fixture
+def benchmark(
+    baseline_store: BaselineStore, request: pytest.FixtureRequest
+) -> Benchmark:
+    return Benchmark(baseline_store, request.config)
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    profiles = config.stash.get(locator_profiles_key, [])
+    if profiles:
+        terminalreporter.section("locators")
+        for line in report_lines(profiles):
+            terminalreporter.write_line(line)
+
+    results = config.stash.get(results_key, {})
+    if not results:
+        return
+    store = BaselineStore(Path(config.getoption("--baselines")))
+    terminalreporter.section("benchmarks")
+    for name, result in sorted(results.items()):
+        baseline = store.benchmarks.get(name)
+        compared = (
+            f"{result.median / baseline['median_seconds']:.2f}x baseline"
+            if baseline
+            else "no baseline"
+        )
+        terminalreporter.write_line(
+            f"{result.median * 1000:10.2f}ms  {name:<48} {compared}"
+        )
@@ -0,0 +1,45 @@
+import time
+import trio
+from typing import Any
+from selenium.webdriver.remote.webdriver import WebDriver
+from main_pom_project.pages.async_form_validation_page import (
+    AsyncFormValidationPage,
+)
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+ROUNDS = 10
+
+
+def test_error_messages_sync_vs_async(driver: WebDriver, benchmark: Any) -> None:
+    """
+    Read all four error messages after a blank submission: one sync wait
+    and read per field, against one concurrent gather over CDP.
+    """
+    page = FormValidationPage(driver)
+    page.open()
+    page.clear_name_field()
+    page.click_register_button()
+
+    sync = benchmark(
+        "form_errors[sync]",
+        lambda: [
+            page.get_name_error_msg(),
+            page.get_phone_error_msg(),
+            page.get_date_error_msg(),
+            page.get_payment_error_msg(),
+        ],
+        rounds=ROUNDS,
+    )
+
+    async def time_async_reads() -> list[float]:
+        samples = []
+        async with AsyncFormValidationPage.connect(driver) as async_page:
+            await async_page.get_error_messages()  # Warm-up
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                await async_page.get_error_messages()
+                samples.append(time.perf_counter() - start)
+        return samples
+
+    concurrent = benchmark.record("form_errors[async]", trio.run(time_async_reads))
+    print(f"[async-reads] speedup={sync.median / concurrent.median:.1f}x")
@@ -0,0 +1,30 @@
+import pytest
+from typing import Callable
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.baselines import BenchmarkResult
+from framework.site_urls import site_url
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+# One representative call per kind of round trip the page objects make
+COMMANDS: dict[str, Callable[[WebDriver], object]] = {
+    "getTitle": lambda driver: driver.title,
+    "findElement": lambda driver: driver.find_element(By.ID, "validationCustom01"),
+    "getElementText": lambda driver: driver.find_element(By.TAG_NAME, "h1").text,
+    "executeScript": lambda driver: driver.execute_script("return 1"),
+}
+
+
+@pytest.mark.parametrize("command", COMMANDS)
+def test_command_roundtrip(
+    driver: WebDriver,
+    benchmark: Callable[..., BenchmarkResult],
+    command: str,
+) -> None:
+    """
+    Per-command cost of the driver -> chromedriver -> browser round trip,
+    the floor under every wait, lookup and assertion.
+    """
+    driver.get(site_url(FormValidationPage.URL))
+    run = COMMANDS[command]
+    benchmark(f"command[{command}]", lambda: run(driver), rounds=50, warmup=5)
@@ -0,0 +1,62 @@
+import dataclasses
+import pytest
+from typing import Callable, Generator, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.baselines import BenchmarkResult
+from framework.driver_factory import (
+    ConnectionConfig,
+    DriverConfig,
+    command_overhead,
+    create_chrome_driver,
+)
+
+COMMANDS_PER_ROUND = 100
+
+CONNECTIONS: dict[str, Optional[ConnectionConfig]] = {
+    # Selenium's own connection: keep-alive to "localhost", one pooled socket
+    "selenium_default": None,
+    "no_keep_alive": ConnectionConfig(host="localhost", keep_alive=False),
+    "tuned": ConnectionConfig(),
+}
+
+
+@pytest.fixture(scope="module", params=CONNECTIONS)
+def connection_driver(
+    request: pytest.FixtureRequest,
+    chromedriver_path: str,
+    driver_config: DriverConfig,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[WebDriver, None, None]:
+    config = dataclasses.replace(driver_config, connection=CONNECTIONS[request.param])
+    driver = create_chrome_driver(
+        tmp_path_factory.mktemp("downloads"), chromedriver_path, config
+    )
+    driver.get("about:blank")
+    yield driver
+    driver.quit()
+
+
+def test_command_throughput(
+    connection_driver: WebDriver,
+    benchmark: Callable[..., BenchmarkResult],
+    request: pytest.FixtureRequest,
+) -> None:
+    """
+    Sequential getTitle commands, the shape of the per-element page object
+    calls, under each client connection setup. Also reports the transport's
+    share: a GET /status round trip that never reaches the browser.
+    """
+    connection = request.node.callspec.params["connection_driver"]
+    driver = connection_driver
+
+    def run() -> None:
+        for _ in range(COMMANDS_PER_ROUND):
+            driver.title
+
+    result = benchmark(f"commands[{connection}]", run, rounds=5)
+    overhead = command_overhead(driver)
+    print(
+        f"[throughput] {connection}: "
+        f"{COMMANDS_PER_ROUND / result.median:.0f} commands/s, "
+        f"transport {overhead * 1000:.3f}ms per command"
+    )
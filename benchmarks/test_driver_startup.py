@@ -0,0 +1,54 @@
+import pytest
+import shutil
+from pathlib import Path
+from typing import Callable, Optional
+from framework.baselines import BenchmarkResult
+from framework.driver_factory import CHROME_PREFS, DriverConfig, create_chrome_driver
+from framework.profile_template import ProfileTemplate
+
+
+@pytest.fixture(scope="module")
+def startup_template(
+    chromedriver_path: str,
+    driver_config: DriverConfig,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ProfileTemplate:
+    root = tmp_path_factory.mktemp("startup-template")
+    return ProfileTemplate(root).build(
+        CHROME_PREFS,
+        lambda user_data_dir: create_chrome_driver(
+            root, chromedriver_path, driver_config, user_data_dir
+        ),
+    )
+
+
+@pytest.mark.parametrize("profile", ["fresh_profile", "template_profile"])
+def test_driver_startup(
+    benchmark: Callable[..., BenchmarkResult],
+    request: pytest.FixtureRequest,
+    chromedriver_path: str,
+    driver_config: DriverConfig,
+    tmp_path: Path,
+    profile: str,
+) -> None:
+    """
+    Launch a Chrome session, the fixed cost every non-pooled test pays,
+    either into a new profile or into a clone of the pre-warmed template.
+    Cloning is part of the timing; quitting the browser is not.
+    """
+    template: Optional[ProfileTemplate] = None
+    if profile == "template_profile":
+        template = request.getfixturevalue("startup_template")
+
+    def launch():
+        user_data_dir = template.clone() if template is not None else None
+        return create_chrome_driver(
+            tmp_path, chromedriver_path, driver_config, user_data_dir
+        )
+
+    def quit(driver) -> None:
+        driver.quit()
+        if driver.user_data_dir is not None:
+            shutil.rmtree(driver.user_data_dir, ignore_errors=True)
+
+    benchmark(f"driver_startup[{profile}]", launch, rounds=3, teardown=quit)
@@ -0,0 +1,46 @@
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.instrumentation import StepRecorder, attach_recorder
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+
+def _count_finds(driver: WebDriver, action: Callable[[], object]) -> int:
+    recorder = StepRecorder("count")
+    attach_recorder(driver, recorder)
+    try:
+        action()
+    finally:
+        attach_recorder(driver, None)
+    return sum(1 for s in recorder.steps if s.name == "findElement")
+
+
+def test_form_refill_finds_saved(
+    driver: WebDriver, record_property: Callable[[str, object], None]
+) -> None:
+    """
+    The keyboard path of test_field_validation_feedback: clear the name,
+    submit, then fill every field. Each page instance starts with an empty
+    cache, so only repeat lookups within the flow can hit.
+    """
+
+    def flow(use_element_cache: bool) -> Callable[[], None]:
+        page = FormValidationPage(driver)
+        page.use_element_cache = use_element_cache
+        page.open()
+
+        def run() -> None:
+            page.clear_name_field()
+            page.click_register_button()
+            page.fill_form("Brian QA", "345-6789190", "07-16-2025", "card")
+            page.get_title_element()
+
+        return run
+
+    uncached = _count_finds(driver, flow(False))
+    cached = _count_finds(driver, flow(True))
+    print(
+        f"[element_cache] form_refill: uncached={uncached} cached={cached} "
+        f"saved={uncached - cached} findElement commands"
+    )
+    record_property("form_refill_finds_saved", uncached - cached)
+    assert cached < uncached
@@ -0,0 +1,40 @@
+import inspect
+import pytest
+from pathlib import Path
+from selenium.webdriver.remote.webdriver import WebDriver
+from basic_pom_demo.pages.landing_page import LandingPage
+from framework.locator_profiler import LocatorProfile, page_locators, profile_locators
+from main_pom_project.pages.dynamic_table_page import DynamicTablePage
+from main_pom_project.pages.file_download_page import FileDownloadPage
+from main_pom_project.pages.file_upload_page import FileUploadPage
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+PAGES = [
+    FormValidationPage,
+    FileUploadPage,
+    FileDownloadPage,
+    DynamicTablePage,
+    LandingPage,
+]
+
+
+@pytest.mark.parametrize("page_class", PAGES, ids=lambda cls: cls.__name__)
+def test_locator_profile(
+    driver: WebDriver,
+    locator_profiles: dict[Path, list[LocatorProfile]],
+    page_class: type,
+) -> None:
+    """
+    Time every locator constant on its freshly opened page and try a CSS
+    equivalent for each XPath. The ranked results are printed in the
+    "locators" summary; --apply-locator-fixes adopts faster CSS.
+    """
+    page = page_class(driver)
+    page.open()
+
+    profiles = profile_locators(driver, page_class.__name__, page_locators(page_class))
+
+    locator_profiles[Path(inspect.getsourcefile(page_class))] = profiles  # type: ignore[arg-type]
+    # A candidate that matches other elements means xpath_to_css is wrong
+    wrong = [p.name for p in profiles if p.equivalent is False]
+    assert not wrong, f"CSS candidates not equivalent for {wrong}"
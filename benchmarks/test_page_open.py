@@ -0,0 +1,58 @@
+import dataclasses
+import pytest
+from pathlib import Path
+from typing import Callable, Generator
+from selenium.webdriver.remote.webdriver import WebDriver
+from basic_pom_demo.pages.landing_page import LandingPage
+from framework.baselines import BenchmarkResult
+from framework.driver_factory import DriverConfig, create_chrome_driver
+from main_pom_project.pages.dynamic_table_page import DynamicTablePage
+from main_pom_project.pages.file_download_page import FileDownloadPage
+from main_pom_project.pages.file_upload_page import FileUploadPage
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+PAGES = [
+    FormValidationPage,
+    FileUploadPage,
+    FileDownloadPage,
+    DynamicTablePage,
+    LandingPage,
+]
+
+
+@pytest.fixture(scope="module", params=["normal", "eager", "none"])
+def strategy_driver(
+    request: pytest.FixtureRequest,
+    chromedriver_path: str,
+    driver_config: DriverConfig,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[WebDriver, None, None]:
+    # One browser per page load strategy, shared by every page
+    driver = create_chrome_driver(
+        tmp_path_factory.mktemp("downloads"),
+        chromedriver_path,
+        dataclasses.replace(driver_config, page_load_strategy=request.param),
+    )
+    yield driver
+    driver.quit()
+
+
+@pytest.mark.parametrize("page_class", PAGES, ids=lambda cls: cls.__name__)
+def test_page_open(
+    strategy_driver: WebDriver,
+    benchmark: Callable[..., BenchmarkResult],
+    page_class: type,
+) -> None:
+    """
+    Time `open()`: navigation until the page object's readiness condition
+    holds, under each page load strategy. Run with --site-latency to see
+    eager/none pull ahead of normal.
+    """
+    driver = strategy_driver
+    strategy = driver.capabilities["pageLoadStrategy"]
+    page = page_class(driver)
+    benchmark(
+        f"open[{page_class.__name__},{strategy}]",
+        page.open,
+        setup=lambda: driver.get("about:blank"),
+    )
@@ -0,0 +1,46 @@
+import pytest
+import tempfile
+from pathlib import Path
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.baselines import BenchmarkResult
+from framework.driver_factory import set_download_dir
+
+# Imported as modules so pytest does not collect their tests a second time
+from main_pom_project.tests import test_dynamic_table as dynamic_table_tests
+from main_pom_project.tests import test_file_download as file_download_tests
+from main_pom_project.tests import test_file_upload as file_upload_tests
+from main_pom_project.tests import test_form_validation as form_validation_tests
+
+FLOWS: dict[str, Callable[[WebDriver], None]] = {
+    "form_submission": form_validation_tests.test_valid_form_submission_redirects,
+    "file_upload": file_upload_tests.test_valid_file_upload,
+    "file_download": file_download_tests.test_file_downloads_successfully,
+    "chrome_cpu": dynamic_table_tests.test_chrome_cpu_label_matches_table,
+}
+
+
+@pytest.mark.parametrize("flow", FLOWS)
+def test_smoke_flow(
+    driver: WebDriver,
+    benchmark: Callable[..., BenchmarkResult],
+    worker_download_root: Path,
+    flow: str,
+) -> None:
+    """
+    End-to-end time of each smoke test, assertions included, on one driver.
+    """
+
+    def fresh_download_dir() -> None:
+        # Otherwise later rounds find the first round's file already there
+        download_dir = Path(tempfile.mkdtemp(dir=worker_download_root))
+        set_download_dir(driver, download_dir)
+        driver.download_dir = download_dir  # type: ignore[attr-defined]
+
+    run = FLOWS[flow]
+    benchmark(
+        f"flow[{flow}]",
+        lambda: run(driver),
+        rounds=3,
+        setup=fresh_download_dir if flow == "file_download" else None,
+    )
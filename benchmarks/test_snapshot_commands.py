@@ -0,0 +1,93 @@
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from basic_pom_demo.pages.landing_page import LandingPage
+from framework.instrumentation import StepRecorder, attach_recorder
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+
+def _count_commands(driver: WebDriver, action: Callable[[], object]) -> int:
+    recorder = StepRecorder("count")
+    attach_recorder(driver, recorder)
+    try:
+        action()
+    finally:
+        attach_recorder(driver, None)
+    return sum(1 for s in recorder.steps if s.kind == "command")
+
+
+def _report(
+    name: str,
+    per_element: int,
+    snapshot: int,
+    record_property: Callable[[str, object], None],
+) -> None:
+    print(
+        f"[snapshot] {name}: per_element={per_element} snapshot={snapshot} "
+        f"saved={per_element - snapshot} commands"
+    )
+    record_property(f"{name}_commands_saved", per_element - snapshot)
+    assert snapshot < per_element
+
+
+def test_form_feedback_commands_saved(
+    driver: WebDriver, record_property: Callable[[str, object], None]
+) -> None:
+    """
+    Feedback checks in test_field_validation_feedback: one getter per
+    field against a single get_validation_feedback() snapshot.
+    """
+    page = FormValidationPage(driver)
+    page.open()
+    page.clear_name_field()
+    page.click_register_button()
+    page.fill_form(
+        name="Brian QA", phone="345-6789190", date="07-16-2025", payment_method="card"
+    )
+
+    def per_element() -> None:
+        page.get_name_success_msg()
+        for locator in (
+            page.NAME_ERROR_MSG,
+            page.PHONE_ERROR_MSG,
+            page.DATE_ERROR_MSG,
+            page.PAYMENT_ERROR_MSG,
+        ):
+            page._element_is_hidden(locator)
+
+    _report(
+        "form_feedback",
+        _count_commands(driver, per_element),
+        _count_commands(driver, page.get_validation_feedback),
+        record_property,
+    )
+
+
+def test_color_feedback_commands_saved(
+    driver: WebDriver, record_property: Callable[[str, object], None]
+) -> None:
+    """
+    LandingPage._assert_color_feedback against the per-element reads it
+    used to make: a wait, text or value, and style for each element.
+    """
+    page = LandingPage(driver)
+    page.open()
+
+    def per_element() -> None:
+        for locator, source in (
+            (page.BUTTON, "text"),
+            (page.READ_ONLY_INPUT, "value"),
+            (page.COLOR_TEXT_PARAGRAPH, "text"),
+        ):
+            element = page._wait_for_element(locator)
+            if source == "text":
+                element.text
+            else:
+                element.get_attribute("value")
+            element.get_attribute("style")
+
+    _report(
+        "color_feedback",
+        _count_commands(driver, per_element),
+        _count_commands(driver, lambda: page._assert_color_feedback("Green")),
+        record_property,
+    )
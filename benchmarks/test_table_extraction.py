@@ -0,0 +1,50 @@
+import pytest
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.baselines import BenchmarkResult
+from main_pom_project.pages.dynamic_table_page import DynamicTablePage
+
+ROUNDS = 3
+
+
+@pytest.mark.parametrize("row_count", [10, 100, 1000])
+def test_bulk_vs_per_element_table_extraction(
+    driver: WebDriver,
+    table_page_url: Callable[[int], str],
+    benchmark: Callable[..., BenchmarkResult],
+    row_count: int,
+) -> None:
+    """
+    Compare one execute_script call against per-row/per-cell lookups on
+    locally served tables of increasing size.
+    """
+    driver.get(table_page_url(row_count))
+    page = DynamicTablePage(driver)
+
+    def extract(bulk: bool, use_cache: bool = False) -> list[list[str]]:
+        page.use_bulk_extraction = bulk
+        return page.get_table_snapshot(use_cache=use_cache).rows
+
+    per_element = benchmark(
+        f"table[per_element,rows={row_count}]",
+        lambda: extract(bulk=False),
+        rounds=ROUNDS,
+        warmup=0,
+    )
+    bulk = benchmark(
+        f"table[bulk,rows={row_count}]", lambda: extract(bulk=True), rounds=ROUNDS
+    )
+    # Same render again: only the version check crosses the wire
+    benchmark(
+        f"table[cached,rows={row_count}]",
+        lambda: extract(bulk=True, use_cache=True),
+        rounds=ROUNDS,
+    )
+
+    page.assert_equal(
+        extract(bulk=False), extract(bulk=True), "Extraction paths disagree: "
+    )
+    print(
+        f"[table-extraction] rows={row_count} "
+        f"speedup={per_element.median / bulk.median:.1f}x"
+    )
@@ -1,43 +1,757 @@
+import os
 import pytest
+import shutil
+import tempfile
 import time
 from pathlib import Path
-from selenium import webdriver
-from typing import Generator
+from typing import Callable, Generator, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from framework.driver_factory import (
+    CHROME_PREFS,
+    HEADLESS_MODES,
+    PAGE_LOAD_STRATEGIES,
+    ConnectionConfig,
+    DriverConfig,
+    command_overhead,
+    create_chrome_driver,
+    parse_window_size,
+)
+from framework.driver_pool import DriverPool
+from framework.downloads import DownloadWatcher
+from framework.element_cache import CacheStats, pop_cache_stats
+from framework.failure_artifacts import (
+    ArtifactWriter,
+    artifact_stem,
+    html_report_extras,
+)
+from framework.driver_resolver import ChromeDriverResolver, DriverResolution
+from framework.instrumentation import (
+    InstrumentationReport,
+    StepRecorder,
+    attach_recorder,
+)
+from framework.local_server import LocalSiteServer
+from framework.network_blocking import (
+    DEFAULT_CATEGORIES,
+    NetworkBlockReport,
+    block_urls,
+    patterns_for,
+    read_network_activity,
+    unblock_urls,
+)
+from framework.profile_template import ProfileTemplate
+from framework.site_urls import set_base_url
+from framework.traffic_replay import (
+    MODES,
+    ReplayStats,
+    TrafficInterceptor,
+    TrafficLibrary,
+    attach_interceptor,
+)
+
+artifacts_key = pytest.StashKey[ArtifactWriter]()
+driver_config_key = pytest.StashKey[DriverConfig]()
+command_overhead_key = pytest.StashKey[float]()
+driver_pool_key = pytest.StashKey[DriverPool]()
+element_cache_key = pytest.StashKey[CacheStats]()
+resolution_key = pytest.StashKey[DriverResolution]()
+startup_seconds_key = pytest.StashKey[list[float]]()
+worker_summaries_key = pytest.StashKey[list[str]]()
+instrumentation_key = pytest.StashKey[InstrumentationReport]()
+network_blocking_key = pytest.StashKey[NetworkBlockReport]()
+block_categories_key = pytest.StashKey[list[str]]()
+profile_template_key = pytest.StashKey[ProfileTemplate]()
+traffic_key = pytest.StashKey[TrafficLibrary]()
+# Per test: the driver it was given, and when (epoch seconds)
+test_driver_key = pytest.StashKey[WebDriver]()
+test_started_key = pytest.StashKey[float]()
+
+# Set by pytest-xdist in worker processes ("gw0", "gw1", ...)
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("driver", "WebDriver setup")
+    group.addoption(
+        "--headless",
+        action="store_true",
+        default=False,
+        help="Run Chrome without a window (ini: headless).",
+    )
+    group.addoption(
+        "--headless-mode",
+        default=None,
+        choices=HEADLESS_MODES,
+        help="Chrome's headless implementation, default new; implies --headless.",
+    )
+    group.addoption(
+        "--window-size",
+        default=None,
+        metavar="WIDTHxHEIGHT",
+        help="Browser window size, e.g. 1920x1080 (ini: window_size).",
+    )
+    group.addoption(
+        "--disable-gpu",
+        action="store_true",
+        default=False,
+        help="Pass --disable-gpu to Chrome (ini: disable_gpu).",
+    )
+    group.addoption(
+        "--no-sandbox",
+        action="store_true",
+        default=False,
+        help="Pass --no-sandbox to Chrome, needed when it runs as root (ini: no_sandbox).",
+    )
+    group.addoption(
+        "--driver-pool",
+        action="store_true",
+        default=False,
+        help=(
+            "Reuse Chrome sessions across tests instead of launching one per test "
+            "(ini: driver_pool)."
+        ),
+    )
+    group.addoption(
+        "--driver-pool-size",
+        type=int,
+        default=None,
+        help="Idle drivers a pool keeps per worker (ini: driver_pool_size, default 1).",
+    )
+    group.addoption(
+        "--driver-max-uses",
+        type=int,
+        default=25,
+        help="Recycle a pooled driver after this many tests (default: 25).",
+    )
+    group.addoption(
+        "--chromedriver",
+        default=None,
+        help="Path to a chromedriver binary (default: $CHROMEDRIVER_PATH or lookup).",
+    )
+    group.addoption(
+        "--offline",
+        action="store_true",
+        default=False,
+        help="Never download chromedriver; use only local binaries and caches.",
+    )
+    group.addoption(
+        "--instrument",
+        action="store_true",
+        default=False,
+        help="Time every WebDriver command and wait; report the slowest steps.",
+    )
+    group.addoption(
+        "--instrument-json",
+        default="instrumentation.json",
+        help="Where --instrument writes per-test step timings.",
+    )
+    group.addoption(
+        "--artifacts-dir",
+        default="artifacts",
+        help=(
+            "Where failed tests' screenshots, page source and console logs "
+            "are written (linked from an --html report)."
+        ),
+    )
+    group.addoption(
+        "--no-artifacts",
+        action="store_true",
+        default=False,
+        help="Do not capture artifacts for failed tests.",
+    )
+    group.addoption(
+        "--profile-template",
+        action="store_true",
+        default=False,
+        help="Initialise one Chrome profile per session and give each driver a copy.",
+    )
+    group.addoption(
+        "--page-load-strategy",
+        choices=PAGE_LOAD_STRATEGIES,
+        default=None,
+        help=(
+            "When driver.get returns; page objects wait for their own readiness "
+            "(ini: page_load_strategy, default normal)."
+        ),
+    )
+    group.addoption(
+        "--block-urls",
+        default=None,
+        metavar="CATEGORIES",
+        help=(
+            "Block third-party requests by category: comma-separated ads, "
+            f"analytics, fonts, images, or 'default' ({','.join(DEFAULT_CATEGORIES)})."
+        ),
+    )
+
+    group = parser.getgroup("site", "Target site")
+    group.addoption(
+        "--local-site",
+        action="store_true",
+        default=False,
+        help="Run against the bundled offline replicas of the practice pages.",
+    )
+    group.addoption(
+        "--site-latency",
+        type=float,
+        default=0.0,
+        help="Artificial delay in ms added to every --local-site response.",
+    )
+    group.addoption(
+        "--traffic",
+        choices=MODES,
+        default=None,
+        help=(
+            "Record the sites' responses, or replay recorded ones instead of "
+            "using the network; page objects may override it (traffic_mode)."
+        ),
+    )
+    group.addoption(
+        "--traffic-dir",
+        default="recordings",
+        help="Where --traffic keeps one archive per page object.",
+    )
+
+    group = parser.getgroup("benchmarks", "Benchmark baselines")
+    group.addoption(
+        "--baselines",
+        default="benchmarks/baselines.json",
+        help="Baseline file benchmark results are compared against.",
+    )
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Store this run's results as the new baselines instead of comparing.",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Also write this run's benchmark results to the given file.",
+    )
+    group.addoption(
+        "--locator-report",
+        default=None,
+        help="Write benchmarks/test_locator_profile.py's measurements to this file.",
+    )
+    group.addoption(
+        "--apply-locator-fixes",
+        action="store_true",
+        default=False,
+        help="Replace page-object XPaths with CSS that matched the same elements faster.",
+    )
+    parser.addini("headless", default="", help="Headless mode: new, old or empty.")
+    parser.addini(
+        "window_size", default="", help="Browser window size, e.g. 1920x1080."
+    )
+    parser.addini("disable_gpu", type="bool", default=False, help="Pass --disable-gpu.")
+    parser.addini("no_sandbox", type="bool", default=False, help="Pass --no-sandbox.")
+    parser.addini("driver_pool", type="bool", default=False, help="Pool drivers.")
+    parser.addini(
+        "driver_pool_size", default="1", help="Idle drivers a pool keeps per worker."
+    )
+    parser.addini("page_load_strategy", default="normal", help="normal, eager or none.")
+    parser.addini(
+        "keep_alive",
+        type="bool",
+        default=True,
+        help="Reuse HTTP connections to chromedriver.",
+    )
+    parser.addini(
+        "connection_pool_size",
+        default="4",
+        help="Idle HTTP connections to chromedriver kept per driver.",
+    )
+    parser.addini(
+        "command_timeout",
+        default="",
+        help=(
+            "Seconds one WebDriver command may take before the client gives up "
+            "(default: no limit)."
+        ),
+    )
+    parser.addini(
+        "blocked_url_patterns",
+        type="args",
+        default=[],
+        help="Extra URL patterns blocked whenever --block-urls is active.",
+    )
+    parser.addini(
+        "xdist_group_markers",
+        type="args",
+        default=["file_download"],
+        help="Markers whose tests share one xdist worker (with --dist loadgroup).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getoption("--no-artifacts"):
+        config.stash[artifacts_key] = ArtifactWriter(
+            Path(config.getoption("--artifacts-dir"))
+        )
+    if config.getoption("--instrument"):
+        config.stash[instrumentation_key] = InstrumentationReport()
+    if config.getoption("--block-urls"):
+        option = config.getoption("--block-urls")
+        categories = [c.strip() for c in option.split(",") if c.strip()]
+        if categories == ["default"]:
+            categories = list(DEFAULT_CATEGORIES)
+        try:
+            patterns_for(categories)
+        except ValueError as exc:
+            raise pytest.UsageError(f"--block-urls: {exc} or 'default'.") from None
+        config.stash[block_categories_key] = categories
+        config.stash[network_blocking_key] = NetworkBlockReport(
+            config.getini("blocked_url_patterns")
+        )
+    if config.getoption("--traffic"):
+        if config.getoption("--local-site"):
+            raise pytest.UsageError(
+                "--traffic records and replays the live sites; drop --local-site."
+            )
+        parallel = config.getoption("numprocesses", None) or WORKER_ID != "main"
+        if config.getoption("--traffic") == "record" and parallel:
+            # Each worker would replace the archives the others recorded
+            raise pytest.UsageError("--traffic record cannot run under xdist; drop -n.")
+        config.stash[traffic_key] = TrafficLibrary(
+            Path(config.getoption("--traffic-dir"))
+        )
+    try:
+        config.stash[driver_config_key] = _driver_config(config)
+    except ValueError as exc:
+        raise pytest.UsageError(str(exc)) from None
+
+
+def _setting(config: pytest.Config, option: str, ini: str):
+    # Command-line options override ini settings
+    value = config.getoption(option)
+    return value if value not in (None, False) else config.getini(ini)
+
+
+def _driver_config(config: pytest.Config) -> DriverConfig:
+    window_size = _setting(config, "--window-size", "window_size")
+    timeout = config.getini("command_timeout")
+    headless = config.getini("headless") or None
+    if config.getoption("--headless") or config.getoption("--headless-mode"):
+        headless = config.getoption("--headless-mode") or headless or "new"
+    return DriverConfig(
+        headless=headless,
+        window_size=parse_window_size(window_size) if window_size else None,
+        page_load_strategy=_setting(
+            config, "--page-load-strategy", "page_load_strategy"
+        ),
+        disable_gpu=_setting(config, "--disable-gpu", "disable_gpu"),
+        no_sandbox=_setting(config, "--no-sandbox", "no_sandbox"),
+        network_log=network_blocking_key in config.stash,
+        connection=ConnectionConfig(
+            keep_alive=config.getini("keep_alive"),
+            pool_size=int(config.getini("connection_pool_size")),
+            timeout=float(timeout) if timeout else None,
+        ),
+    )
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    driver_config = config.stash[driver_config_key]
+    settings = [
+        f"headless={driver_config.headless or 'off'}",
+        f"page load strategy={driver_config.page_load_strategy}",
+    ]
+    if driver_config.window_size is not None:
+        settings.append("window={}x{}".format(*driver_config.window_size))
+    if _setting(config, "--driver-pool", "driver_pool"):
+        pool_size = _setting(config, "--driver-pool-size", "driver_pool_size")
+        settings.append(f"pool size={pool_size}")
+    if driver_config.disable_gpu:
+        settings.append("gpu disabled")
+    if driver_config.no_sandbox:
+        settings.append("no sandbox")
+    return "chrome: " + ", ".join(settings)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    # Pin marked tests to one worker each, e.g. so all downloads from the
+    # rate-limited download page run sequentially on a warm driver
+    for marker in config.getini("xdist_group_markers"):
+        for item in items:
+            if item.get_closest_marker(marker):
+                item.add_marker(pytest.mark.xdist_group(name=marker))
+
+    # Run smoke tests first so a broken build fails fast (sort is stable)
+    items.sort(key=lambda item: item.get_closest_marker("smoke") is None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    # Expose each phase's report on the item so fixtures can see failures
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+    # The driver is still open here: its teardown runs after the call report
+    artifacts = item.config.stash.get(artifacts_key, None)
+    driver = item.stash.get(test_driver_key, None)
+    if (
+        report.failed
+        and report.when in ("setup", "call")
+        and artifacts is not None
+        and driver is not None
+    ):
+        captured = artifacts.capture(
+            driver,
+            artifact_stem(item.nodeid, report.when),
+            since=item.stash.get(test_started_key, None),
+        )
+        htmlpath = item.config.getoption("htmlpath", None)
+        report.extras = getattr(report, "extras", []) + html_report_extras(
+            captured, Path(htmlpath).parent if htmlpath else None
+        )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_site(
+    request: pytest.FixtureRequest,
+) -> Generator[Optional[LocalSiteServer], None, None]:
+    if not request.config.getoption("--local-site"):
+        yield None
+        return
+
+    latency = request.config.getoption("--site-latency") / 1000
+    with LocalSiteServer(latency=latency) as server:
+        set_base_url(server.base_url)
+        yield server
+        set_base_url(None)
+
+
+@pytest.fixture(scope="session")
+def chromedriver_path(request: pytest.FixtureRequest) -> str:
+    # Resolved once per session instead of once per driver launch
+    resolver = ChromeDriverResolver(
+        explicit_path=request.config.getoption("--chromedriver"),
+        offline=request.config.getoption("--offline"),
+    )
+    resolution = resolver.resolve()
+    request.config.stash[resolution_key] = resolution
+    return resolution.path
+
+
+@pytest.fixture(scope="session")
+def driver_config(request: pytest.FixtureRequest) -> DriverConfig:
+    return request.config.stash[driver_config_key]
+
+
+@pytest.fixture(scope="session")
+def profile_template(
+    request: pytest.FixtureRequest,
+    chromedriver_path: str,
+    driver_config: DriverConfig,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Optional[ProfileTemplate], None, None]:
+    if not request.config.getoption("--profile-template"):
+        yield None
+        return
+
+    root = tmp_path_factory.mktemp(f"profile-{WORKER_ID}", numbered=False)
+    template = ProfileTemplate(root).build(
+        CHROME_PREFS,
+        lambda user_data_dir: create_chrome_driver(
+            root, chromedriver_path, driver_config, user_data_dir
+        ),
+    )
+    request.config.stash[profile_template_key] = template
+    yield template
+    shutil.rmtree(template.clones_root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def launch_driver(
+    request: pytest.FixtureRequest,
+    chromedriver_path: str,
+    driver_config: DriverConfig,
+    profile_template: Optional[ProfileTemplate],
+) -> Callable[[Path], WebDriver]:
+    """
+    Start a Chrome session configured from the command line; the one way
+    tests get a browser.
+    """
+
+    def launch(download_dir: Path) -> WebDriver:
+        driver = create_chrome_driver(
+            download_dir,
+            chromedriver_path,
+            driver_config,
+            user_data_dir=profile_template.clone() if profile_template else None,
+        )
+        if command_overhead_key not in request.config.stash:
+            request.config.stash[command_overhead_key] = command_overhead(driver)
+        return driver
+
+    return launch
+
+
+@pytest.fixture(scope="session")
+def driver_pool(
+    request: pytest.FixtureRequest, launch_driver: Callable[[Path], WebDriver]
+) -> Generator[Optional[DriverPool], None, None]:
+    config = request.config
+    if not _setting(config, "--driver-pool", "driver_pool"):
+        yield None
+        return
+
+    pool = DriverPool(
+        launch_driver,
+        max_uses=config.getoption("--driver-max-uses"),
+        max_idle=int(_setting(config, "--driver-pool-size", "driver_pool_size")),
+    )
+    request.config.stash[driver_pool_key] = pool
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture(scope="session")
+def worker_download_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One root per worker process so parallel downloads never share a folder
+    return tmp_path_factory.mktemp(f"downloads-{WORKER_ID}", numbered=False)
 
 
 @pytest.fixture
-def driver(tmp_path: Path) -> Generator[WebDriver, None, None]:
-    # Create a temp directory for downloads
-    download_dir = tmp_path / "downloads"
-    download_dir.mkdir()
+def driver(
+    request: pytest.FixtureRequest,
+    worker_download_root: Path,
+    launch_driver: Callable[[Path], WebDriver],
+    driver_pool: Optional[DriverPool],
+) -> Generator[WebDriver, None, None]:
+    # Create a temp directory for this test's downloads
+    download_dir = Path(tempfile.mkdtemp(dir=worker_download_root))
+    network_blocking = request.config.stash.get(network_blocking_key, None)
+
+    if driver_pool is None:
+        start = time.perf_counter()
+        driver = launch_driver(download_dir)
+        startup_seconds = request.config.stash.setdefault(startup_seconds_key, [])
+        startup_seconds.append(time.perf_counter() - start)
+    else:
+        driver = driver_pool.acquire(download_dir)
+
+    instrumentation = request.config.stash.get(instrumentation_key, None)
+    traffic = request.config.stash.get(traffic_key, None)
+    interceptor: Optional[TrafficInterceptor] = None
+    # Anything raising between acquire and quit/release (a crashed browser,
+    # a hung CDP connection) must not leak the driver or its pool slot
+    clean = False
+    try:
+        if instrumentation is not None:
+            recorder = StepRecorder(request.node.nodeid)
+            attach_recorder(driver, recorder)
+
+        blocked_patterns = _blocked_url_patterns(request)
+        if blocked_patterns:
+            block_urls(driver, blocked_patterns)
+
+        if traffic is not None:
+            interceptor = TrafficInterceptor(
+                driver, traffic, request.config.getoption("--traffic")
+            ).start()
+            attach_interceptor(driver, interceptor)
+            # Tests that navigate without a page object (procedural tests) use
+            # their module's archive; page objects switch to their own on open()
+            interceptor.use(request.node.module.__name__.rpartition(".")[2])
+
+        request.node.stash[test_driver_key] = driver
+        request.node.stash[test_started_key] = time.time()
+
+        yield driver
+
+        if interceptor is not None:
+            attach_interceptor(driver, None)
+            interceptor.stop()
+        if instrumentation is not None:
+            attach_recorder(driver, None)
+            instrumentation.add(recorder)
+        element_cache = request.config.stash.setdefault(element_cache_key, CacheStats())
+        element_cache.merge(pop_cache_stats(driver))
+        if network_blocking is not None:
+            network_blocking.add(request.node.nodeid, read_network_activity(driver))
+        if blocked_patterns:
+            # Pooled drivers must not carry one test's blocklist into the next
+            unblock_urls(driver)
+        clean = True
+    finally:
+        if test_driver_key in request.node.stash:
+            del request.node.stash[test_driver_key]
+        if not clean and interceptor is not None:
+            try:
+                interceptor.stop()
+            except Exception:
+                pass  # Reported by whatever failed first
+
+        if driver_pool is None:
+            driver.quit()
+            user_data_dir = getattr(driver, "user_data_dir", None)
+            if user_data_dir is not None:
+                # A clone of the --profile-template; pooled clones go with the pool
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+        else:
+            # A failed setup (e.g. another fixture) can leave the browser
+            # as dirty as a failed test
+            reports = [
+                getattr(request.node, f"rep_{when}", None) for when in ("setup", "call")
+            ]
+            failed = any(report is not None and report.failed for report in reports)
+            driver_pool.release(driver, failed=failed or not clean)
+
+
+def _blocked_url_patterns(request: pytest.FixtureRequest) -> list[str]:
+    # @pytest.mark.block_urls("ads", ...) overrides --block-urls for one
+    # test; @pytest.mark.block_urls() turns blocking off for it
+    marker = request.node.get_closest_marker("block_urls")
+    if marker is not None:
+        categories = list(marker.args)
+    else:
+        # Checked and expanded once, in pytest_configure
+        categories = request.config.stash.get(block_categories_key, [])
+    if not categories:
+        return []
+    return patterns_for(categories, request.config.getini("blocked_url_patterns"))
+
+
+def _driver_summary_lines(config: pytest.Config) -> list[str]:
+    resolution = config.stash.get(resolution_key, None)
+    pool = config.stash.get(driver_pool_key, None)
+    if resolution is None:
+        return []
+
+    startup_seconds = (
+        pool.stats.startup_seconds
+        if pool
+        else config.stash.get(startup_seconds_key, [])
+    )
+    total = resolution.seconds + sum(startup_seconds)
+    share = resolution.seconds / total if total else 0.0
+    lines = [
+        f"chromedriver resolved from {resolution.source} in "
+        f"{resolution.seconds:.2f}s ({share:.0%} of driver startup time)"
+    ]
+    template = config.stash.get(profile_template_key, None)
+    if template is not None:
+        lines.append(f"profile template built in {template.build_seconds:.2f}s")
+    overhead = config.stash.get(command_overhead_key, None)
+    if overhead is not None:
+        lines.append(
+            f"chromedriver round trip {overhead * 1000:.2f}ms "
+            "(GET /status, median of 20)"
+        )
+    if pool is not None:
+        lines.extend(pool.summary_lines())
+    return lines
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    instrumentation = config.stash.get(instrumentation_key, None)
+    network_blocking = config.stash.get(network_blocking_key, None)
+    traffic = config.stash.get(traffic_key, None)
+    if traffic is not None:
+        # Completes the archives being recorded
+        traffic.close()
+    artifacts = config.stash.get(artifacts_key, None)
+    if artifacts is not None:
+        # Waits for queued artifact writes
+        artifacts.close()
+    # xdist workers ship their results back to the controller process
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["driver_summary"] = [
+            f"[{WORKER_ID}] {line}" for line in _driver_summary_lines(config)
+        ]
+        if instrumentation is not None:
+            workeroutput["instrumentation"] = instrumentation.tests
+        if network_blocking is not None:
+            workeroutput["network_blocking"] = network_blocking.to_dict()
+        if element_cache_key in config.stash:
+            workeroutput["element_cache"] = config.stash[element_cache_key].to_dict()
+        if traffic is not None:
+            workeroutput["traffic"] = traffic.stats.to_dict()
+        if artifacts is not None:
+            workeroutput["failure_artifacts"] = artifacts.to_dict()
+    elif instrumentation is not None:
+        instrumentation.write_json(Path(config.getoption("--instrument-json")))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    workeroutput = getattr(node, "workeroutput", {})
+    summaries = node.config.stash.setdefault(worker_summaries_key, [])
+    summaries.extend(workeroutput.get("driver_summary", []))
+    instrumentation = node.config.stash.get(instrumentation_key, None)
+    if instrumentation is not None:
+        instrumentation.tests.update(workeroutput.get("instrumentation", {}))
+    network_blocking = node.config.stash.get(network_blocking_key, None)
+    if network_blocking is not None and "network_blocking" in workeroutput:
+        network_blocking.merge(workeroutput["network_blocking"])
+    if "element_cache" in workeroutput:
+        element_cache = node.config.stash.setdefault(element_cache_key, CacheStats())
+        element_cache.merge(CacheStats(**workeroutput["element_cache"]))
+    traffic = node.config.stash.get(traffic_key, None)
+    if traffic is not None and "traffic" in workeroutput:
+        traffic.stats.merge(ReplayStats(**workeroutput["traffic"]))
+    artifacts = node.config.stash.get(artifacts_key, None)
+    if artifacts is not None and "failure_artifacts" in workeroutput:
+        artifacts.merge(workeroutput["failure_artifacts"])
+
+
+def pytest_terminal_summary(
+    terminalreporter, exitstatus: int, config: pytest.Config
+) -> None:
+    lines = _driver_summary_lines(config) + config.stash.get(worker_summaries_key, [])
+    if lines:
+        terminalreporter.section("driver startup")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    instrumentation = config.stash.get(instrumentation_key, None)
+    if instrumentation is not None and instrumentation.tests:
+        terminalreporter.section("slowest steps")
+        for line in instrumentation.summary_lines():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            f"per-test timings written to {config.getoption('--instrument-json')}"
+        )
+        wait_lines = instrumentation.wait_lines()
+        if wait_lines:
+            terminalreporter.section("waits")
+            for line in wait_lines:
+                terminalreporter.write_line(line)
 
-    chrome_prefs: dict[str, object] = {
-        "download.default_directory": str(download_dir),
-        "download.prompt_for_download": False,
-        "directory_upgrade": True,
-        "safebrowsing.enabled": True,
-    }
+    element_cache = config.stash.get(element_cache_key, None)
+    if element_cache is not None and element_cache.hit_rate is not None:
+        terminalreporter.section("element cache")
+        terminalreporter.write_line(element_cache.summary_line())
 
-    options = Options()
-    options.add_experimental_option("prefs", chrome_prefs)
-    # options.add_argument("--headless")  # Uncomment if needed
+    artifacts = config.stash.get(artifacts_key, None)
+    if artifacts is not None and artifacts.failed_tests:
+        terminalreporter.section("failure artifacts")
+        for line in artifacts.summary_lines():
+            terminalreporter.write_line(line)
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.download_dir = download_dir  # type: ignore[attr-defined]
+    traffic = config.stash.get(traffic_key, None)
+    if traffic is not None:
+        terminalreporter.section("traffic replay")
+        for line in traffic.stats.summary_lines():
+            terminalreporter.write_line(line)
 
-    yield driver
-    driver.quit()
+    network_blocking = config.stash.get(network_blocking_key, None)
+    if network_blocking is not None and network_blocking.tests:
+        terminalreporter.section("network blocking")
+        for line in network_blocking.summary_lines():
+            terminalreporter.write_line(line)
 
 
 def wait_for_file(path: Path, timeout: float = 5.0, poll_interval: float = 0.1) -> bool:
-    start = time.time()
-    while time.time() - start < timeout:
-        if path.exists():
-            return True
-        time.sleep(poll_interval)
-    return False
+    """Return True once the download at `path` has completed (see DownloadWatcher)."""
+    with DownloadWatcher(path.parent, poll_interval=poll_interval) as watcher:
+        try:
+            watcher.wait_for(path.name, timeout)
+        except TimeoutError:
+            return False
+    return True
@@ -0,0 +1,122 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.instrumentation import record_polls
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PollSchedule:
+    """
+    Delays between polls: `initial`, multiplied by `factor` until it reaches
+    `cap`. From then on each delay is drawn from [cap * (1 - jitter), cap],
+    so waits that started together do not keep polling in lockstep.
+    """
+
+    initial: float = 0.05
+    factor: float = 2.0
+    cap: float = 0.5
+    jitter: float = 0.2
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial
+        while delay < self.cap:
+            yield delay
+            delay *= self.factor
+        while True:
+            yield self.cap * (1 - self.jitter * random.random())
+
+
+# WebDriverWait's behaviour: poll every 0.5s from the start
+FIXED_POLL = PollSchedule(initial=0.5, factor=1.0, cap=0.5, jitter=0.0)
+
+
+@dataclass
+class WaitResult:
+    polls: int
+    seconds: float
+    satisfied: bool
+
+
+class AdaptiveWait:
+    """
+    Drop-in replacement for WebDriverWait that polls on a PollSchedule
+    instead of a fixed 0.5s interval.
+
+    The condition is checked immediately, then after 50, 100, 200 and
+    400ms, then roughly every 0.5s. An element that is already there costs
+    one round trip and one that appears quickly is seen within tens of
+    milliseconds, while slow waits settle at the same request rate as
+    before.
+
+    The poll count and time-to-satisfy of the latest wait are kept in
+    `last`, and added to the surrounding `step()` when the driver is
+    instrumented.
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: float,
+        schedule: PollSchedule = PollSchedule(),
+        ignored_exceptions: Optional[Iterable[type[Exception]]] = None,
+    ) -> None:
+        self.driver = driver
+        self.timeout = timeout
+        self.schedule = schedule
+        # Like WebDriverWait, "not found yet" is never an error
+        self.ignored_exceptions = (NoSuchElementException, *(ignored_exceptions or ()))
+        self.last: Optional[WaitResult] = None
+
+    def until(self, method: Callable[[WebDriver], T], message: str = "") -> T:
+        """Poll until `method(driver)` returns something truthy, and return it."""
+
+        def check() -> tuple[bool, T]:
+            value = method(self.driver)
+            return bool(value), value
+
+        return self._poll(check, message)
+
+    def until_not(self, method: Callable[[WebDriver], T], message: str = "") -> T:
+        """Poll until `method(driver)` is falsy (or raises an ignored exception)."""
+
+        def check() -> tuple[bool, T]:
+            try:
+                value = method(self.driver)
+            except self.ignored_exceptions:
+                return True, True  # type: ignore[return-value]
+            return not value, value
+
+        return self._poll(check, message)
+
+    def _poll(self, check: Callable[[], tuple[bool, T]], message: str) -> T:
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        polls = 0
+        error: Optional[Exception] = None
+        for delay in self.schedule.delays():
+            polls += 1
+            try:
+                done, value = check()
+            except self.ignored_exceptions as exc:
+                done, error = False, exc
+            if done:
+                self._finish(polls, start, satisfied=True)
+                return value
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            # Sleep at most until the deadline, where one last poll happens
+            time.sleep(min(delay, remaining))
+        self._finish(polls, start, satisfied=False)
+        raise TimeoutException(
+            message, getattr(error, "screen", None), getattr(error, "stacktrace", None)
+        )
+
+    def _finish(self, polls: int, start: float, satisfied: bool) -> None:
+        self.last = WaitResult(polls, time.perf_counter() - start, satisfied)
+        record_polls(self.driver, polls)
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+# Resolves on the first rendered frame where the computed property differs
+# from its value when the script started. Animation events wake it up
+# immediately. If nothing is animating the element (no Web Animations, no
+# active SMIL <animate> children) it gives up early, because no change can
+# follow.
+_WAIT_FOR_STYLE_CHANGE_JS = """
+const [element, property, timeoutMs, done] = arguments;
+const read = () => getComputedStyle(element).getPropertyValue(property);
+const initial = read();
+const start = performance.now();
+const events = ["animationend", "animationiteration", "transitionend"];
+const smil = Array.from(element.querySelectorAll("animate, animateTransform, set"));
+let finished = false;
+
+const isAnimating = () => {
+  if (element.getAnimations && element.getAnimations().length > 0) {
+    return true;
+  }
+  return smil.some((animation) => {
+    try {
+      animation.getStartTime();  // Throws unless an interval is active
+      return true;
+    } catch (e) {
+      return false;
+    }
+  });
+};
+const finish = (timedOut) => {
+  if (finished) {
+    return;
+  }
+  finished = true;
+  events.forEach((name) => element.removeEventListener(name, check));
+  smil.forEach((animation) => animation.removeEventListener("endEvent", check));
+  done({
+    initial,
+    final: read(),
+    elapsed_ms: performance.now() - start,
+    timed_out: timedOut,
+  });
+};
+function check() {
+  if (read() !== initial) {
+    finish(false);
+  }
+}
+const tick = (frames) => {
+  if (finished) {
+    return;
+  }
+  check();
+  if (finished) {
+    return;
+  }
+  if (performance.now() - start > timeoutMs) {
+    finish(true);
+  } else if (frames > 2 && !isAnimating()) {
+    finish(false);
+  } else {
+    requestAnimationFrame(() => tick(frames + 1));
+  }
+};
+
+events.forEach((name) => element.addEventListener(name, check));
+smil.forEach((animation) => animation.addEventListener("endEvent", check));
+requestAnimationFrame(() => tick(0));
+"""
+
+
+@dataclass
+class StyleChange:
+    initial: str
+    final: str
+    seconds: float
+    timed_out: bool
+
+    @property
+    def changed(self) -> bool:
+        return self.initial != self.final
+
+
+def wait_for_style_change(
+    driver: WebDriver,
+    element: WebElement,
+    css_property: str = "opacity",
+    timeout: float = 5.0,
+) -> StyleChange:
+    """
+    Wait in-page until an animation visibly changes `css_property` on
+    `element` and return the before/after values.
+
+    Watches CSS animations/transitions, the Web Animations API and SVG SMIL
+    `<animate>` elements, and returns on the first frame where the computed
+    value differs. It costs a single round trip instead of a fixed sleep.
+    `timeout` must stay below the driver's script timeout (30s by default).
+    """
+    result = driver.execute_async_script(
+        _WAIT_FOR_STYLE_CHANGE_JS, element, css_property, timeout * 1000
+    )
+    return StyleChange(
+        initial=result["initial"],
+        final=result["final"],
+        seconds=result["elapsed_ms"] / 1000,
+        timed_out=result["timed_out"],
+    )
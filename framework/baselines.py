@@ -0,0 +1,107 @@
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    samples: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def minimum(self) -> float:
+        return min(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "median_seconds": self.median,
+            "min_seconds": self.minimum,
+            "rounds": len(self.samples),
+        }
+
+
+def measure(
+    func: Callable[[], T],
+    rounds: int = 5,
+    warmup: int = 1,
+    setup: Optional[Callable[[], None]] = None,
+    teardown: Optional[Callable[[T], None]] = None,
+) -> list[float]:
+    """
+    Time `rounds` calls of `func` after `warmup` untimed calls.
+
+    `setup` runs before and `teardown` after every call, outside the timing.
+    """
+    samples = []
+    for index in range(warmup + rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        value = func()
+        elapsed = time.perf_counter() - start
+        if teardown:
+            teardown(value)
+        if index >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+class BaselineStore:
+    """
+    Stored benchmark baselines with per-benchmark regression thresholds.
+
+    The JSON file looks like:
+        {
+          "default_threshold": 1.25,
+          "benchmarks": {
+            "open[FormValidationPage]": {"median_seconds": 0.31, "threshold": 1.5}
+          }
+        }
+
+    A result regresses when its median exceeds the baseline median times the
+    threshold. Benchmarks without a baseline are reported but never fail.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            data = {}
+        self.default_threshold: float = data.get("default_threshold", 1.25)
+        self.benchmarks: dict[str, dict[str, Any]] = data.get("benchmarks", {})
+
+    def check(self, result: BenchmarkResult) -> Optional[str]:
+        """Return a failure message if `result` regressed, otherwise None."""
+        baseline = self.benchmarks.get(result.name)
+        if baseline is None:
+            return None
+        threshold = baseline.get("threshold", self.default_threshold)
+        limit = baseline["median_seconds"] * threshold
+        if result.median <= limit:
+            return None
+        return (
+            f"{result.name} regressed: median {result.median:.4f}s exceeds "
+            f"baseline {baseline['median_seconds']:.4f}s x {threshold} = {limit:.4f}s"
+        )
+
+    def update(self, result: BenchmarkResult) -> None:
+        entry = self.benchmarks.setdefault(result.name, {})
+        # Keep any hand-tuned threshold; only the measurement is replaced
+        entry.update(result.to_dict())
+
+    def save(self) -> None:
+        data = {
+            "default_threshold": self.default_threshold,
+            "benchmarks": dict(sorted(self.benchmarks.items())),
+        }
+        self.path.write_text(json.dumps(data, indent=2) + "\n")
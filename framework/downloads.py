@@ -0,0 +1,148 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+# inotify event masks (see <sys/inotify.h>)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+@dataclass
+class DownloadResult:
+    path: Path
+    size_bytes: int
+    seconds: float
+
+
+class _Inotify:
+    """Tiny ctypes wrapper used only to wake up when the directory changes."""
+
+    def __init__(self, directory: Path) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, str(directory).encode(), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                os.read(self.fd, 64 * 1024)  # Drain; we only need the wakeup
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class DownloadWatcher:
+    """
+    Waits for Chrome downloads in `directory` to actually finish.
+
+    Chrome reserves the target name with an empty placeholder file and writes
+    the data to `<name>.crdownload` (or `Unconfirmed <n>.crdownload`), then
+    renames it into place. A download counts as complete once the target
+    exists and no matching `.crdownload` file remains. An empty target is
+    only accepted after `empty_grace` seconds, so a placeholder seen before
+    the partial file appears is not mistaken for a finished download.
+
+    On Linux the watcher sleeps on inotify and re-checks only when the
+    directory changes; elsewhere it falls back to polling. Create the
+    watcher before triggering the download: durations are measured from
+    its creation.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        use_inotify: Optional[bool] = None,
+        poll_interval: float = 0.05,
+        empty_grace: float = 0.5,
+    ) -> None:
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.empty_grace = empty_grace
+        self.started = time.perf_counter()
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify is None:
+            use_inotify = sys.platform.startswith("linux")
+        if use_inotify:
+            try:
+                self._inotify = _Inotify(self.directory)
+            except (OSError, AttributeError, TypeError):
+                # E.g. the watch limit was reached, or no inotify in this libc
+                # (AttributeError) or no libc to load at all (TypeError): poll
+                self._inotify = None
+
+    def wait_for(self, filename: str, timeout: float = 30.0) -> DownloadResult:
+        return self.wait_for_all([filename], timeout)[filename]
+
+    def wait_for_all(
+        self, filenames: Iterable[str], timeout: float = 30.0
+    ) -> dict[str, DownloadResult]:
+        pending = set(filenames)
+        results: dict[str, DownloadResult] = {}
+        deadline = time.perf_counter() + timeout
+        while True:
+            for name in list(pending):
+                if self._is_complete(name):
+                    path = self.directory / name
+                    results[name] = DownloadResult(
+                        path, path.stat().st_size, time.perf_counter() - self.started
+                    )
+                    pending.discard(name)
+            if not pending:
+                return results
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Downloads not completed after {timeout}s in "
+                    f"{self.directory}: {sorted(pending)}"
+                )
+            if self._inotify is not None:
+                # Re-check at least every second in case an event was missed,
+                # or sooner while an empty placeholder is still in its grace
+                # period (its expiry produces no event)
+                self._inotify.wait(min(remaining, self.empty_grace, 1.0))
+            else:
+                time.sleep(min(remaining, self.poll_interval))
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> "DownloadWatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _is_complete(self, name: str) -> bool:
+        try:
+            stat = (self.directory / name).stat()
+        except FileNotFoundError:
+            return False
+        if (self.directory / f"{name}.crdownload").exists():
+            return False
+        if stat.st_size == 0 and time.time() - stat.st_mtime < self.empty_grace:
+            return False
+        # Not yet renamed to <name>.crdownload, so it could be ours
+        return not any(self.directory.glob("Unconfirmed *.crdownload"))
@@ -0,0 +1,227 @@
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.utils import join_host_port
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from framework.profile_template import FAST_START_ARGS
+
+# Prefs shared by every session; the download directory is added per driver
+CHROME_PREFS: dict[str, object] = {
+    "download.prompt_for_download": False,
+    "directory_upgrade": True,
+    "safebrowsing.enabled": True,
+}
+
+# "old" is the pre-Chrome 112 headless implementation; Chrome 132+ ships it
+# only as the separate chrome-headless-shell binary
+HEADLESS_MODES = ("new", "old")
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+
+@dataclass(frozen=True)
+class ConnectionConfig:
+    """
+    HTTP settings for the client -> chromedriver connection every command
+    travels over.
+
+    chromedriver only listens on TCP (there is no Unix socket option), so
+    the closest thing is pinning the loopback address: "localhost" can cost
+    a failed IPv6 attempt on every new connection.
+    """
+
+    host: str = "127.0.0.1"
+    # Reuse connections; without it each command pays a TCP handshake
+    keep_alive: bool = True
+    # Idle connections kept per driver. One serves sequential commands;
+    # more avoid reconnects when threads share a driver.
+    pool_size: int = 4
+    # Seconds one command may take. None (Selenium's default) waits as long
+    # as chromedriver does, so a slow page load ends in its TimeoutException
+    # rather than a client-side ReadTimeoutError.
+    timeout: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class DriverConfig:
+    """
+    How Chrome is launched. conftest.py builds one from the command line and
+    ini settings, and every driver in the session is created from it.
+    """
+
+    headless: Optional[str] = None  # One of HEADLESS_MODES; None shows the window
+    window_size: Optional[tuple[int, int]] = None
+    # "eager" and "none" return from driver.get early; page objects then wait
+    # for their own READY_LOCATORS (see BasePage.open)
+    page_load_strategy: str = "normal"
+    disable_gpu: bool = False
+    no_sandbox: bool = False
+    # Network events in driver.get_log("performance"), used to report
+    # blocked requests (see framework.network_blocking)
+    network_log: bool = False
+    # None keeps Selenium's own connection (keep-alive via "localhost")
+    connection: Optional[ConnectionConfig] = ConnectionConfig()
+
+    def __post_init__(self) -> None:
+        if self.headless is not None and self.headless not in HEADLESS_MODES:
+            raise ValueError(
+                f"Unknown headless mode {self.headless!r}; choose from {HEADLESS_MODES}"
+            )
+        if self.page_load_strategy not in PAGE_LOAD_STRATEGIES:
+            raise ValueError(
+                f"Unknown page load strategy {self.page_load_strategy!r}; "
+                f"choose from {PAGE_LOAD_STRATEGIES}"
+            )
+
+    def arguments(self) -> list[str]:
+        """Chrome command-line switches for this configuration."""
+        arguments = []
+        if self.headless is not None:
+            arguments.append(f"--headless={self.headless}")
+        if self.window_size is not None:
+            arguments.append("--window-size={},{}".format(*self.window_size))
+        if self.disable_gpu:
+            arguments.append("--disable-gpu")
+        if self.no_sandbox:
+            # Needed when Chrome runs as root, e.g. in most CI containers
+            arguments.append("--no-sandbox")
+        return arguments
+
+
+def parse_window_size(value: str) -> tuple[int, int]:
+    """Parse "1920x1080" (or "1920,1080") into (width, height)."""
+    parts = value.lower().replace(",", "x").split("x")
+    try:
+        width, height = (int(part) for part in parts)
+    except ValueError:
+        raise ValueError(
+            f"Window size must look like 1920x1080, got {value!r}"
+        ) from None
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Window size must be positive, got {value!r}")
+    return width, height
+
+
+def build_chrome_options(
+    download_dir: Path,
+    config: DriverConfig = DriverConfig(),
+    user_data_dir: Optional[Path] = None,
+) -> Options:
+    chrome_prefs: dict[str, object] = {
+        "download.default_directory": str(download_dir),
+        **CHROME_PREFS,
+    }
+
+    options = Options()
+    options.add_experimental_option("prefs", chrome_prefs)
+    options.page_load_strategy = config.page_load_strategy
+    for argument in config.arguments():
+        options.add_argument(argument)
+    if user_data_dir is not None:
+        # A clone of the session's ProfileTemplate (see framework.profile_template)
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+        for argument in FAST_START_ARGS:
+            options.add_argument(argument)
+    # The console log goes into failure artifacts (see framework.failure_artifacts)
+    logging_prefs = {"browser": "ALL"}
+    if config.network_log:
+        logging_prefs["performance"] = "ALL"
+        options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
+    options.set_capability("goog:loggingPrefs", logging_prefs)
+    return options
+
+
+def create_chrome_driver(
+    download_dir: Path,
+    driver_path: str,
+    config: DriverConfig = DriverConfig(),
+    user_data_dir: Optional[Path] = None,
+) -> WebDriver:
+    """
+    Launch a new Chrome session that saves downloads to `download_dir`,
+    using the chromedriver binary at `driver_path` and launched as `config`
+    describes.
+
+    The directory is exposed on the driver as `driver.download_dir` so
+    tests can locate downloaded files, and `user_data_dir` (None for
+    Chrome's own throwaway profile) as `driver.user_data_dir`.
+    """
+    options = build_chrome_options(download_dir, config, user_data_dir)
+    service = Service(driver_path)
+    driver = webdriver.Chrome(service=service, options=options)
+    if config.connection is not None:
+        connect(driver, config.connection)
+    driver.download_dir = download_dir  # type: ignore[attr-defined]
+    driver.user_data_dir = user_data_dir  # type: ignore[attr-defined]
+    return driver
+
+
+def connect(driver: WebDriver, connection: ConnectionConfig) -> None:
+    """
+    Send `driver`'s commands over a connection built from `connection`.
+
+    webdriver.Chrome builds its own connection and takes no ClientConfig,
+    so the replacement is swapped in after the session has started; only
+    the newSession command uses Selenium's default.
+    """
+    address = f"http://{join_host_port(connection.host, driver.service.port)}"  # type: ignore[attr-defined]
+    client_config = ClientConfig(
+        remote_server_addr=address,
+        keep_alive=connection.keep_alive,
+        timeout=connection.timeout,  # type: ignore[arg-type]
+        # Selenium reads the urllib3 PoolManager arguments from this nested key
+        init_args_for_pool_manager={
+            "init_args_for_pool_manager": {"maxsize": connection.pool_size}
+        },
+    )
+    executor = ChromiumRemoteConnection(
+        remote_server_addr=address,
+        vendor_prefix="goog",
+        browser_name="chrome",
+        client_config=client_config,
+    )
+    previous = driver.command_executor
+    driver.command_executor = executor
+    previous.close()  # type: ignore[union-attr]
+
+
+def command_overhead(driver: WebDriver, samples: int = 20) -> float:
+    """
+    Median seconds for a chromedriver round trip that never reaches the
+    browser (GET /status): the transport cost under every command.
+    """
+    executor = driver.command_executor
+    executor.add_command("status", "GET", "/status")  # type: ignore[union-attr]
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        executor.execute("status", {})  # type: ignore[union-attr]
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def set_download_dir(driver: WebDriver, download_dir: Path) -> None:
+    """
+    Point an already running Chrome session at a new download directory.
+
+    Uses CDP `Browser.setDownloadBehavior`, which applies to the whole
+    browser and takes effect immediately, so a reused driver can hand each
+    test its own download folder.
+    """
+    driver.execute_cdp_cmd(  # type: ignore[attr-defined]
+        "Browser.setDownloadBehavior",
+        {
+            "behavior": "allow",
+            "downloadPath": str(download_dir),
+            "eventsEnabled": True,
+        },
+    )
+    driver.download_dir = download_dir  # type: ignore[attr-defined]
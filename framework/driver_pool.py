@@ -0,0 +1,150 @@
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.driver_factory import set_download_dir
+from framework.site_urls import site_origins
+
+# Runs on whatever page the previous test left open, before navigating away.
+# sessionStorage belongs to the tab, so CDP's Storage domain cannot reach it.
+# Returns the page's origin so its stored data is cleared too.
+_CLEAR_SESSION_STORAGE_JS = """
+try { window.sessionStorage.clear(); } catch (e) {}
+return window.location.origin;
+"""
+
+
+@dataclass
+class PoolStats:
+    """Counters used to report how much browser startup time pooling saved."""
+
+    launches: int = 0
+    reuses: int = 0
+    recycles: int = 0
+    startup_seconds: list[float] = field(default_factory=list)
+    reset_seconds: list[float] = field(default_factory=list)
+    reset_errors: list[str] = field(default_factory=list)
+
+    @property
+    def average_startup(self) -> float:
+        if not self.startup_seconds:
+            return 0.0
+        return sum(self.startup_seconds) / len(self.startup_seconds)
+
+    @property
+    def estimated_saving(self) -> float:
+        # Every reuse skipped one launch but paid for one reset
+        return self.reuses * self.average_startup - sum(self.reset_seconds)
+
+
+class DriverPool:
+    """
+    Session-scoped pool of Chrome drivers reused across tests.
+
+    A driver is handed out by `acquire()` and returned with `release()`,
+    which resets browser state so the next test starts clean:
+    - extra windows are closed
+    - all cookies are cleared, and so is the stored data (localStorage,
+      IndexedDB, Cache Storage, service workers) of the sites the page
+      objects open and of the page left open. Other origins the test
+      loaded, such as third-party frames, keep theirs.
+    - sessionStorage is cleared for the page left open only
+    - the remaining window is pointed at about:blank
+
+    A driver is quit and replaced (recycled) after `max_uses` tests, after
+    a test that used it failed, or when the reset itself errors out.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Path], WebDriver],
+        max_uses: int = 25,
+        max_idle: int = 1,
+    ) -> None:
+        self.factory = factory
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self.stats = PoolStats()
+        self._idle: list[WebDriver] = []
+        self._uses: dict[int, int] = {}
+
+    def acquire(self, download_dir: Path) -> WebDriver:
+        if self._idle:
+            driver = self._idle.pop()
+            set_download_dir(driver, download_dir)
+            self.stats.reuses += 1
+        else:
+            start = time.perf_counter()
+            driver = self.factory(download_dir)
+            self.stats.startup_seconds.append(time.perf_counter() - start)
+            self.stats.launches += 1
+            # Route downloads through CDP from the start so every later
+            # reassignment behaves the same way as the first one.
+            set_download_dir(driver, download_dir)
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        return driver
+
+    def release(self, driver: WebDriver, failed: bool = False) -> None:
+        worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+        if failed or worn_out or len(self._idle) >= self.max_idle:
+            self._recycle(driver)
+            return
+
+        start = time.perf_counter()
+        try:
+            self.reset(driver)
+        except Exception as exc:
+            # Reported, so a reset that always fails cannot silently turn
+            # pooling into a launch per test
+            message = str(exc).strip().partition("\n")[0]
+            self.stats.reset_errors.append(f"{type(exc).__name__}: {message}")
+            self._recycle(driver)
+            return
+        self.stats.reset_seconds.append(time.perf_counter() - start)
+        self._idle.append(driver)
+
+    @staticmethod
+    def reset(driver: WebDriver) -> None:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        origins = site_origins()
+        current = driver.execute_script(_CLEAR_SESSION_STORAGE_JS)
+        # about:blank and data: URLs have the opaque origin "null"
+        if current and current != "null" and current not in origins:
+            origins.append(current)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})  # type: ignore[attr-defined]
+        for origin in origins:
+            # Storage.clearDataForOrigin takes one real origin per call
+            driver.execute_cdp_cmd(  # type: ignore[attr-defined]
+                "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+            )
+        driver.get("about:blank")
+
+    def close_all(self) -> None:
+        while self._idle:
+            self._quit(self._idle.pop())
+
+    def summary_lines(self) -> list[str]:
+        stats = self.stats
+        return [
+            f"drivers launched: {stats.launches}, reused: {stats.reuses}, "
+            f"recycled: {stats.recycles}",
+            f"average startup: {stats.average_startup:.2f}s, "
+            f"estimated startup time saved: {stats.estimated_saving:.2f}s",
+        ] + [f"  reset failed, driver recycled: {e}" for e in stats.reset_errors]
+
+    def _recycle(self, driver: WebDriver) -> None:
+        self.stats.recycles += 1
+        self._quit(driver)
+
+    def _quit(self, driver: WebDriver) -> None:
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Browser already gone; nothing left to clean up
@@ -0,0 +1,134 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+DEFAULT_INDEX_PATH = Path.home() / ".cache" / "selenium-tests" / "chromedriver.json"
+
+_CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+_VERSION_PATTERN = re.compile(r"\d+\.\d+\.\d+\.\d+")
+
+
+@dataclass
+class DriverResolution:
+    path: str
+    chrome_version: Optional[str]
+    source: str
+    seconds: float
+
+
+def detect_chrome_version() -> Optional[str]:
+    """Return the installed Chrome version (e.g. '138.0.7204.49'), if found."""
+    if sys.platform == "win32":
+        # chrome.exe --version prints nothing on Windows; ask the registry
+        commands = [
+            ["reg", "query", r"HKCU\Software\Google\Chrome\BLBeacon", "/v", "version"]
+        ]
+    else:
+        commands = [[binary, "--version"] for binary in _CHROME_BINARIES]
+
+    for command in commands:
+        try:
+            output = subprocess.run(
+                command, capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = _VERSION_PATTERN.search(output)
+        if match:
+            return match.group(0)
+    return None
+
+
+class ChromeDriverResolver:
+    """
+    Resolves the chromedriver binary once, preferring sources that need
+    no network access.
+
+    Lookup order:
+    - an explicit path (`--chromedriver` or `CHROMEDRIVER_PATH`)
+    - the on-disk index, keyed by installed Chrome version
+    - Selenium Manager's local cache, queried with `--offline`
+    - webdriver-manager download (skipped when `offline` is set)
+
+    Whatever is found is written back to the index so the next session
+    can skip straight to it.
+    """
+
+    def __init__(
+        self,
+        index_path: Path = DEFAULT_INDEX_PATH,
+        explicit_path: Optional[str] = None,
+        offline: bool = False,
+    ) -> None:
+        self.index_path = index_path
+        self.explicit_path = explicit_path or os.environ.get("CHROMEDRIVER_PATH")
+        self.offline = offline
+
+    def resolve(self) -> DriverResolution:
+        start = time.perf_counter()
+        if self.explicit_path:
+            if not Path(self.explicit_path).is_file():
+                raise FileNotFoundError(f"chromedriver not found: {self.explicit_path}")
+            return DriverResolution(
+                self.explicit_path, None, "explicit", time.perf_counter() - start
+            )
+
+        version = detect_chrome_version()
+        index = self._load_index()
+        cached = index.get(version) if version else None
+        if cached and Path(cached).is_file():
+            return DriverResolution(
+                cached, version, "index", time.perf_counter() - start
+            )
+
+        path, source = self._resolve_uncached()
+        if version:
+            index[version] = path
+            self._save_index(index)
+        return DriverResolution(path, version, source, time.perf_counter() - start)
+
+    def _resolve_uncached(self) -> tuple[str, str]:
+        try:
+            output = SeleniumManager().binary_paths(
+                ["--browser", "chrome", "--offline"]
+            )
+            if Path(output["driver_path"]).is_file():
+                return output["driver_path"], "selenium-manager"
+        except Exception:
+            pass  # Nothing cached locally; fall through to a download
+
+        if self.offline:
+            raise RuntimeError(
+                "No chromedriver available offline. Pass --chromedriver or "
+                "set CHROMEDRIVER_PATH."
+            )
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        return ChromeDriverManager().install(), "webdriver-manager"
+
+    def _load_index(self) -> dict[str, str]:
+        try:
+            return json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict[str, str]) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so parallel sessions never read a partial file
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index, indent=2, sort_keys=True))
+        tmp_path.replace(self.index_path)
@@ -0,0 +1,149 @@
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Optional
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from framework.adaptive_wait import AdaptiveWait
+
+# Commands after which previously found elements belong to another document
+# or browsing context
+_NAVIGATION_COMMANDS = {
+    Command.GET,
+    Command.REFRESH,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.NEW_WINDOW,
+    Command.CLOSE,
+    Command.SWITCH_TO_WINDOW,
+    Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_PARENT_FRAME,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0  # Lookups answered without a find command
+    misses: int = 0
+    stale: int = 0  # Cached elements that had gone stale and were re-located
+    invalidations: int = 0  # Caches dropped after a navigation
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def merge(self, other: "CacheStats") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.stale += other.stale
+        self.invalidations += other.invalidations
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def summary_line(self) -> str:
+        if self.hit_rate is None:
+            return "element cache unused"
+        return (
+            f"element cache: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate:.0%} hit rate, {self.hits} find commands saved), "
+            f"{self.stale} stale re-locates, {self.invalidations} invalidations"
+        )
+
+
+def cache_stats(driver: WebDriver) -> CacheStats:
+    """Counters for every ElementCache used with `driver`."""
+    stats = getattr(driver, "_element_cache_stats", None)
+    if stats is None:
+        stats = driver._element_cache_stats = CacheStats()  # type: ignore[attr-defined]
+    return stats
+
+
+def pop_cache_stats(driver: WebDriver) -> CacheStats:
+    """Return `driver`'s counters and zero them (e.g. between tests)."""
+    stats = cache_stats(driver)
+    popped = replace(stats)
+    # Reset in place: live ElementCaches hold this object
+    for field in fields(stats):
+        setattr(stats, field.name, 0)
+    return popped
+
+
+def navigation_count(driver: WebDriver) -> int:
+    """Navigations and context switches `driver` has made since first asked."""
+    if not getattr(driver, "_navigation_tracked", False):
+        _track_navigation(driver)
+    return driver._navigation_count  # type: ignore[attr-defined]
+
+
+def _track_navigation(driver: WebDriver) -> None:
+    # Every command goes through driver.execute (see instrumentation)
+    original = driver.execute
+
+    def execute(driver_command: str, params: Optional[dict] = None) -> dict:
+        if driver_command in _NAVIGATION_COMMANDS:
+            driver._navigation_count += 1  # type: ignore[attr-defined]
+        return original(driver_command, params)
+
+    driver.execute = execute  # type: ignore[method-assign]
+    driver._navigation_count = 0  # type: ignore[attr-defined]
+    driver._navigation_tracked = True  # type: ignore[attr-defined]
+
+
+class ElementCache:
+    """
+    WebElements found by a page object, keyed by locator.
+
+    A cached element is reused as long as the driver has not navigated or
+    switched context since it was found; a hit costs one visibility check
+    instead of a find plus the check. An element that has gone stale anyway
+    (the page replaced it, or a click navigated) is located again once.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+        self.stats = cache_stats(driver)
+        self._elements: dict[tuple[str, str], WebElement] = {}
+        self._navigation = navigation_count(driver)
+
+    def clear(self) -> None:
+        self._elements.clear()
+
+    def wait_visible(self, locator: tuple[str, str], wait: AdaptiveWait) -> WebElement:
+        """The visible element for `locator`, from the cache when possible."""
+        self._invalidate_after_navigation()
+        cached = self._elements.get(locator)
+        if cached is not None:
+
+            def displayed(driver: WebDriver) -> WebElement | bool:
+                try:
+                    return cached if cached.is_displayed() else False
+                except NoSuchElementException as exc:
+                    # Chrome no longer knows the element's id. Not "absent
+                    # for now", which the wait would keep polling for.
+                    raise StaleElementReferenceException(exc.msg) from exc
+
+            try:
+                element = wait.until(displayed)
+                self.stats.hits += 1
+                return element
+            except StaleElementReferenceException:
+                self.stats.stale += 1
+                del self._elements[locator]
+        self.stats.misses += 1
+        element = wait.until(EC.visibility_of_element_located(locator))
+        self._elements[locator] = element
+        return element
+
+    def _invalidate_after_navigation(self) -> None:
+        current = navigation_count(self.driver)
+        if current != self._navigation:
+            if self._elements:
+                self.stats.invalidations += 1
+                self._elements.clear()
+            self._navigation = current
@@ -0,0 +1,180 @@
+import base64
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:
+    html_extras = None  # pytest-html not installed: artifacts are only written
+
+
+@dataclass
+class Artifact:
+    kind: str  # "screenshot", "page source" or "console log"
+    path: Path
+    future: Future
+
+
+def _decode_png(screenshot: str) -> bytes:
+    return base64.b64decode(screenshot)
+
+
+def _encode_text(text: str) -> bytes:
+    return text.encode("utf-8")
+
+
+def _format_console(entries: list[dict[str, Any]], since: Optional[float]) -> bytes:
+    lines = []
+    for entry in entries:
+        seconds = entry["timestamp"] / 1000
+        # A pooled driver's log also holds earlier tests' messages
+        if since is not None and seconds < since:
+            continue
+        stamp = datetime.fromtimestamp(seconds).isoformat(timespec="milliseconds")
+        lines.append(f"{stamp} {entry['level']} {entry['message']}")
+    return "\n".join(lines).encode("utf-8")
+
+
+def artifact_stem(test_id: str, when: str) -> str:
+    """A file name for `test_id`'s artifacts, e.g. tests_test_x.py_test_y-call."""
+    return re.sub(r"[^\w.-]+", "_", test_id).strip("_")[:150] + f"-{when}"
+
+
+class ArtifactWriter:
+    """
+    Failure diagnostics written off the test's critical path.
+
+    `capture()` makes the WebDriver calls that have to happen while the
+    failed test's browser is still open: screenshot, page source and
+    console log. Decoding, encoding and writing them happen on a small
+    thread pool, so the next test starts straight away. At most
+    `max_pending` writes are queued; beyond that `capture()` waits for a
+    slot, so a burst of failures cannot pile up screenshots in memory.
+    `close()` waits for everything queued.
+    """
+
+    def __init__(self, root: Path, workers: int = 2, max_pending: int = 16) -> None:
+        self.root = root
+        self.written = 0
+        self.failed_tests = 0
+        self.capture_seconds = 0.0  # Spent in the tests, grabbing
+        self.write_seconds = 0.0  # Spent on the pool, encoding and writing
+        self.errors: list[str] = []
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="artifacts")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+    def capture(
+        self, driver: WebDriver, stem: str, since: Optional[float] = None
+    ) -> list[Artifact]:
+        """
+        Grab `driver`'s state and queue it to be written under `root`.
+        `since` (epoch seconds) drops console messages logged before it.
+        """
+        grabs: list[tuple[str, str, Callable[[], Any], Callable[[Any], bytes]]] = [
+            ("screenshot", ".png", driver.get_screenshot_as_base64, _decode_png),
+            ("page source", ".html", lambda: driver.page_source, _encode_text),
+            (
+                "console log",
+                ".log",
+                lambda: driver.get_log("browser"),
+                lambda entries: _format_console(entries, since),
+            ),
+        ]
+        start = time.perf_counter()
+        artifacts = []
+        for kind, suffix, grab, encode in grabs:
+            try:
+                raw = grab()
+            except WebDriverException as exc:
+                # E.g. the browser crashed, or an alert blocks the page
+                self._error(f"{stem}: no {kind} ({exc.msg})")
+                continue
+            path = self.root / f"{stem}{suffix}"
+            artifacts.append(Artifact(kind, path, self._submit(path, encode, raw)))
+        with self._lock:
+            self.capture_seconds += time.perf_counter() - start
+            self.failed_tests += 1
+        return artifacts
+
+    def _submit(self, path: Path, encode: Callable[[Any], bytes], raw: Any) -> Future:
+        self._slots.acquire()
+        future = self._executor.submit(self._write, path, encode, raw)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _write(self, path: Path, encode: Callable[[Any], bytes], raw: Any) -> None:
+        start = time.perf_counter()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(encode(raw))
+        except (OSError, ValueError) as exc:  # ValueError: a corrupt screenshot
+            self._error(f"{path}: {exc}")
+            return
+        with self._lock:
+            self.written += 1
+            self.write_seconds += time.perf_counter() - start
+
+    def _error(self, message: str) -> None:
+        with self._lock:
+            self.errors.append(message)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """Fold in another process's `to_dict()` (xdist workers)."""
+        self.written += data["written"]
+        self.failed_tests += data["failed_tests"]
+        self.capture_seconds += data["capture_seconds"]
+        self.write_seconds += data["write_seconds"]
+        self.errors.extend(data["errors"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "written": self.written,
+            "failed_tests": self.failed_tests,
+            "capture_seconds": self.capture_seconds,
+            "write_seconds": self.write_seconds,
+            "errors": self.errors,
+        }
+
+    def summary_lines(self) -> list[str]:
+        lines = [
+            f"{self.written} artifacts for {self.failed_tests} failed tests in "
+            f"{self.root}/ ({self.capture_seconds:.2f}s capturing in tests, "
+            f"{self.write_seconds:.2f}s writing in the background)"
+        ]
+        lines.extend(f"  {error}" for error in self.errors)
+        return lines
+
+
+def html_report_extras(
+    artifacts: list[Artifact], report_dir: Optional[Path]
+) -> list[dict[str, Any]]:
+    """
+    pytest-html extras linking `artifacts`, relative to the report's folder.
+    Empty without pytest-html or an --html report.
+    """
+    if html_extras is None or report_dir is None:
+        return []
+    extras = []
+    for artifact in artifacts:
+        # Linked rather than embedded: the file may still be being written
+        link = Path(
+            os.path.relpath(artifact.path.resolve(), report_dir.resolve())
+        ).as_posix()
+        if artifact.kind == "screenshot":
+            extras.append(html_extras.image(link, name=artifact.kind))
+        else:
+            extras.append(html_extras.url(link, name=artifact.kind))
+    return extras
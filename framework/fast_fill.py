@@ -0,0 +1,76 @@
+from typing import Optional
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.instrumentation import format_locator
+from framework.js_locators import LOCATOR_JS
+
+# Sets values through the native setter (so framework-managed inputs see
+# the change), selects <option>s by visible text and fires the focus,
+# input, change and blur events typing would have produced.
+_FILL_FIELDS_JS = LOCATOR_JS + """
+const [fields] = arguments;
+const errors = [];
+const fire = (element, type) =>
+  element.dispatchEvent(new Event(type, { bubbles: true }));
+for (const [locator, value] of fields) {
+  const element = locate(locator);
+  if (!element) {
+    errors.push(`no element for ${locator[0]}=${locator[1]}`);
+    continue;
+  }
+  element.focus();
+  if (element instanceof HTMLSelectElement) {
+    const option = Array.from(element.options).find(
+      (o) => o.text.trim() === value
+    );
+    if (!option) {
+      errors.push(`no option '${value}' in ${locator[0]}=${locator[1]}`);
+      continue;
+    }
+    element.value = option.value;
+  } else {
+    const prototype = Object.getPrototypeOf(element);
+    Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, value);
+  }
+  fire(element, "input");
+  fire(element, "change");
+  element.blur();
+}
+return errors;
+"""
+
+# The value a user would see: selected option text for <select>s
+_READ_VALUES_JS = LOCATOR_JS + """
+const [locators] = arguments;
+return locators.map((locator) => {
+  const element = locate(locator);
+  if (!element) {
+    return null;
+  }
+  if (element instanceof HTMLSelectElement) {
+    const option = element.selectedOptions[0];
+    return option ? option.text.trim() : null;
+  }
+  return element.value;
+});
+"""
+
+
+def fill_fields(driver: WebDriver, fields: list[tuple[tuple[str, str], str]]) -> None:
+    """
+    Set every `(locator, value)` pair in one script call.
+
+    Raises NoSuchElementException naming every field that could not be
+    filled, after filling the rest.
+    """
+    errors = driver.execute_script(_FILL_FIELDS_JS, fields)
+    if errors:
+        raise NoSuchElementException("; ".join(errors))
+
+
+def read_values(
+    driver: WebDriver, locators: list[tuple[str, str]]
+) -> dict[str, Optional[str]]:
+    """Current values of `locators` in one call, keyed by `format_locator()`."""
+    values = driver.execute_script(_READ_VALUES_JS, locators)
+    return {format_locator(locator): value for locator, value in zip(locators, values)}
@@ -0,0 +1,210 @@
+import json
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+
+@dataclass
+class Step:
+    kind: str  # "command" for WebDriver commands, "wait" for explicit waits
+    name: str
+    locator: Optional[str]
+    seconds: float
+    outcome: str  # "ok" or the exception class name
+    polls: Optional[int] = None  # Condition checks made by the wait, if known
+
+
+@dataclass
+class StepRecorder:
+    """Steps recorded for a single test."""
+
+    test_id: str
+    steps: list[Step] = field(default_factory=list)
+    # WebElement id -> locator it was found with, to label element commands
+    element_locators: dict[str, str] = field(default_factory=dict)
+    # Polls reported by waits inside the step() being timed
+    pending_polls: Optional[int] = None
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        locator: Optional[str],
+        start: float,
+        outcome: str,
+        polls: Optional[int] = None,
+    ) -> None:
+        self.steps.append(
+            Step(kind, name, locator, time.perf_counter() - start, outcome, polls)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_seconds": sum(s.seconds for s in self.steps if s.kind == "command"),
+            "command_count": sum(1 for s in self.steps if s.kind == "command"),
+            "steps": [asdict(s) for s in self.steps],
+        }
+
+
+def format_locator(locator: tuple[str, str]) -> str:
+    return f"{locator[0]}={locator[1]}"
+
+
+def get_recorder(driver: WebDriver) -> Optional[StepRecorder]:
+    return getattr(driver, "_step_recorder", None)
+
+
+def attach_recorder(driver: WebDriver, recorder: Optional[StepRecorder]) -> None:
+    """Start (or, with None, stop) recording `driver`'s commands into `recorder`."""
+    if not getattr(driver, "_instrumented", False):
+        _wrap_execute(driver)
+    driver._step_recorder = recorder  # type: ignore[attr-defined]
+
+
+def record_polls(driver: WebDriver, polls: int) -> None:
+    """Credit `polls` condition checks to the step() currently being timed."""
+    recorder = get_recorder(driver)
+    if recorder is not None:
+        recorder.pending_polls = (recorder.pending_polls or 0) + polls
+
+
+@contextmanager
+def step(
+    driver: WebDriver,
+    name: str,
+    locator: Union[tuple[str, str], list[tuple[str, str]]],
+) -> Iterator[None]:
+    """
+    Time a wait or other multi-command step when recording is enabled.
+    `locator` may also be a list, for steps covering several elements.
+    """
+    recorder = get_recorder(driver)
+    if recorder is None:
+        yield
+        return
+    if isinstance(locator, list):
+        described = ", ".join(format_locator(item) for item in locator)
+    else:
+        described = format_locator(locator)
+    recorder.pending_polls = None
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as exc:
+        recorder.record(
+            "wait",
+            name,
+            described,
+            start,
+            type(exc).__name__,
+            recorder.pending_polls,
+        )
+        raise
+    recorder.record("wait", name, described, start, "ok", recorder.pending_polls)
+
+
+def _wrap_execute(driver: WebDriver) -> None:
+    # Every WebDriver command, including WebElement methods, goes through
+    # driver.execute, so wrapping it on the instance covers them all.
+    original = driver.execute
+
+    def execute(driver_command: str, params: Optional[dict] = None) -> dict:
+        recorder = get_recorder(driver)
+        if recorder is None:
+            return original(driver_command, params)
+
+        locator = _describe_target(recorder, params)
+        start = time.perf_counter()
+        try:
+            response = original(driver_command, params)
+        except Exception as exc:
+            recorder.record(
+                "command", driver_command, locator, start, type(exc).__name__
+            )
+            raise
+        recorder.record("command", driver_command, locator, start, "ok")
+        if locator and driver_command in ("findElement", "findElements"):
+            _remember_elements(recorder, response.get("value"), locator)
+        return response
+
+    driver.execute = execute  # type: ignore[method-assign]
+    driver._instrumented = True  # type: ignore[attr-defined]
+
+
+def _describe_target(recorder: StepRecorder, params: Optional[dict]) -> Optional[str]:
+    if not params:
+        return None
+    if "using" in params:
+        return f"{params['using']}={params['value']}"
+    element_id = params.get("id")
+    if isinstance(element_id, str):
+        return recorder.element_locators.get(element_id, f"element {element_id[:8]}")
+    return None
+
+
+def _remember_elements(recorder: StepRecorder, value: Any, locator: str) -> None:
+    elements = value if isinstance(value, list) else [value]
+    for element in elements:
+        if isinstance(element, WebElement):
+            recorder.element_locators[element.id] = locator
+
+
+class InstrumentationReport:
+    """Collects per-test recordings and renders the session-end outputs."""
+
+    def __init__(self) -> None:
+        self.tests: dict[str, dict[str, Any]] = {}
+
+    def add(self, recorder: StepRecorder) -> None:
+        self.tests[recorder.test_id] = recorder.to_dict()
+
+    def write_json(self, path: Path) -> None:
+        path.write_text(json.dumps({"tests": self.tests}, indent=2))
+
+    def slowest_steps(self, limit: int = 10) -> list[tuple[str, dict[str, Any]]]:
+        steps = [
+            (test_id, step_data)
+            for test_id, data in self.tests.items()
+            for step_data in data["steps"]
+        ]
+        steps.sort(key=lambda item: item[1]["seconds"], reverse=True)
+        return steps[:limit]
+
+    def summary_lines(self, limit: int = 10) -> list[str]:
+        lines = []
+        for test_id, s in self.slowest_steps(limit):
+            polls = f" {s['polls']} polls" if s.get("polls") is not None else ""
+            lines.append(
+                f"{s['seconds']:7.3f}s  {s['kind']:<7} {s['name']:<24} "
+                f"{s['locator'] or '-'}  [{s['outcome']}{polls}]  {test_id}"
+            )
+        return lines
+
+    def wait_lines(self, limit: int = 10) -> list[str]:
+        """Waits grouped by name and locator, most total time first, for tuning."""
+        groups: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for data in self.tests.values():
+            for s in data["steps"]:
+                if s["kind"] == "wait" and s.get("polls") is not None:
+                    groups.setdefault((s["name"], s["locator"]), []).append(s)
+        ranked = sorted(
+            groups.items(),
+            key=lambda item: sum(s["seconds"] for s in item[1]),
+            reverse=True,
+        )
+        lines = []
+        for (name, locator), waits in ranked[:limit]:
+            seconds = sorted(s["seconds"] for s in waits)
+            polls = sum(s["polls"] for s in waits) / len(waits)
+            timeouts = sum(1 for s in waits if s["outcome"] != "ok")
+            lines.append(
+                f"{len(waits):4}x  median {statistics.median(seconds):.3f}s  "
+                f"max {seconds[-1]:.3f}s  {polls:4.1f} polls  "
+                f"{timeouts} failed  {name} {locator}"
+            )
+        return lines
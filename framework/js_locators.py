@@ -0,0 +1,49 @@
+# In-page equivalents of WebDriver's locator strategies, so batched scripts
+# can take the same (By, value) tuples the page objects declare. Prepend
+# LOCATOR_JS to a script to use locate()/locateAll() in it; tuples arrive
+# as two-element arrays. isVisible() follows WebDriver's is_displayed()
+# closely enough for waits and assertions: rendered, non-empty box, not
+# hidden by visibility or opacity.
+LOCATOR_JS = """
+const locateAll = ([by, value], root = document) => {
+  switch (by) {
+    case "id":
+      return Array.from(root.querySelectorAll(`#${CSS.escape(value)}`));
+    case "name":
+      return Array.from(root.querySelectorAll(`[name="${CSS.escape(value)}"]`));
+    case "class name":
+      return Array.from(root.querySelectorAll(`.${CSS.escape(value)}`));
+    case "css selector":
+    case "tag name":
+      return Array.from(root.querySelectorAll(value));
+    case "xpath": {
+      const result = document.evaluate(
+        value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+      );
+      const nodes = [];
+      for (let i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+      }
+      return nodes;
+    }
+    case "link text":
+      return Array.from(root.querySelectorAll("a")).filter(
+        (a) => a.innerText.trim() === value
+      );
+    case "partial link text":
+      return Array.from(root.querySelectorAll("a")).filter(
+        (a) => a.innerText.includes(value)
+      );
+  }
+  throw new Error(`Unsupported locator strategy: ${by}`);
+};
+const locate = (locator, root = document) => locateAll(locator, root)[0] || null;
+const isVisible = (element) => {
+  const rect = element.getBoundingClientRect();
+  return (
+    rect.width > 0 &&
+    rect.height > 0 &&
+    element.checkVisibility({ opacityProperty: true, visibilityProperty: true })
+  );
+};
+"""
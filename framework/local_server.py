@@ -0,0 +1,143 @@
+import email.parser
+import email.policy
+import html
+import mimetypes
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from typing import Optional
+from urllib.parse import urlparse
+
+SITE_DIR = Path(__file__).parent / "local_site"
+
+# Request path -> file in SITE_DIR. Paths mirror the live sites so page
+# object URLs only need their origin swapped.
+ROUTES = {
+    "/demo_page": "demo_page.html",
+    "/form-validation": "form_validation.html",
+    "/form-confirmation": "form_confirmation.html",
+    "/upload": "upload.html",
+    "/download": "download.html",
+    "/download/some-file.txt": "some-file.txt",
+    "/dynamic-table": "dynamic_table.html",
+    "/site.css": "site.css",
+}
+DOWNLOADS = {"/download/some-file.txt"}
+
+
+class _SiteHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    latency = 0.0
+
+
+class _SiteRequestHandler(BaseHTTPRequestHandler):
+    server: _SiteHTTPServer
+
+    def do_GET(self) -> None:
+        self._delay()
+        path = urlparse(self.path).path
+        filename = ROUTES.get(path)
+        if filename is None:
+            self.send_error(404)
+            return
+        content_type = mimetypes.guess_type(filename)[0] or "text/plain"
+        self._send(
+            (SITE_DIR / filename).read_bytes(),
+            content_type,
+            attachment=path in DOWNLOADS,
+        )
+
+    def do_POST(self) -> None:
+        self._delay()
+        path = urlparse(self.path).path
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if path == "/form-confirmation":
+            self._send((SITE_DIR / "form_confirmation.html").read_bytes())
+        elif path == "/upload":
+            template = Template((SITE_DIR / "upload_success.html").read_text())
+            filename = html.escape(self._uploaded_filename(body))
+            self._send(template.substitute(filename=filename).encode())
+        else:
+            self.send_error(404)
+
+    def _uploaded_filename(self, body: bytes) -> str:
+        # Parse the multipart body with the email package (cgi is deprecated)
+        header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+        message = email.parser.BytesParser(policy=email.policy.default).parsebytes(
+            header + body
+        )
+        for part in message.iter_parts():
+            if part.get_filename():
+                return part.get_filename()
+        return ""
+
+    def _send(
+        self,
+        content: bytes,
+        content_type: str = "text/html",
+        attachment: bool = False,
+    ) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        if attachment:
+            filename = Path(urlparse(self.path).path).name
+            self.send_header(
+                "Content-Disposition", f'attachment; filename="{filename}"'
+            )
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _delay(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass  # Keep test output readable
+
+
+class LocalSiteServer:
+    """
+    Serves offline replicas of the practice pages used by the test suite:
+    - seleniumbase.io/demo_page
+    - practice.expandtesting.com form-validation, form-confirmation,
+      upload, download and dynamic-table
+
+    The server binds to an ephemeral port on 127.0.0.1 and runs in a daemon
+    thread, so starting it takes milliseconds. `latency` (seconds) delays
+    every response for performance experiments.
+    """
+
+    def __init__(self, latency: float = 0.0, port: int = 0) -> None:
+        self.latency = latency
+        self.port = port
+        self._server: Optional[_SiteHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("LocalSiteServer is not running.")
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "LocalSiteServer":
+        self._server = _SiteHTTPServer(("127.0.0.1", self.port), _SiteRequestHandler)
+        self._server.latency = self.latency
+        # A short poll interval keeps stop() as quick as start()
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalSiteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
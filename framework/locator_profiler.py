@@ -0,0 +1,279 @@
+import re
+import statistics
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.js_locators import LOCATOR_JS
+
+# The strategies locateAll() understands
+_STRATEGIES = {
+    By.ID,
+    By.NAME,
+    By.CLASS_NAME,
+    By.CSS_SELECTOR,
+    By.TAG_NAME,
+    By.XPATH,
+    By.LINK_TEXT,
+    By.PARTIAL_LINK_TEXT,
+}
+
+# Times every locator (and its CSS candidate) inside the page, so the
+# numbers are the browser's lookup cost without WebDriver round trips.
+# Each locator is run `batches` times `reps` times; the per-lookup
+# microseconds of every batch are returned, along with the match count and
+# whether the candidate matched exactly the same elements in the same order.
+_PROFILE_JS = LOCATOR_JS + """
+const [entries, batches, reps] = arguments;
+const time = (locator) => {
+  const samples = [];
+  for (let b = 0; b < batches; b++) {
+    const start = performance.now();
+    for (let r = 0; r < reps; r++) {
+      locateAll(locator);
+    }
+    samples.push(((performance.now() - start) * 1000) / reps);
+  }
+  return samples;
+};
+return entries.map(([locator, candidate]) => {
+  const found = locateAll(locator);
+  const result = { matches: found.length, samples: time(locator) };
+  if (candidate) {
+    let other = null;
+    try {
+      other = locateAll(candidate);
+    } catch (e) {
+      result.candidateError = String(e);
+    }
+    if (other) {
+      result.equivalent =
+        other.length === found.length && other.every((el, i) => el === found[i]);
+      result.candidateSamples = time(candidate);
+    }
+  }
+  return result;
+});
+"""
+
+_STEP = re.compile(
+    r"(?P<sep>//?)(?:(?P<axis>[a-z-]+)::)?(?P<tag>\*|[A-Za-z][\w-]*)"
+    r"(?P<predicates>(?:\[[^\]]*\])*)"
+)
+_ATTR_EQUALS = re.compile(r"^@(?P<attr>[\w-]+)\s*=\s*(?P<q>['\"])(?P<value>.*)(?P=q)$")
+_ATTR_CONTAINS = re.compile(
+    r"^contains\(\s*@(?P<attr>[\w-]+)\s*,\s*(?P<q>['\"])(?P<value>.*)(?P=q)\s*\)$"
+)
+_IDENT = re.compile(r"^-?[A-Za-z_][\w-]*$")
+
+
+def _predicate_to_css(
+    predicate: str, tag: str, axis: str, first: bool
+) -> Optional[str]:
+    match = _ATTR_EQUALS.match(predicate) or _ATTR_CONTAINS.match(predicate)
+    if match:
+        attr, value = match["attr"], match["value"]
+        if '"' in value or "\\" in value:
+            return None
+        if match.re is _ATTR_CONTAINS:
+            return f'[{attr}*="{value}"]'
+        if attr == "id" and _IDENT.match(value):
+            return f"#{value}"
+        return f'[{attr}="{value}"]'
+    if predicate.isdigit() and first and axis in ("child", "descendant"):
+        # Counts the siblings with the same name, like nth-of-type; under *
+        # every element sibling counts, like nth-child. After another
+        # predicate it would count only the elements that passed it.
+        if tag == "*":
+            return f":nth-child({predicate})"
+        return f":nth-of-type({predicate})"
+    return None  # text(), normalize-space(), other functions
+
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    An equivalent CSS selector for `xpath`, or None when there is none.
+
+    Handles element steps on the child, descendant, following-sibling,
+    parent, ancestor and preceding-sibling axes, with @attr='value',
+    contains(@attr, 'value') and position predicates. The reverse axes
+    become :has() on the preceding selector, so they are only translated
+    while that selector is a single compound (e.g. an anchor found by id).
+    Text predicates have no CSS equivalent.
+    """
+    position = 0
+    css = ""
+    compound_only = True  # `css` has no combinators outside :has()
+    for match in _STEP.finditer(xpath):
+        if match.start() != position:
+            return None
+        position = match.end()
+
+        axis = match["axis"] or ("child" if match["sep"] == "/" else "descendant")
+        if match["axis"] and match["sep"] == "//":
+            return None  # //axis::x means descendant-or-self first
+        compound = "" if match["tag"] == "*" else match["tag"]
+        predicates = re.findall(r"\[([^\]]*)\]", match["predicates"])
+        for index, predicate in enumerate(predicates):
+            translated = _predicate_to_css(
+                predicate.strip(), match["tag"], axis, index == 0
+            )
+            if translated is None:
+                return None
+            compound += translated
+        compound = compound or "*"
+
+        if not css:
+            if axis != "descendant":
+                return None  # Absolute /html/... paths are rare; not worth it
+            css = compound
+        elif axis in ("descendant", "child", "following-sibling"):
+            combinator = {"descendant": " ", "child": " > ", "following-sibling": " ~ "}
+            css += combinator[axis] + compound
+            compound_only = False
+        elif axis in ("parent", "ancestor", "preceding-sibling") and compound_only:
+            relation = {"parent": "> ", "ancestor": "", "preceding-sibling": "~ "}
+            css = f"{compound}:has({relation[axis]}{css})"
+        else:
+            return None
+    return css if position == len(xpath) and css else None
+
+
+@dataclass
+class LocatorProfile:
+    page: str
+    name: str
+    locator: tuple[str, str]
+    matches: int
+    micros: float  # Median in-page lookup time
+    candidate: Optional[tuple[str, str]] = None
+    candidate_micros: Optional[float] = None
+    equivalent: Optional[bool] = None
+
+    @property
+    def saving(self) -> Optional[float]:
+        """Factor the candidate is faster by, when it matches the same elements."""
+        if not self.equivalent or not self.candidate_micros:
+            return None
+        return self.micros / self.candidate_micros
+
+    def issues(self, page_median: float, slow_factor: float = 5.0) -> list[str]:
+        issues = []
+        if self.matches == 0:
+            issues.append("no match after open()")
+        # Plural names (TABLE_ROWS) are meant to match several elements
+        elif self.matches > 1 and not self.name.endswith("S"):
+            issues.append(f"ambiguous: {self.matches} matches")
+        if page_median and self.micros > slow_factor * page_median:
+            issues.append(f"slow: {self.micros / page_median:.0f}x page median")
+        if self.locator[0] == By.XPATH and self.candidate is None:
+            issues.append("no CSS equivalent")
+        return issues
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def page_locators(page_class: type) -> dict[str, tuple[str, str]]:
+    """The (By, value) constants a page object class declares or inherits."""
+    locators = {}
+    for name in dir(page_class):
+        value = getattr(page_class, name)
+        if (
+            name.isupper()
+            and isinstance(value, tuple)
+            and len(value) == 2
+            and value[0] in _STRATEGIES
+            and isinstance(value[1], str)
+        ):
+            locators[name] = value
+    return locators
+
+
+def profile_locators(
+    driver: WebDriver,
+    page: str,
+    locators: dict[str, tuple[str, str]],
+    batches: int = 5,
+    reps: int = 50,
+) -> list[LocatorProfile]:
+    """Time `locators` on the page `driver` has open, with their CSS candidates."""
+    candidates: dict[str, Optional[tuple[str, str]]] = {}
+    for name, (by, value) in locators.items():
+        css = xpath_to_css(value) if by == By.XPATH else None
+        candidates[name] = (By.CSS_SELECTOR, css) if css else None
+    entries = [
+        [list(locator), list(candidates[name]) if candidates[name] else None]
+        for name, locator in locators.items()
+    ]
+    results = driver.execute_script(_PROFILE_JS, entries, batches, reps)
+
+    profiles = []
+    for (name, locator), result in zip(locators.items(), results):
+        profile = LocatorProfile(
+            page,
+            name,
+            locator,
+            result["matches"],
+            statistics.median(result["samples"]),
+        )
+        if candidates[name] and "candidateError" not in result:
+            profile.candidate = candidates[name]
+            profile.candidate_micros = statistics.median(result["candidateSamples"])
+            profile.equivalent = result["equivalent"]
+        profiles.append(profile)
+    return profiles
+
+
+def report_lines(profiles: list[LocatorProfile], limit: int = 30) -> list[str]:
+    """Profiles ranked slowest first, with their issues and CSS proposals."""
+    medians = {
+        page: statistics.median(p.micros for p in profiles if p.page == page)
+        for page in {p.page for p in profiles}
+    }
+    lines = []
+    ranked = sorted(profiles, key=lambda p: p.micros, reverse=True)
+    for profile in ranked[:limit]:
+        issues = profile.issues(medians[profile.page])
+        lines.append(
+            f"{profile.micros:8.1f}us  {profile.page}.{profile.name}"
+            + (f"  [{'; '.join(issues)}]" if issues else "")
+        )
+        if profile.candidate is not None:
+            verdict = (
+                f"{profile.candidate_micros:.1f}us, same elements"
+                if profile.equivalent
+                else "matches different elements, not used"
+            )
+            lines.append(f"{'':12}-> {profile.candidate[1]}  ({verdict})")
+    return lines
+
+
+def apply_candidate(source: Path, profile: LocatorProfile) -> bool:
+    """
+    Rewrite `profile.name`'s XPath constant in `source` to its CSS candidate.
+    Returns False (leaving the file alone) if the constant is not a literal
+    By.XPATH tuple there.
+    """
+    assert profile.candidate is not None
+    pattern = re.compile(
+        rf"^(?P<indent>[ \t]*){profile.name} = \(\s*By\.XPATH,\s*"
+        rf"(?P<q>['\"])(?P<value>.*?)(?P=q),?\s*\)",
+        re.MULTILINE | re.DOTALL,
+    )
+    text = source.read_text()
+    match = pattern.search(text)
+    if match is None or match["value"] != profile.locator[1]:
+        return False
+    css = profile.candidate[1]
+    literal = repr(css) if '"' in css else f'"{css}"'
+    indent = match["indent"]
+    replacement = f"{indent}{profile.name} = (By.CSS_SELECTOR, {literal})"
+    if len(replacement) > 88:
+        replacement = (
+            f"{indent}{profile.name} = (\n{indent}    By.CSS_SELECTOR,\n"
+            f"{indent}    {literal},\n{indent})"
+        )
+    source.write_text(text[: match.start()] + replacement + text[match.end() :])
+    return True
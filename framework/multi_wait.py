@@ -0,0 +1,51 @@
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from framework.adaptive_wait import AdaptiveWait, PollSchedule
+from framework.instrumentation import format_locator, step
+from framework.js_locators import LOCATOR_JS
+
+# One poll for every locator: the matching element, or null while it is
+# absent (or, when visibility is required, not yet displayed).
+_FIND_ALL_JS = LOCATOR_JS + """
+const [locators, requireVisible] = arguments;
+return locators.map((locator) => {
+  const element = locate(locator);
+  return element && (!requireVisible || isVisible(element)) ? element : null;
+});
+"""
+
+
+def wait_for_all(
+    driver: WebDriver,
+    locators: list[tuple[str, str]],
+    timeout: float = 10,
+    visible: bool = True,
+    schedule: PollSchedule = PollSchedule(),
+) -> list[WebElement]:
+    """
+    Wait until every locator matches a (visible) element and return them in
+    the same order.
+
+    All locators are checked together in one script call per poll, instead
+    of one polling loop per element. On timeout the TimeoutException lists
+    the locators that were still missing.
+    """
+    missing = list(locators)
+
+    def all_found(driver: WebDriver) -> list[WebElement] | bool:
+        nonlocal missing
+        found = driver.execute_script(_FIND_ALL_JS, locators, visible)
+        missing = [locator for locator, elem in zip(locators, found) if elem is None]
+        return False if missing else found
+
+    name = "wait_all_visible" if visible else "wait_all_present"
+    with step(driver, name, locators):
+        try:
+            return AdaptiveWait(driver, timeout, schedule).until(all_found)
+        except TimeoutException:
+            state = "visible" if visible else "present"
+            raise TimeoutException(
+                f"{len(missing)} of {len(locators)} elements not {state} after "
+                f"{timeout}s: " + ", ".join(format_locator(l) for l in missing)
+            ) from None
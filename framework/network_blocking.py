@@ -0,0 +1,182 @@
+import json
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Optional, Sequence
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# URL patterns for Network.setBlockedURLs ("*" is the only wildcard).
+# "images" is opt-in: some checks look at rendered images.
+BLOCKLISTS: dict[str, tuple[str, ...]] = {
+    "ads": (
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*googleadservices.com*",
+        "*adservice.google.*",
+        "*amazon-adsystem.com*",
+        "*adnxs.com*",
+        "*criteo.*",
+        "*pubmatic.com*",
+        "*rubiconproject.com*",
+        "*taboola.com*",
+        "*outbrain.com*",
+        "*ezoic*",
+        "*media.net*",
+    ),
+    "analytics": (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+        "*connect.facebook.net*",
+        "*segment.io*",
+        "*mixpanel.com*",
+        "*stats.wp.com*",
+    ),
+    "fonts": (
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+        "*use.typekit.net*",
+        "*.woff*",
+        "*.ttf*",
+        "*.otf*",
+    ),
+    "images": (
+        "*.png*",
+        "*.jpg*",
+        "*.jpeg*",
+        "*.gif*",
+        "*.webp*",
+        "*.svg*",
+        "*.ico*",
+    ),
+}
+DEFAULT_CATEGORIES = ("ads", "analytics", "fonts")
+
+
+def patterns_for(categories: Sequence[str], extra: Sequence[str] = ()) -> list[str]:
+    unknown = [c for c in categories if c not in BLOCKLISTS]
+    if unknown:
+        raise ValueError(
+            f"Unknown block category {unknown}; choose from {sorted(BLOCKLISTS)}"
+        )
+    return [p for c in categories for p in BLOCKLISTS[c]] + list(extra)
+
+
+def block_urls(driver: WebDriver, patterns: Sequence[str]) -> None:
+    """Fail requests matching `patterns` before they leave the browser."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def unblock_urls(driver: WebDriver) -> None:
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+
+
+def category_of(url: str, extra: Sequence[str] = ()) -> str:
+    for category, patterns in BLOCKLISTS.items():
+        if any(fnmatchcase(url, p) for p in patterns):
+            return category
+    return "custom" if any(fnmatchcase(url, p) for p in extra) else "other"
+
+
+@dataclass
+class NetworkActivity:
+    """What one test's page loads requested, from the performance log."""
+
+    blocked: list[str] = field(default_factory=list)
+    # URL -> encoded (on the wire) size of every request that completed
+    loaded: dict[str, int] = field(default_factory=dict)
+
+
+def read_network_activity(driver: WebDriver) -> NetworkActivity:
+    """
+    Drain the driver's performance log (enabled by
+    `DriverConfig(network_log=True)`) into blocked and loaded
+    requests since the last call.
+    """
+    urls: dict[str, str] = {}
+    activity = NetworkActivity()
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        method = message.get("method")
+        if method == "Network.requestWillBeSent":
+            urls[params["requestId"]] = params["request"]["url"]
+        elif method == "Network.loadingFailed":
+            url = urls.get(params["requestId"])
+            if url and params.get("blockedReason") == "inspector":
+                activity.blocked.append(url)
+        elif method == "Network.loadingFinished":
+            url = urls.get(params["requestId"])
+            if url:
+                activity.loaded[url] = int(params.get("encodedDataLength", 0))
+    return activity
+
+
+class NetworkBlockReport:
+    """
+    Session totals of blocked requests.
+
+    A blocked request transfers nothing, so its size is only known if the
+    same URL was loaded unblocked earlier in the session (for example by a
+    test that opted out with `@pytest.mark.block_urls()`). Bytes saved are
+    therefore a lower bound.
+    """
+
+    def __init__(self, extra_patterns: Sequence[str] = ()) -> None:
+        self.extra_patterns = list(extra_patterns)
+        self.sizes: dict[str, int] = {}
+        self.blocked_urls: list[str] = []
+        self.tests: dict[str, dict[str, Any]] = {}
+
+    def add(self, test_id: str, activity: NetworkActivity) -> None:
+        # Only URLs a pattern could block are worth remembering sizes for
+        self.sizes.update(
+            (url, size)
+            for url, size in activity.loaded.items()
+            if category_of(url, self.extra_patterns) != "other"
+        )
+        self.blocked_urls.extend(activity.blocked)
+        self.tests[test_id] = {
+            "blocked": len(activity.blocked),
+            "loaded": len(activity.loaded),
+        }
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """Fold in another process's `to_dict()` (xdist workers)."""
+        self.sizes.update(data["sizes"])
+        self.blocked_urls.extend(data["blocked_urls"])
+        self.tests.update(data["tests"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sizes": self.sizes,
+            "blocked_urls": self.blocked_urls,
+            "tests": self.tests,
+        }
+
+    def bytes_saved(self) -> Optional[int]:
+        known = [self.sizes[u] for u in self.blocked_urls if u in self.sizes]
+        return sum(known) if known else None
+
+    def summary_lines(self) -> list[str]:
+        if not self.blocked_urls:
+            return ["no requests blocked"]
+        by_category: dict[str, int] = {}
+        for url in self.blocked_urls:
+            category = category_of(url, self.extra_patterns)
+            by_category[category] = by_category.get(category, 0) + 1
+        saved = self.bytes_saved()
+        sized = sum(1 for u in self.blocked_urls if u in self.sizes)
+        lines = [
+            f"blocked {len(self.blocked_urls)} requests in {len(self.tests)} tests: "
+            + ", ".join(f"{c} {n}" for c, n in sorted(by_category.items()))
+        ]
+        if saved is None:
+            lines.append("bytes saved unknown (no blocked URL was seen unblocked)")
+        else:
+            lines.append(
+                f"at least {saved / 1024:.1f} KiB saved "
+                f"({sized} of {len(self.blocked_urls)} blocked requests sized)"
+            )
+        return lines
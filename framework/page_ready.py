@@ -0,0 +1,75 @@
+import time
+from typing import Sequence
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.adaptive_wait import AdaptiveWait, PollSchedule
+from framework.js_locators import LOCATOR_JS
+
+# Set on the current document before navigating. A new document never has
+# it, so its absence means driver.get has replaced the old page; this
+# matters with the "none" load strategy, where driver.get returns first.
+_MARK_DOCUMENT_JS = "document.__navigateUntilReadyPending = true;"
+
+# A page is ready when the document navigated to has reached one of
+# `readyStates` and every locator is visible. Returns the locators still
+# missing, or ["document.readyState"] while the document itself is not ready.
+_PAGE_READY_JS = LOCATOR_JS + """
+const [locators, readyStates] = arguments;
+if (
+  document.__navigateUntilReadyPending ||
+  !readyStates.includes(document.readyState)
+) {
+  return ["document.readyState"];
+}
+return locators
+  .filter((locator) => {
+    const element = locate(locator);
+    return !(element && isVisible(element));
+  })
+  .map((locator) => `${locator[0]}=${locator[1]}`);
+"""
+
+# Poll quickly: the point of an early-returning strategy is to act as soon
+# as the page is usable
+READY_POLL = PollSchedule(initial=0.05, factor=1.5, cap=0.2)
+
+
+def navigate_until_ready(
+    driver: WebDriver,
+    url: str,
+    locators: Sequence[tuple[str, str]],
+    timeout: float = 10,
+    ready_states: Sequence[str] = ("interactive", "complete"),
+    schedule: PollSchedule = READY_POLL,
+) -> float:
+    """
+    Load `url` and wait until the page's own readiness condition holds,
+    returning the seconds from navigation to ready.
+
+    Under the "eager" and "none" page load strategies driver.get returns
+    early. The readiness condition then decides when the page is usable,
+    instead of the browser's load event.
+    """
+    driver.execute_script(_MARK_DOCUMENT_JS)
+    start = time.perf_counter()
+    driver.get(url)
+    missing: list[str] = []
+
+    def ready(driver: WebDriver) -> bool:
+        nonlocal missing
+        missing = driver.execute_script(
+            _PAGE_READY_JS, list(locators), list(ready_states)
+        )
+        return not missing
+
+    try:
+        # Scripts can fail while the old document unloads; that just means
+        # "not ready yet"
+        AdaptiveWait(
+            driver, timeout, schedule, ignored_exceptions=(JavascriptException,)
+        ).until(ready)
+    except TimeoutException:
+        raise TimeoutException(
+            f"{url} not ready after {timeout}s, waiting for: " + ", ".join(missing)
+        ) from None
+    return time.perf_counter() - start
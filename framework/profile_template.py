@@ -0,0 +1,113 @@
+import errno
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Chrome flags that skip first-run setup and background work a test session
+# never needs
+FAST_START_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+)
+
+# Files Chrome leaves behind that must not be copied into a clone: process
+# locks, and the last session, which would otherwise be restored as tabs
+_VOLATILE = (
+    "SingletonLock",
+    "SingletonSocket",
+    "SingletonCookie",
+    "Default/Sessions",
+    "Default/Current Session",
+    "Default/Current Tabs",
+)
+
+_FICLONE = 0x40049409  # Linux ioctl: share extents copy-on-write (btrfs, XFS)
+
+
+def nest_prefs(prefs: dict[str, Any]) -> dict[str, Any]:
+    """Turn {"download.prompt_for_download": False} into Preferences' nesting."""
+    nested: dict[str, Any] = {}
+    for dotted, value in prefs.items():
+        node = nested
+        *parents, leaf = dotted.split(".")
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return nested
+
+
+def clone_file(source: str, destination: str) -> str:
+    """copytree copy_function: reflink where the filesystem allows, else copy."""
+    try:
+        import fcntl
+
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, destination)
+        return destination
+    except ImportError:
+        pass  # Not Linux
+    except OSError as exc:
+        if exc.errno not in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL):
+            raise
+    return shutil.copy2(source, destination)
+
+
+class ProfileTemplate:
+    """
+    A Chrome user-data-dir initialised once per session and cloned per driver.
+
+    `build()` writes the session's prefs, then launches Chrome into the
+    template once so first-run initialisation happens there instead of in
+    every test's browser. `clone()` gives each driver its own copy; files
+    are reflinked where the filesystem supports it. Hardlinks are not used
+    because Chrome updates its SQLite and LevelDB files in place, which
+    would write through to the template.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / "template"
+        self.clones_root = root / "clones"
+        self.build_seconds = 0.0
+
+    def build(
+        self, prefs: dict[str, Any], launch: Callable[[Path], WebDriver]
+    ) -> "ProfileTemplate":
+        """Populate the template; `launch(user_data_dir)` starts a driver on it."""
+        start = time.perf_counter()
+        default = self.path / "Default"
+        default.mkdir(parents=True, exist_ok=True)
+        (default / "Preferences").write_text(json.dumps(nest_prefs(prefs)))
+        (self.path / "First Run").touch()
+
+        driver = launch(self.path)
+        try:
+            driver.get("about:blank")
+        finally:
+            driver.quit()
+
+        for name in _VOLATILE:
+            target = self.path / name
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)
+            elif target.exists() or target.is_symlink():
+                target.unlink()
+        self.build_seconds = time.perf_counter() - start
+        return self
+
+    def clone(self) -> Path:
+        self.clones_root.mkdir(parents=True, exist_ok=True)
+        destination = Path(tempfile.mkdtemp(dir=self.clones_root))
+        os.rmdir(destination)  # copytree creates it
+        shutil.copytree(self.path, destination, symlinks=True, copy_function=clone_file)
+        return destination
@@ -0,0 +1,34 @@
+from typing import Optional
+from urllib.parse import urlsplit
+
+# Sites the page objects' URL constants point at
+LIVE_ORIGINS = ("https://practice.expandtesting.com", "https://seleniumbase.io")
+
+_base_url: Optional[str] = None
+
+
+def set_base_url(base_url: Optional[str]) -> None:
+    """
+    Serve every live origin from `base_url` (e.g. the local stand-in server).
+    Pass None to go back to the live sites.
+    """
+    global _base_url
+    _base_url = base_url.rstrip("/") if base_url else None
+
+
+def site_url(url: str) -> str:
+    """Return `url` rebased onto the configured base URL, if any."""
+    if _base_url is None:
+        return url
+    for origin in LIVE_ORIGINS:
+        if url.startswith(origin):
+            return _base_url + url[len(origin) :]
+    return url
+
+
+def site_origins() -> list[str]:
+    """The origins page objects open: the live sites, or the base URL's."""
+    if _base_url is None:
+        return list(LIVE_ORIGINS)
+    parts = urlsplit(_base_url)
+    return [f"{parts.scheme}://{parts.netloc}"]
@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.instrumentation import step
+from framework.js_locators import LOCATOR_JS
+
+# Everything an assertion usually reads off an element, for every locator,
+# in one round trip. Text mirrors WebElement.text: rendered text, empty
+# for hidden elements.
+_SNAPSHOT_JS = LOCATOR_JS + """
+const [locators, attributes, styles] = arguments;
+return locators.map((locator) => {
+  const element = locate(locator);
+  if (!element) {
+    return null;
+  }
+  const displayed = isVisible(element);
+  const computed = getComputedStyle(element);
+  return {
+    text: displayed ? (element.innerText || element.textContent || "").trim() : "",
+    value: "value" in element ? String(element.value) : null,
+    displayed,
+    attributes: Object.fromEntries(
+      attributes.map((name) => [name, element.getAttribute(name)])
+    ),
+    styles: Object.fromEntries(
+      styles.map((name) => [name, computed.getPropertyValue(name)])
+    ),
+  };
+});
+"""
+
+
+@dataclass
+class ElementSnapshot:
+    locator: tuple[str, str]
+    found: bool
+    text: str = ""  # Stripped, as the page objects compare it
+    value: Optional[str] = None  # The live `value` property, for form fields
+    displayed: bool = False
+    attributes: dict[str, Optional[str]] = field(default_factory=dict)
+    styles: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def hidden(self) -> bool:
+        """Missing or not displayed, like BasePage._element_is_hidden."""
+        return not self.displayed
+
+
+def snapshot_elements(
+    driver: WebDriver,
+    locators: list[tuple[str, str]],
+    attributes: Sequence[str] = (),
+    styles: Sequence[str] = (),
+) -> list[ElementSnapshot]:
+    """
+    Read text, value, visibility, the named `attributes` and computed
+    `styles` of the first match of each locator in one script call.
+
+    Locators with no match come back with `found=False` rather than raising,
+    so callers decide whether absence is an error.
+    """
+    with step(driver, "snapshot", locators):
+        records = driver.execute_script(
+            _SNAPSHOT_JS, locators, list(attributes), list(styles)
+        )
+    return [
+        (
+            ElementSnapshot(locator, found=False)
+            if record is None
+            else ElementSnapshot(locator, found=True, **record)
+        )
+        for locator, record in zip(locators, records)
+    ]
@@ -0,0 +1,69 @@
+import itertools
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from framework.adaptive_wait import AdaptiveWait, FIXED_POLL, PollSchedule
+from framework.instrumentation import StepRecorder, attach_recorder, step
+
+
+class FakeDriver:
+    def execute(self, driver_command: str, params: dict | None = None) -> dict:
+        return {"value": None}
+
+
+def test_schedule_backs_off_to_a_jittered_cap() -> None:
+    delays = list(itertools.islice(PollSchedule().delays(), 50))
+
+    assert delays[:4] == pytest.approx([0.05, 0.1, 0.2, 0.4])
+    assert all(0.4 <= d <= 0.5 for d in delays[4:])
+    assert len(set(delays[4:])) > 1
+
+
+def test_fixed_poll_matches_webdriverwait() -> None:
+    assert list(itertools.islice(FIXED_POLL.delays(), 3)) == [0.5, 0.5, 0.5]
+
+
+def test_until_returns_value_and_records_polls() -> None:
+    answers = iter([None, NoSuchElementException(), "element"])
+
+    def condition(driver: object) -> object:
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    wait = AdaptiveWait(FakeDriver(), timeout=2)  # type: ignore[arg-type]
+
+    assert wait.until(condition) == "element"
+    assert wait.last is not None
+    assert (wait.last.polls, wait.last.satisfied) == (3, True)
+    # Two short backoff sleeps, not two 0.5s polls
+    assert wait.last.seconds < 0.5
+
+
+def test_timeout_polls_once_more_at_the_deadline() -> None:
+    wait = AdaptiveWait(FakeDriver(), timeout=0.12, schedule=PollSchedule(initial=0.1, factor=1, cap=0.1))  # type: ignore[arg-type]
+
+    with pytest.raises(TimeoutException, match="never"):
+        wait.until(lambda driver: False, "never")
+
+    assert wait.last is not None
+    assert (wait.last.polls, wait.last.satisfied) == (3, False)
+
+
+def test_until_not_treats_missing_element_as_done() -> None:
+    def condition(driver: object) -> bool:
+        raise NoSuchElementException()
+
+    assert AdaptiveWait(FakeDriver(), timeout=1).until_not(condition) is True  # type: ignore[arg-type]
+
+
+def test_polls_are_recorded_with_the_step() -> None:
+    driver = FakeDriver()
+    recorder = StepRecorder("test_x")
+    attach_recorder(driver, recorder)  # type: ignore[arg-type]
+    answers = iter([False, False, True])
+
+    with step(driver, "wait_visible", ("id", "name")):  # type: ignore[arg-type]
+        AdaptiveWait(driver, timeout=1).until(lambda d: next(answers))  # type: ignore[arg-type]
+
+    assert [(s.name, s.polls) for s in recorder.steps] == [("wait_visible", 3)]
@@ -0,0 +1,40 @@
+from pathlib import Path
+from framework.baselines import BaselineStore, BenchmarkResult, measure
+
+
+def test_regression_beyond_threshold_is_reported(tmp_path: Path) -> None:
+    store = BaselineStore(tmp_path / "baselines.json")
+    store.update(BenchmarkResult("open", [1.0, 1.0, 1.0]))
+
+    assert store.check(BenchmarkResult("open", [1.2])) is None
+    assert "open regressed" in (store.check(BenchmarkResult("open", [1.3])) or "")
+    assert store.check(BenchmarkResult("unknown", [99.0])) is None
+
+
+def test_update_keeps_custom_threshold(tmp_path: Path) -> None:
+    path = tmp_path / "baselines.json"
+    store = BaselineStore(path)
+    store.update(BenchmarkResult("open", [1.0]))
+    store.benchmarks["open"]["threshold"] = 2.0
+    store.save()
+
+    reloaded = BaselineStore(path)
+    reloaded.update(BenchmarkResult("open", [0.5]))
+
+    assert reloaded.benchmarks["open"]["threshold"] == 2.0
+    assert reloaded.benchmarks["open"]["median_seconds"] == 0.5
+
+
+def test_measure_skips_warmup_and_times_only_func() -> None:
+    calls: list[str] = []
+
+    samples = measure(
+        lambda: calls.append("run"),
+        rounds=2,
+        warmup=1,
+        setup=lambda: calls.append("setup"),
+        teardown=lambda _: calls.append("teardown"),
+    )
+
+    assert len(samples) == 2
+    assert calls == ["setup", "run", "teardown"] * 3
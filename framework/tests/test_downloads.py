@@ -0,0 +1,59 @@
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+from framework.downloads import DownloadWatcher
+
+
+def simulate_chrome_download(directory: Path, name: str, data: bytes) -> None:
+    # Same sequence Chrome uses: placeholder, partial file, then rename
+    (directory / name).write_bytes(b"")
+    partial = directory / f"{name}.crdownload"
+    partial.write_bytes(data[: len(data) // 2])
+    time.sleep(0.2)
+    partial.write_bytes(data)
+    partial.replace(directory / name)
+
+
+@pytest.mark.parametrize(
+    "use_inotify",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"), reason="inotify is Linux only"
+            ),
+        ),
+        False,
+    ],
+)
+def test_waits_for_rename_not_placeholder(tmp_path: Path, use_inotify: bool) -> None:
+    with DownloadWatcher(tmp_path, use_inotify=use_inotify) as watcher:
+        threading.Thread(
+            target=simulate_chrome_download, args=(tmp_path, "a.txt", b"x" * 100)
+        ).start()
+        result = watcher.wait_for("a.txt", timeout=5)
+
+    assert result.size_bytes == 100
+    assert result.seconds >= 0.2
+
+
+def test_waits_for_many_files(tmp_path: Path) -> None:
+    with DownloadWatcher(tmp_path) as watcher:
+        for name in ("a.txt", "b.txt"):
+            threading.Thread(
+                target=simulate_chrome_download, args=(tmp_path, name, b"data")
+            ).start()
+        results = watcher.wait_for_all(["a.txt", "b.txt"], timeout=5)
+
+    assert {name: r.size_bytes for name, r in results.items()} == {
+        "a.txt": 4,
+        "b.txt": 4,
+    }
+
+
+def test_timeout_names_pending_files(tmp_path: Path) -> None:
+    with DownloadWatcher(tmp_path) as watcher:
+        with pytest.raises(TimeoutError, match="missing.txt"):
+            watcher.wait_for("missing.txt", timeout=0.1)
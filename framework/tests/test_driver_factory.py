@@ -0,0 +1,114 @@
+import json
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
+from framework.driver_factory import (
+    ConnectionConfig,
+    DriverConfig,
+    build_chrome_options,
+    command_overhead,
+    connect,
+    parse_window_size,
+)
+
+
+class FakeChromedriver(BaseHTTPRequestHandler):
+    """Answers /status and records which client connection each request used."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like chromedriver
+    connections: list[tuple[str, int]] = []
+
+    def do_GET(self) -> None:
+        self.connections.append(self.client_address)
+        body = json.dumps({"value": {"ready": True}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def chromedriver_port() -> Iterator[int]:
+    FakeChromedriver.connections = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeChromedriver)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_default_config_adds_no_switches(tmp_path: Path) -> None:
+    options = build_chrome_options(tmp_path)
+
+    assert options.arguments == []
+    assert options.page_load_strategy == "normal"
+
+
+def test_config_switches_reach_chrome_options(tmp_path: Path) -> None:
+    config = DriverConfig(
+        headless="new",
+        window_size=(1280, 720),
+        page_load_strategy="eager",
+        disable_gpu=True,
+        no_sandbox=True,
+    )
+
+    options = build_chrome_options(tmp_path, config)
+
+    assert options.arguments == [
+        "--headless=new",
+        "--window-size=1280,720",
+        "--disable-gpu",
+        "--no-sandbox",
+    ]
+    assert options.page_load_strategy == "eager"
+
+
+def test_unknown_modes_are_rejected() -> None:
+    with pytest.raises(ValueError, match="headless mode 'legacy'"):
+        DriverConfig(headless="legacy")
+    with pytest.raises(ValueError, match="page load strategy 'fast'"):
+        DriverConfig(page_load_strategy="fast")
+
+
+@pytest.mark.parametrize("value", ["1920x1080", "1920X1080", "1920,1080"])
+def test_parse_window_size(value: str) -> None:
+    assert parse_window_size(value) == (1920, 1080)
+
+
+@pytest.mark.parametrize("value", ["1920", "wide x tall", "0x600"])
+def test_parse_window_size_rejects_bad_values(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_window_size(value)
+
+
+@pytest.mark.parametrize("keep_alive, connections", [(True, 1), (False, 5)])
+def test_connect_controls_connection_reuse(
+    chromedriver_port: int, keep_alive: bool, connections: int
+) -> None:
+    previous = SimpleNamespace(closed=False)
+    previous.close = lambda: setattr(previous, "closed", True)
+    driver = SimpleNamespace(
+        service=SimpleNamespace(port=chromedriver_port), command_executor=previous
+    )
+
+    connect(driver, ConnectionConfig(keep_alive=keep_alive, timeout=5))  # type: ignore[arg-type]
+    overhead = command_overhead(driver, samples=5)  # type: ignore[arg-type]
+
+    assert previous.closed
+    assert 0 < overhead < 1
+    assert len(FakeChromedriver.connections) == 5
+    assert len(set(FakeChromedriver.connections)) == connections
+
+
+def test_default_config_tunes_the_connection() -> None:
+    assert DriverConfig().connection == ConnectionConfig()
+    assert ConnectionConfig().host == "127.0.0.1"
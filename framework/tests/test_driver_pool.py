@@ -0,0 +1,127 @@
+from pathlib import Path
+from typing import Optional
+from selenium.common.exceptions import InvalidArgumentException
+from framework.driver_pool import DriverPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self.driver = driver
+
+    def window(self, handle: str) -> None:
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Minimal stand-in recording the calls the pool makes on a WebDriver."""
+
+    def __init__(self) -> None:
+        self.window_handles = ["main"]
+        self.current = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.cdp_calls: list[tuple[str, dict]] = []
+        self.urls: list[str] = []
+        self.quit_called = False
+        self.origin = "https://practice.expandtesting.com"
+        self.cdp_error: Optional[Exception] = None
+
+    def close(self) -> None:
+        self.window_handles.remove(self.current)
+
+    def execute_script(self, script: str) -> str:
+        return self.origin
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> None:
+        if self.cdp_error is not None:
+            raise self.cdp_error
+        self.cdp_calls.append((cmd, params))
+
+    def get(self, url: str) -> None:
+        self.urls.append(url)
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def make_pool(max_uses: int = 25) -> tuple[DriverPool, list[FakeDriver]]:
+    created: list[FakeDriver] = []
+
+    def factory(download_dir: Path) -> FakeDriver:
+        created.append(FakeDriver())
+        return created[-1]
+
+    return DriverPool(factory, max_uses=max_uses), created  # type: ignore[arg-type]
+
+
+def test_driver_is_reused_and_reset(tmp_path: Path) -> None:
+    pool, created = make_pool()
+
+    first = pool.acquire(tmp_path / "a")
+    first.window_handles.append("popup")  # type: ignore[attr-defined]
+    pool.release(first)
+    second = pool.acquire(tmp_path / "b")
+
+    assert second is first
+    assert len(created) == 1
+    assert first.window_handles == ["main"]  # type: ignore[attr-defined]
+    assert first.urls[-1] == "about:blank"  # type: ignore[attr-defined]
+    cleared = [
+        params["origin"]
+        for cmd, params in first.cdp_calls  # type: ignore[attr-defined]
+        if cmd == "Storage.clearDataForOrigin"
+    ]
+    assert cleared == ["https://practice.expandtesting.com", "https://seleniumbase.io"]
+    assert second.download_dir == tmp_path / "b"  # type: ignore[attr-defined]
+    assert pool.stats.reuses == 1
+
+
+def test_reset_clears_the_page_left_open(tmp_path: Path) -> None:
+    pool, _ = make_pool()
+    driver = pool.acquire(tmp_path)
+    driver.origin = "http://127.0.0.1:8000"  # type: ignore[attr-defined]
+
+    pool.release(driver)
+
+    assert pool._idle == [driver]
+    assert (
+        "Storage.clearDataForOrigin",
+        {"origin": "http://127.0.0.1:8000", "storageTypes": "all"},
+    ) in driver.cdp_calls  # type: ignore[attr-defined]
+
+
+def test_driver_is_recycled_and_reported_when_reset_fails(tmp_path: Path) -> None:
+    pool, created = make_pool()
+    driver = pool.acquire(tmp_path)
+    driver.cdp_error = InvalidArgumentException("Invalid params")  # type: ignore[attr-defined]
+
+    pool.release(driver)
+
+    assert pool._idle == []
+    assert created[0].quit_called
+    assert pool.stats.recycles == 1
+    assert pool.stats.reset_errors == [
+        "InvalidArgumentException: Message: Invalid params"
+    ]
+    assert "reset failed" in pool.summary_lines()[-1]
+
+
+def test_driver_is_recycled_after_failure(tmp_path: Path) -> None:
+    pool, created = make_pool()
+
+    first = pool.acquire(tmp_path)
+    pool.release(first, failed=True)
+    second = pool.acquire(tmp_path)
+
+    assert second is not first
+    assert created[0].quit_called
+    assert pool.stats.recycles == 1
+
+
+def test_driver_is_recycled_after_max_uses(tmp_path: Path) -> None:
+    pool, created = make_pool(max_uses=2)
+
+    for _ in range(3):
+        pool.release(pool.acquire(tmp_path))
+
+    assert len(created) == 2
+    assert pool.stats.launches == 2
@@ -0,0 +1,37 @@
+import json
+import pytest
+from pathlib import Path
+from framework import driver_resolver
+from framework.driver_resolver import ChromeDriverResolver
+
+
+@pytest.fixture
+def fake_binary(tmp_path: Path) -> Path:
+    binary = tmp_path / "chromedriver"
+    binary.write_text("")
+    return binary
+
+
+def test_explicit_path_skips_lookup(tmp_path: Path, fake_binary: Path) -> None:
+    resolver = ChromeDriverResolver(
+        index_path=tmp_path / "index.json", explicit_path=str(fake_binary)
+    )
+    resolution = resolver.resolve()
+
+    assert resolution.path == str(fake_binary)
+    assert resolution.source == "explicit"
+
+
+def test_index_is_keyed_by_chrome_version(
+    tmp_path: Path, fake_binary: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(driver_resolver, "detect_chrome_version", lambda: "138.0.1.2")
+    index_path = tmp_path / "index.json"
+    index_path.write_text(json.dumps({"138.0.1.2": str(fake_binary)}))
+
+    resolution = ChromeDriverResolver(index_path=index_path, offline=True).resolve()
+
+    assert resolution.path == str(fake_binary)
+    assert resolution.source == "index"
+    assert resolution.chrome_version == "138.0.1.2"
@@ -0,0 +1,111 @@
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from framework.adaptive_wait import AdaptiveWait
+from framework.element_cache import (
+    CacheStats,
+    ElementCache,
+    navigation_count,
+    pop_cache_stats,
+)
+
+
+class FakeElement:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.displayed = True
+        self.error: Exception | None = None
+
+    def is_displayed(self) -> bool:
+        if self.error is not None:
+            raise self.error
+        return self.displayed
+
+
+class FakeDriver:
+    """Counts finds; every find returns a new element, like a fresh lookup."""
+
+    def __init__(self) -> None:
+        self.finds = 0
+        self.found: list[FakeElement] = []
+
+    def execute(self, driver_command: str, params: dict | None = None) -> dict:
+        return {"value": None}
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        self.finds += 1
+        self.found.append(FakeElement(value))
+        return self.found[-1]
+
+
+def make_cache() -> tuple[FakeDriver, ElementCache, AdaptiveWait]:
+    driver = FakeDriver()
+    return driver, ElementCache(driver), AdaptiveWait(driver, timeout=0.2)  # type: ignore[arg-type]
+
+
+def test_second_lookup_reuses_the_element() -> None:
+    driver, cache, wait = make_cache()
+
+    first = cache.wait_visible(("id", "name"), wait)
+    second = cache.wait_visible(("id", "name"), wait)
+
+    assert first is second
+    assert driver.finds == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_navigation_invalidates_the_cache() -> None:
+    driver, cache, wait = make_cache()
+    cache.wait_visible(("id", "name"), wait)
+
+    driver.execute("refresh")
+    cache.wait_visible(("id", "name"), wait)
+
+    assert driver.finds == 2
+    assert cache.stats.invalidations == 1
+    assert navigation_count(driver) == 1  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "error", [StaleElementReferenceException(), NoSuchElementException()]
+)
+def test_stale_element_is_located_again_once(error: Exception) -> None:
+    driver, cache, wait = make_cache()
+    old = cache.wait_visible(("id", "name"), wait)
+    old.error = error
+
+    new = cache.wait_visible(("id", "name"), wait)
+
+    assert new is not old
+    assert driver.finds == 2
+    assert (cache.stats.stale, cache.stats.hits) == (1, 0)
+
+
+def test_hidden_cached_element_is_waited_on_without_finding() -> None:
+    driver, cache, wait = make_cache()
+    element = cache.wait_visible(("id", "name"), wait)
+    element.displayed = False
+
+    with pytest.raises(TimeoutException):
+        cache.wait_visible(("id", "name"), wait)
+
+    assert driver.finds == 1
+
+
+def test_stats_are_shared_per_driver_and_popped_per_test() -> None:
+    driver, cache, wait = make_cache()
+    other_page = ElementCache(driver)  # type: ignore[arg-type]
+    cache.wait_visible(("id", "a"), wait)
+    other_page.wait_visible(("id", "b"), wait)
+    other_page.wait_visible(("id", "b"), wait)
+
+    stats = pop_cache_stats(driver)  # type: ignore[arg-type]
+
+    assert (stats.hits, stats.misses, stats.hit_rate) == (1, 2, 1 / 3)
+    assert pop_cache_stats(driver) == CacheStats()  # type: ignore[arg-type]
+    cache.wait_visible(("id", "a"), wait)
+    assert pop_cache_stats(driver).hits == 1  # type: ignore[arg-type]
+    assert "33% hit rate, 1 find commands saved" in stats.summary_line()
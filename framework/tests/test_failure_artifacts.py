@@ -0,0 +1,77 @@
+import base64
+from pathlib import Path
+from types import SimpleNamespace
+import pytest
+from selenium.common.exceptions import UnexpectedAlertPresentException
+from framework import failure_artifacts
+from framework.failure_artifacts import ArtifactWriter, artifact_stem
+
+PNG = b"\x89PNG\r\n\x1a\nfake"
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.page_source = "<html><body>failed</body></html>"
+        self.logs = [
+            {"timestamp": 1_000_000, "level": "SEVERE", "message": "earlier test"},
+            {"timestamp": 2_000_000, "level": "SEVERE", "message": "TypeError: x"},
+        ]
+
+    def get_screenshot_as_base64(self) -> str:
+        return base64.b64encode(PNG).decode()
+
+    def get_log(self, log_type: str) -> list[dict]:
+        assert log_type == "browser"
+        return self.logs
+
+
+def test_artifacts_are_written_in_the_background(tmp_path: Path) -> None:
+    writer = ArtifactWriter(tmp_path, max_pending=1)
+    stem = artifact_stem("tests/test_demo.py::test_form[chrome]", "call")
+
+    artifacts = writer.capture(FakeDriver(), stem, since=1_500)  # type: ignore[arg-type]
+    writer.close()
+
+    assert stem == "tests_test_demo.py_test_form_chrome-call"
+    assert [a.kind for a in artifacts] == ["screenshot", "page source", "console log"]
+    assert all(a.future.done() for a in artifacts)
+    assert (tmp_path / f"{stem}.png").read_bytes() == PNG
+    assert "failed" in (tmp_path / f"{stem}.html").read_text()
+    # Only messages logged since the test started
+    assert (tmp_path / f"{stem}.log").read_text().endswith("SEVERE TypeError: x")
+    assert (writer.written, writer.failed_tests, writer.errors) == (3, 1, [])
+
+
+def test_missing_artifacts_are_reported_not_raised(tmp_path: Path) -> None:
+    driver = FakeDriver()
+
+    def blocked() -> str:
+        raise UnexpectedAlertPresentException("alert open")
+
+    driver.get_screenshot_as_base64 = blocked  # type: ignore[method-assign]
+    writer = ArtifactWriter(tmp_path)
+
+    artifacts = writer.capture(driver, "test-call")  # type: ignore[arg-type]
+    writer.close()
+
+    assert [a.kind for a in artifacts] == ["page source", "console log"]
+    assert writer.errors == ["test-call: no screenshot (alert open)"]
+
+
+def test_report_extras_link_relative_to_the_report(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_extras = SimpleNamespace(
+        image=lambda content, name: {"kind": "image", "content": content},
+        url=lambda content, name: {"kind": "url", "content": content},
+    )
+    writer = ArtifactWriter(tmp_path / "artifacts")
+    artifacts = writer.capture(FakeDriver(), "test-call")  # type: ignore[arg-type]
+    writer.close()
+
+    monkeypatch.setattr(failure_artifacts, "html_extras", fake_extras)
+    extras = failure_artifacts.html_report_extras(artifacts, tmp_path)
+
+    assert extras[0] == {"kind": "image", "content": "artifacts/test-call.png"}
+    assert [e["kind"] for e in extras[1:]] == ["url", "url"]
+    assert failure_artifacts.html_report_extras(artifacts, None) == []
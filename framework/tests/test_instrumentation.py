@@ -0,0 +1,85 @@
+import pytest
+from framework.instrumentation import (
+    InstrumentationReport,
+    StepRecorder,
+    attach_recorder,
+    step,
+)
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+
+    def execute(self, driver_command: str, params: dict | None = None) -> dict:
+        if driver_command == "boom":
+            raise RuntimeError("command failed")
+        self.commands.append(driver_command)
+        return {"value": None}
+
+
+def test_commands_and_waits_are_recorded() -> None:
+    driver = FakeDriver()
+    recorder = StepRecorder("test_x")
+    attach_recorder(driver, recorder)  # type: ignore[arg-type]
+
+    with step(driver, "wait_visible", ("id", "name")):  # type: ignore[arg-type]
+        driver.execute("findElement", {"using": "css selector", "value": "#name"})
+    with pytest.raises(RuntimeError):
+        driver.execute("boom")
+
+    assert [(s.kind, s.name, s.locator, s.outcome) for s in recorder.steps] == [
+        ("command", "findElement", "css selector=#name", "ok"),
+        ("wait", "wait_visible", "id=name", "ok"),
+        ("command", "boom", None, "RuntimeError"),
+    ]
+
+
+def test_detached_driver_records_nothing() -> None:
+    driver = FakeDriver()
+    recorder = StepRecorder("test_x")
+    attach_recorder(driver, recorder)  # type: ignore[arg-type]
+    attach_recorder(driver, None)  # type: ignore[arg-type]
+
+    driver.execute("getTitle")
+
+    assert recorder.steps == []
+    assert driver.commands == ["getTitle"]
+
+
+def test_report_ranks_slowest_steps() -> None:
+    report = InstrumentationReport()
+    recorder = StepRecorder("test_x")
+    recorder.record("command", "fast", None, start=0.0, outcome="ok")
+    recorder.steps[-1].seconds = 0.01
+    recorder.record("command", "slow", None, start=0.0, outcome="ok")
+    recorder.steps[-1].seconds = 2.0
+    report.add(recorder)
+
+    assert [s["name"] for _, s in report.slowest_steps()] == ["slow", "fast"]
+    assert report.tests["test_x"]["command_count"] == 2
+
+
+def test_wait_lines_group_waits_by_locator() -> None:
+    report = InstrumentationReport()
+    for test_id, seconds, polls in (("test_a", 0.1, 2), ("test_b", 0.3, 4)):
+        recorder = StepRecorder(test_id)
+        recorder.record("wait", "wait_visible", "id=name", 0.0, "ok", polls)
+        recorder.steps[-1].seconds = seconds
+        report.add(recorder)
+
+    (line,) = report.wait_lines()
+
+    assert line.split() == [
+        "2x",
+        "median",
+        "0.200s",  # Mean of the two middle waits
+        "max",
+        "0.300s",
+        "3.0",
+        "polls",
+        "0",
+        "failed",
+        "wait_visible",
+        "id=name",
+    ]
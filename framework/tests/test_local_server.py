@@ -0,0 +1,37 @@
+import pytest
+import requests
+from typing import Generator
+from framework.local_server import ROUTES, LocalSiteServer
+from framework.site_urls import set_base_url, site_url
+
+
+@pytest.fixture
+def server() -> Generator[LocalSiteServer, None, None]:
+    with LocalSiteServer() as server:
+        yield server
+
+
+@pytest.mark.parametrize("path", sorted(ROUTES))
+def test_every_route_is_served(server: LocalSiteServer, path: str) -> None:
+    response = requests.get(server.base_url + path)
+    assert response.status_code == 200, f"{path} returned {response.status_code}"
+
+
+def test_upload_echoes_filename(server: LocalSiteServer) -> None:
+    response = requests.post(
+        server.base_url + "/upload", files={"file": ("sample_upload.txt", b"data")}
+    )
+    assert "File Uploaded!" in response.text
+    assert "<p>sample_upload.txt</p>" in response.text
+
+
+def test_site_url_rebases_live_origins(server: LocalSiteServer) -> None:
+    set_base_url(server.base_url)
+    try:
+        assert site_url("https://seleniumbase.io/demo_page") == (
+            server.base_url + "/demo_page"
+        )
+        assert site_url("https://duckduckgo.com/") == "https://duckduckgo.com/"
+    finally:
+        set_base_url(None)
+    assert site_url("https://seleniumbase.io/demo_page").startswith("https://")
@@ -0,0 +1,163 @@
+import pytest
+from pathlib import Path
+from selenium.webdriver.common.by import By
+from framework.locator_profiler import (
+    LocatorProfile,
+    apply_candidate,
+    page_locators,
+    profile_locators,
+    report_lines,
+    xpath_to_css,
+)
+
+
+@pytest.mark.parametrize(
+    "xpath, css",
+    [
+        (
+            "//input[@id='validationCustom01']/following-sibling::div"
+            "[contains(@class, 'invalid-feedback')]",
+            'input#validationCustom01 ~ div[class*="invalid-feedback"]',
+        ),
+        (
+            "//input[@id='myTextInput']/parent::td/preceding-sibling::td",
+            "td:has(~ td:has(> input#myTextInput))",
+        ),
+        (
+            "//select[@id='s']/parent::div/div[contains(@class, 'feedback')]",
+            'div:has(> select#s) > div[class*="feedback"]',
+        ),
+        ("//table//tr/td[2]", "table tr > td:nth-of-type(2)"),
+        ("//div/*[2]", "div > :nth-child(2)"),  # Any element, not any <*>
+        ("//*[@data-testid='a b']", '[data-testid="a b"]'),
+    ],
+)
+def test_xpath_to_css(xpath: str, css: str) -> None:
+    assert xpath_to_css(xpath) == css
+
+
+@pytest.mark.parametrize(
+    "xpath",
+    [
+        "//h1[text()='Demo Page']",
+        "//button[@id='b']/ancestor::tr/td[contains(text(),'Button:')]",
+        "//a[@href='x'][2]",  # Position among the matches, not nth-of-type
+        "//div//span/parent::p",  # :has() would drop the div constraint
+        "./parent::td",
+        "/html/body",
+    ],
+)
+def test_xpath_without_css_equivalent(xpath: str) -> None:
+    assert xpath_to_css(xpath) is None
+
+
+class SamplePage:
+    TITLE = (By.XPATH, "//h1[text()='Title']")
+    ERROR_MSG = (By.XPATH, "//input[@id='name']/following-sibling::div")
+    ROWS = (By.CSS_SELECTOR, "tr")
+    READY_LOCATORS = (TITLE, ROWS)
+    URL = "https://example.com"
+
+
+def test_page_locators_finds_locator_constants_only() -> None:
+    assert sorted(page_locators(SamplePage)) == ["ERROR_MSG", "ROWS", "TITLE"]
+
+
+class FakeDriver:
+    def __init__(self, results: list[dict]) -> None:
+        self.results = results
+        self.entries: list = []
+
+    def execute_script(self, script: str, entries: list, *args: object) -> list:
+        self.entries = entries
+        return self.results
+
+
+def test_profile_locators_pairs_xpaths_with_css_candidates() -> None:
+    driver = FakeDriver(
+        [
+            {"matches": 1, "samples": [30.0, 20.0, 25.0]},
+            {
+                "matches": 1,
+                "samples": [12.0],
+                "equivalent": True,
+                "candidateSamples": [3.0],
+            },
+            {"matches": 4, "samples": [2.0]},
+        ]
+    )
+    locators = {
+        "TITLE": SamplePage.TITLE,
+        "ERROR_MSG": SamplePage.ERROR_MSG,
+        "ROWS": SamplePage.ROWS,
+    }
+
+    title, error, rows = profile_locators(driver, "SamplePage", locators)  # type: ignore[arg-type]
+
+    assert driver.entries[0][1] is None
+    assert driver.entries[1][1] == ["css selector", "input#name ~ div"]
+    assert (title.micros, title.candidate) == (25.0, None)
+    assert error.saving == 4.0
+    assert title.issues(page_median=4.0) == [
+        "slow: 6x page median",
+        "no CSS equivalent",
+    ]
+    assert rows.issues(page_median=4.0) == []
+
+
+def test_single_element_locator_matching_several_is_ambiguous() -> None:
+    profile = LocatorProfile("Page", "SUCCESS_MSG", (By.ID, "x"), 2, 1.0)
+
+    assert profile.issues(page_median=1.0) == ["ambiguous: 2 matches"]
+
+
+def test_report_ranks_slowest_first_with_proposals() -> None:
+    fast = LocatorProfile("Page", "BUTTON", (By.ID, "b"), 1, 1.0)
+    slow = LocatorProfile(
+        "Page",
+        "ERROR_MSG",
+        SamplePage.ERROR_MSG,
+        1,
+        9.0,
+        (By.CSS_SELECTOR, "input#name ~ div"),
+        2.0,
+        True,
+    )
+
+    lines = report_lines([fast, slow])
+
+    assert lines[0].split() == ["9.0us", "Page.ERROR_MSG"]
+    assert lines[1].split()[:2] == ["->", "input#name"]
+    assert "same elements" in lines[1]
+    assert lines[2].split() == ["1.0us", "Page.BUTTON"]
+
+
+def test_apply_candidate_rewrites_the_constant(tmp_path: Path) -> None:
+    source = tmp_path / "page.py"
+    source.write_text(
+        "class Page:\n"
+        "    ERROR_MSG = (\n"
+        "        By.XPATH,\n"
+        "        \"//input[@id='name']/following-sibling::div[contains(@class, 'x')]\",\n"
+        "    )\n"
+        "    OTHER = (By.ID, 'other')\n"
+    )
+    profile = LocatorProfile(
+        "Page",
+        "ERROR_MSG",
+        (By.XPATH, "//input[@id='name']/following-sibling::div[contains(@class, 'x')]"),
+        1,
+        9.0,
+        (By.CSS_SELECTOR, 'input#name ~ div[class*="x"]'),
+        2.0,
+        True,
+    )
+
+    assert apply_candidate(source, profile)
+    assert source.read_text() == (
+        "class Page:\n"
+        "    ERROR_MSG = (By.CSS_SELECTOR, 'input#name ~ div[class*=\"x\"]')\n"
+        "    OTHER = (By.ID, 'other')\n"
+    )
+    # Already rewritten: the XPath is no longer there to replace
+    assert not apply_candidate(source, profile)
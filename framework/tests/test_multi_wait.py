@@ -0,0 +1,34 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from framework.multi_wait import wait_for_all
+
+
+class FakeDriver:
+    """Answers each poll with the next prepared list of found elements."""
+
+    def __init__(self, polls: list[list]) -> None:
+        self.polls = polls
+        self.calls = 0
+
+    def execute_script(self, script: str, *args: object) -> list:
+        result = self.polls[min(self.calls, len(self.polls) - 1)]
+        self.calls += 1
+        return result
+
+
+def test_returns_all_elements_once_every_locator_matches() -> None:
+    driver = FakeDriver([["a", None], ["a", "b"]])
+
+    found = wait_for_all(driver, [("id", "a"), ("id", "b")], timeout=2)  # type: ignore[arg-type]
+
+    assert found == ["a", "b"]
+    assert driver.calls == 2
+
+
+def test_timeout_names_missing_locators() -> None:
+    driver = FakeDriver([["a", None, None]])
+
+    with pytest.raises(TimeoutException, match="2 of 3 elements not visible") as info:
+        wait_for_all(driver, [("id", "a"), ("id", "b"), ("css selector", "p")], timeout=0.1)  # type: ignore[arg-type]
+
+    assert "id=b, css selector=p" in info.value.msg
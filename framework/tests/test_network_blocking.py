@@ -0,0 +1,83 @@
+import json
+import pytest
+from framework.network_blocking import (
+    NetworkBlockReport,
+    patterns_for,
+    read_network_activity,
+)
+
+
+class FakeDriver:
+    def __init__(self, events: list[tuple[str, dict]]) -> None:
+        self.entries = [
+            {"message": json.dumps({"message": {"method": m, "params": p}})}
+            for m, p in events
+        ]
+
+    def get_log(self, log_type: str) -> list[dict]:
+        assert log_type == "performance"
+        return self.entries
+
+
+def _request(request_id: str, url: str) -> tuple[str, dict]:
+    return (
+        "Network.requestWillBeSent",
+        {"requestId": request_id, "request": {"url": url}},
+    )
+
+
+AD_URL = "https://securepubads.g.doubleclick.net/tag/js/gpt.js"
+
+
+def test_blocked_and_loaded_requests_are_read_from_log() -> None:
+    driver = FakeDriver(
+        [
+            _request("1", AD_URL),
+            ("Network.loadingFailed", {"requestId": "1", "blockedReason": "inspector"}),
+            _request("2", "https://example.com/app.js"),
+            ("Network.loadingFinished", {"requestId": "2", "encodedDataLength": 512}),
+        ]
+    )
+
+    activity = read_network_activity(driver)  # type: ignore[arg-type]
+
+    assert activity.blocked == [AD_URL]
+    assert activity.loaded == {"https://example.com/app.js": 512}
+
+
+def test_report_sizes_blocked_urls_seen_unblocked() -> None:
+    report = NetworkBlockReport()
+    unblocked = read_network_activity(
+        FakeDriver(  # type: ignore[arg-type]
+            [
+                _request("1", AD_URL),
+                (
+                    "Network.loadingFinished",
+                    {"requestId": "1", "encodedDataLength": 2048},
+                ),
+            ]
+        )
+    )
+    report.add("test_opted_out", unblocked)
+    report.add(
+        "test_blocked",
+        read_network_activity(
+            FakeDriver(  # type: ignore[arg-type]
+                [
+                    _request("9", AD_URL),
+                    (
+                        "Network.loadingFailed",
+                        {"requestId": "9", "blockedReason": "inspector"},
+                    ),
+                ]
+            )
+        ),
+    )
+
+    assert report.bytes_saved() == 2048
+    assert report.summary_lines()[0] == "blocked 1 requests in 2 tests: ads 1"
+
+
+def test_unknown_category_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown block category"):
+        patterns_for(["ads", "popups"])
@@ -0,0 +1,52 @@
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from framework.page_ready import navigate_until_ready
+
+
+class FakeDriver:
+    """Navigates instantly and answers readiness polls from a script."""
+
+    def __init__(self, polls: list) -> None:
+        self.polls = polls
+        self.visited: list[str] = []
+        self.marked_before_get = False
+
+    def get(self, url: str) -> None:
+        self.visited.append(url)
+
+    def execute_script(self, script: str, *args: object) -> list[str]:
+        if not self.visited:
+            # Marks the old document so its replacement can be told apart
+            self.marked_before_get = True
+            return []
+        result = self.polls.pop(0) if len(self.polls) > 1 else self.polls[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_returns_once_document_and_locators_are_ready() -> None:
+    driver = FakeDriver(
+        [
+            JavascriptException("document unloaded"),
+            ["document.readyState"],
+            ["id=title"],
+            [],
+        ]
+    )
+
+    seconds = navigate_until_ready(driver, "http://site/page", [("id", "title")])  # type: ignore[arg-type]
+
+    assert driver.visited == ["http://site/page"]
+    assert driver.marked_before_get
+    assert driver.polls == [[]]
+    assert seconds >= 0
+
+
+def test_timeout_names_what_was_not_ready() -> None:
+    driver = FakeDriver([["id=title", "css selector=form"]])
+
+    with pytest.raises(
+        TimeoutException, match="waiting for: id=title, css selector=form"
+    ):
+        navigate_until_ready(driver, "http://site/page", [], timeout=0.1)  # type: ignore[arg-type]
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+from framework.profile_template import ProfileTemplate, clone_file, nest_prefs
+
+
+class FakeDriver:
+    """Leaves behind what a real Chrome session writes into its profile."""
+
+    def __init__(self, user_data_dir: Path) -> None:
+        self.user_data_dir = user_data_dir
+        self.quit_called = False
+
+    def get(self, url: str) -> None:
+        (self.user_data_dir / "SingletonLock").symlink_to("host-1234")
+        (self.user_data_dir / "Default" / "Sessions").mkdir()
+        (self.user_data_dir / "Default" / "Sessions" / "Tabs_1").write_text("tab")
+        (self.user_data_dir / "Default" / "Cookies").write_bytes(b"sqlite")
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def test_nest_prefs_splits_dotted_keys() -> None:
+    nested = nest_prefs(
+        {
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+            "safebrowsing.enabled": True,
+        }
+    )
+
+    assert nested == {
+        "download": {"prompt_for_download": False, "directory_upgrade": True},
+        "safebrowsing": {"enabled": True},
+    }
+
+
+def test_build_launches_once_and_drops_volatile_files(tmp_path: Path) -> None:
+    drivers: list[FakeDriver] = []
+
+    def launch(user_data_dir: Path) -> FakeDriver:
+        drivers.append(FakeDriver(user_data_dir))
+        return drivers[-1]
+
+    template = ProfileTemplate(tmp_path).build({"safebrowsing.enabled": True}, launch)  # type: ignore[arg-type]
+
+    assert len(drivers) == 1 and drivers[0].quit_called
+    preferences = json.loads((template.path / "Default" / "Preferences").read_text())
+    assert preferences == {"safebrowsing": {"enabled": True}}
+    assert (template.path / "First Run").exists()
+    assert (template.path / "Default" / "Cookies").exists()
+    assert not (template.path / "SingletonLock").is_symlink()
+    assert not (template.path / "Default" / "Sessions").exists()
+    assert template.build_seconds > 0
+
+
+def test_clones_are_independent_copies(tmp_path: Path) -> None:
+    template = ProfileTemplate(tmp_path).build({}, FakeDriver)  # type: ignore[arg-type]
+
+    first, second = template.clone(), template.clone()
+    (first / "Default" / "Cookies").write_bytes(b"changed")
+
+    assert first != second
+    assert first.parent == second.parent == template.clones_root
+    assert (second / "Default" / "Cookies").read_bytes() == b"sqlite"
+    assert (template.path / "Default" / "Cookies").read_bytes() == b"sqlite"
+
+
+def test_clone_file_copies_contents(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.write_bytes(b"data")
+
+    clone_file(str(source), str(tmp_path / "copy"))
+
+    assert (tmp_path / "copy").read_bytes() == b"data"
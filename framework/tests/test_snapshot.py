@@ -0,0 +1,38 @@
+from framework.snapshot import snapshot_elements
+
+
+class FakeDriver:
+    def __init__(self, records: list) -> None:
+        self.records = records
+        self.calls: list[tuple] = []
+
+    def execute_script(self, script: str, *args: object) -> list:
+        self.calls.append(args)
+        return self.records
+
+
+def test_records_are_typed_and_missing_elements_flagged() -> None:
+    driver = FakeDriver(
+        [
+            {
+                "text": "Looks good!",
+                "value": None,
+                "displayed": True,
+                "attributes": {"style": "color: green;"},
+                "styles": {},
+            },
+            None,
+        ]
+    )
+    locators = [("id", "ok"), ("id", "gone")]
+
+    ok, gone = snapshot_elements(driver, locators, attributes=["style"])  # type: ignore[arg-type]
+
+    assert driver.calls == [(locators, ["style"], [])]
+    assert (ok.found, ok.text, ok.hidden, ok.attributes["style"]) == (
+        True,
+        "Looks good!",
+        False,
+        "color: green;",
+    )
+    assert (gone.found, gone.hidden, gone.locator) == (False, True, ("id", "gone"))
@@ -0,0 +1,222 @@
+import base64
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Optional
+import pytest
+import trio
+from selenium.webdriver.common.devtools.v137 import fetch, network
+from framework.traffic_replay import (
+    ArchiveReader,
+    ArchiveWriter,
+    RecordedResponse,
+    ReplayStats,
+    TrafficInterceptor,
+    TrafficLibrary,
+    request_key,
+)
+
+PAGE_URL = "https://practice.expandtesting.com/form-validation"
+
+
+class FakeSession:
+    """Answers CDP commands the way CdpSession.execute() would."""
+
+    def __init__(self, results: Optional[dict[str, dict]] = None) -> None:
+        self.results = results or {}
+        self.commands: list[dict[str, Any]] = []
+
+    async def execute(self, cmd: Any) -> Any:
+        request = next(cmd)
+        self.commands.append(request)
+        try:
+            cmd.send(self.results.get(request["method"], {}))
+        except StopIteration as stop:
+            return stop.value
+
+    def listen(self, *event_types: type, buffer_size: float = 10) -> Any:
+        self.events, receiver = trio.open_memory_channel(buffer_size)
+        return receiver
+
+
+class FakeDriver:
+    def __init__(self, session: FakeSession) -> None:
+        self.session = session
+
+    @asynccontextmanager
+    async def bidi_connection(self) -> AsyncIterator[Any]:
+        yield SimpleNamespace(
+            session=self.session, devtools=SimpleNamespace(fetch=fetch, network=network)
+        )
+
+
+def _interceptor(library: TrafficLibrary, session: FakeSession) -> TrafficInterceptor:
+    interceptor = TrafficInterceptor(None, library, "replay")  # type: ignore[arg-type]
+    interceptor._session = session
+    interceptor._devtools = SimpleNamespace(fetch=fetch, network=network)
+    return interceptor
+
+
+def _paused(url: str, status: Optional[int] = None, headers: Any = ()) -> Any:
+    return SimpleNamespace(
+        request_id=fetch.RequestId("interception-1"),
+        request=SimpleNamespace(method="GET", url=url, post_data=None),
+        response_status_code=status,
+        response_error_reason=None,
+        response_headers=[fetch.HeaderEntry(name, value) for name, value in headers],
+    )
+
+
+def test_archive_round_trip_stores_identical_bodies_once(tmp_path: Path) -> None:
+    path = tmp_path / "Page.traffic"
+    writer = ArchiveWriter(path)
+    script = RecordedResponse(200, [("Content-Type", "text/javascript")], b"x" * 4096)
+    assert writer.add("GET https://cdn.example/a.js", script)
+    assert writer.add("GET https://cdn.example/a.js?v=2", script)
+    assert not writer.add("GET https://cdn.example/a.js", script)
+    assert not path.exists()  # Only replaced once complete
+    writer.close()
+
+    reader = ArchiveReader(path)
+    assert len(reader) == 2
+    assert reader.get("GET https://cdn.example/a.js?v=2") == script
+    assert reader.get("GET https://cdn.example/missing.js") is None
+    assert path.stat().st_size < 4096  # One compressed copy of the body
+    reader.close()
+
+
+def test_reader_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "Page.traffic"
+    path.write_bytes(b"not an archive, but long enough for a footer")
+    with pytest.raises(ValueError, match="not a traffic archive"):
+        ArchiveReader(path)
+
+
+def test_request_key_distinguishes_post_bodies() -> None:
+    first = request_key("POST", PAGE_URL, "name=a")
+    assert first != request_key("POST", PAGE_URL, "name=b")
+    assert request_key("GET", PAGE_URL) == f"GET {PAGE_URL}"
+
+
+def test_recorded_response_is_replayed(tmp_path: Path) -> None:
+    library = TrafficLibrary(tmp_path)
+    body = "<html>form</html>"
+    session = FakeSession(
+        {"Fetch.getResponseBody": {"body": body, "base64Encoded": False}}
+    )
+    interceptor = _interceptor(library, session)
+    event = _paused(
+        PAGE_URL,
+        200,
+        [("Content-Type", "text/html"), ("Content-Encoding", "gzip")],
+    )
+
+    trio.run(interceptor._respond, event, "record", library.writer("Page"))
+    library.close()
+    assert [c["method"] for c in session.commands] == [
+        "Fetch.getResponseBody",
+        "Fetch.continueRequest",
+    ]
+
+    session.commands.clear()
+    trio.run(interceptor._respond, _paused(PAGE_URL), "replay", library.reader("Page"))
+    fulfilled = session.commands[-1]
+    assert fulfilled["method"] == "Fetch.fulfillRequest"
+    assert fulfilled["params"]["responseCode"] == 200
+    # The stored body is decoded, so its wire encoding is not replayed
+    assert fulfilled["params"]["responseHeaders"] == [
+        {"name": "Content-Type", "value": "text/html"}
+    ]
+    assert base64.b64decode(fulfilled["params"]["body"]).decode() == body
+    assert (library.stats.recorded, library.stats.hits) == (1, 1)
+
+
+def test_replay_miss_fails_the_request(tmp_path: Path) -> None:
+    library = TrafficLibrary(tmp_path)
+    session = FakeSession()
+    interceptor = _interceptor(library, session)
+
+    # No archive recorded for this page yet
+    trio.run(interceptor._respond, _paused(PAGE_URL), "replay", library.reader("Page"))
+
+    assert session.commands[-1]["method"] == "Fetch.failRequest"
+    assert library.stats.missed_urls == [PAGE_URL]
+
+
+def test_interceptor_errors_release_the_request(tmp_path: Path) -> None:
+    library = TrafficLibrary(tmp_path)
+    session = FakeSession()
+    interceptor = _interceptor(library, session)
+
+    class BrokenArchive:
+        def get(self, key: str) -> None:
+            raise OSError("archive unreadable")
+
+    trio.run(interceptor._respond, _paused(PAGE_URL), "replay", BrokenArchive())
+
+    assert session.commands[-1]["method"] == "Fetch.failRequest"
+    assert library.stats.errors == 1
+
+
+def test_redirects_are_recorded_without_a_body(tmp_path: Path) -> None:
+    library = TrafficLibrary(tmp_path)
+    session = FakeSession()
+    interceptor = _interceptor(library, session)
+    event = _paused(PAGE_URL, 302, [("Location", "/login")])
+
+    trio.run(interceptor._respond, event, "record", library.writer("Page"))
+    library.close()
+
+    assert [c["method"] for c in session.commands] == ["Fetch.continueRequest"]
+    recorded = ArchiveReader(tmp_path / "Page.traffic").get(f"GET {PAGE_URL}")
+    assert recorded == RecordedResponse(302, [("Location", "/login")], b"")
+
+
+def test_modes_are_switched_from_the_test_thread(tmp_path: Path) -> None:
+    session = FakeSession()
+    driver = FakeDriver(session)
+    library = TrafficLibrary(tmp_path)
+    interceptor = TrafficInterceptor(driver, library, "replay")  # type: ignore[arg-type]
+
+    interceptor.start()
+    interceptor.use("Page")
+    interceptor.use("Page")  # Already replaying Page
+    interceptor.use("Page", "passthrough")
+    interceptor.stop()
+
+    assert [c["method"] for c in session.commands] == ["Fetch.enable", "Fetch.disable"]
+    assert interceptor.mode == "passthrough"
+
+
+def test_background_failure_is_raised_in_the_test_thread(tmp_path: Path) -> None:
+    session = FakeSession()
+    interceptor = TrafficInterceptor(
+        FakeDriver(session), TrafficLibrary(tmp_path), "replay"  # type: ignore[arg-type]
+    ).start()
+    interceptor._error = RuntimeError("CDP connection lost")
+
+    with pytest.raises(RuntimeError, match="CDP connection lost"):
+        interceptor.use("Page")
+    interceptor.stop()  # Already reported
+
+
+def test_stats_summary_lists_missed_urls_once() -> None:
+    stats = ReplayStats(hits=3, misses=1, missed_urls=[PAGE_URL])
+    stats.merge(ReplayStats(misses=1, missed_urls=[PAGE_URL]))
+
+    assert stats.summary_lines() == [
+        "replayed 3 of 5 requests (60% hit rate), 2 misses",
+        f"  missed {PAGE_URL}",
+    ]
+
+
+def test_unused_archive_keeps_the_earlier_recording(tmp_path: Path) -> None:
+    path = tmp_path / "Page.traffic"
+    writer = ArchiveWriter(path)
+    writer.add(f"GET {PAGE_URL}", RecordedResponse(200, [], b"page"))
+    writer.close()
+
+    ArchiveWriter(path).close()  # A later session that recorded nothing
+
+    assert ArchiveReader(path).get(f"GET {PAGE_URL}") is not None
+    assert list(tmp_path.iterdir()) == [path]
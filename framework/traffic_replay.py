@@ -0,0 +1,455 @@
+import base64
+import hashlib
+import json
+import math
+import os
+import struct
+import threading
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+import trio
+from selenium.webdriver.common.bidi.cdp import BrowserError
+from selenium.webdriver.remote.webdriver import WebDriver
+
+MODES = ("record", "replay", "passthrough")
+
+# Archive layout: magic, then the zlib-compressed bodies back to back, then
+# the zlib-compressed JSON index, then a fixed-size footer pointing at it.
+# Only the index is read up front; bodies are read on demand by offset.
+_MAGIC = b"TRAFFIC1"
+_FOOTER = struct.Struct("<QQ8s")  # index offset, index length, magic
+
+# The body Fetch.getResponseBody returns is already decoded, so these would
+# describe the bytes on the wire rather than the ones that are replayed
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def request_key(method: str, url: str, post_data: Optional[str] = None) -> str:
+    """What a recorded response is looked up by: method, URL and body hash."""
+    key = f"{method} {url}"
+    if post_data:
+        key += " " + hashlib.sha1(post_data.encode()).hexdigest()[:16]
+    return key
+
+
+@dataclass
+class RecordedResponse:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class ArchiveWriter:
+    """
+    Appends responses to a new archive as they arrive, so a recording never
+    has to fit in memory. Identical bodies (shared scripts, fonts) are
+    stored once. The archive replaces any previous one at `path` on
+    `close()`, unless nothing was recorded; until then it is written to a
+    temporary file beside it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._partial = path.with_name(f"{path.name}.{os.getpid()}.partial")
+        self._file: BinaryIO = open(self._partial, "wb")
+        self._file.write(_MAGIC)
+        self._index: dict[str, dict[str, Any]] = {}
+        self._bodies: dict[bytes, tuple[int, int]] = {}
+        # Interceptors of several drivers may record into the same archive
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, key: str, response: RecordedResponse) -> bool:
+        """Store `response` under `key`; False if `key` was recorded already."""
+        with self._lock:
+            if key in self._index:
+                return False
+            digest = hashlib.sha1(response.body).digest()
+            if digest not in self._bodies:
+                compressed = zlib.compress(response.body)
+                self._bodies[digest] = (self._file.tell(), len(compressed))
+                self._file.write(compressed)
+            self._index[key] = {
+                "status": response.status,
+                "headers": response.headers,
+                "body": self._bodies[digest],
+            }
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            if not self._index:
+                # Nothing went through this archive; keep any earlier recording
+                self._file.close()
+                os.remove(self._partial)
+                return
+            index = zlib.compress(json.dumps(self._index).encode())
+            offset = self._file.tell()
+            self._file.write(index)
+            self._file.write(_FOOTER.pack(offset, len(index), _MAGIC))
+            self._file.close()
+            os.replace(self._partial, self.path)
+
+
+class ArchiveReader:
+    """Looks responses up in an archive written by ArchiveWriter."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: BinaryIO = open(path, "rb")
+        self._lock = threading.Lock()
+        try:
+            self._file.seek(-_FOOTER.size, os.SEEK_END)
+            offset, length, magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a traffic archive")
+            self._file.seek(offset)
+            self._index = json.loads(zlib.decompress(self._file.read(length)))
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def get(self, key: str) -> Optional[RecordedResponse]:
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry["body"]
+        with self._lock:
+            self._file.seek(offset)
+            compressed = self._file.read(length)
+        return RecordedResponse(
+            entry["status"],
+            [(name, value) for name, value in entry["headers"]],
+            zlib.decompress(compressed),
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@dataclass
+class ReplayStats:
+    hits: int = 0  # Requests answered from an archive
+    misses: int = 0  # Requests failed in replay mode because nothing was recorded
+    recorded: int = 0
+    errors: int = 0  # Requests the interceptor failed on and released
+    missed_urls: list[str] = field(default_factory=list)
+
+    def merge(self, other: "ReplayStats") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.recorded += other.recorded
+        self.errors += other.errors
+        self.missed_urls.extend(other.missed_urls)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def summary_lines(self, limit: int = 10) -> list[str]:
+        lines = []
+        if self.recorded:
+            lines.append(f"recorded {self.recorded} responses")
+        replayed = self.hits + self.misses
+        if replayed:
+            lines.append(
+                f"replayed {self.hits} of {replayed} requests "
+                f"({self.hits / replayed:.0%} hit rate), {self.misses} misses"
+            )
+            unique = list(dict.fromkeys(self.missed_urls))
+            lines.extend(f"  missed {url}" for url in unique[:limit])
+            if len(unique) > limit:
+                lines.append(f"  ... and {len(unique) - limit} more")
+        if self.errors:
+            lines.append(
+                f"{self.errors} requests released after an interceptor error "
+                "(see the captured output)"
+            )
+        return lines or ["no traffic recorded or replayed"]
+
+
+class TrafficLibrary:
+    """
+    One archive per page object under `root` (e.g. FormValidationPage.traffic),
+    plus one per test module for traffic before any page object is opened
+    (e.g. test_demo.traffic), shared by every driver in the process.
+    Writers and readers are opened on first use and closed by `close()` at
+    the end of the session.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.stats = ReplayStats()
+        self._writers: dict[str, ArchiveWriter] = {}
+        self._readers: dict[str, Optional[ArchiveReader]] = {}
+        self._lock = threading.Lock()
+
+    def archive_path(self, name: str) -> Path:
+        return self.root / f"{name}.traffic"
+
+    def writer(self, name: str) -> ArchiveWriter:
+        with self._lock:
+            if name not in self._writers:
+                self._writers[name] = ArchiveWriter(self.archive_path(name))
+            return self._writers[name]
+
+    def reader(self, name: str) -> Optional[ArchiveReader]:
+        """The archive recorded for `name`, or None when there is none yet."""
+        with self._lock:
+            if name not in self._readers:
+                path = self.archive_path(name)
+                self._readers[name] = ArchiveReader(path) if path.exists() else None
+            return self._readers[name]
+
+    def count(self, outcome: str, url: Optional[str] = None) -> None:
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+            if url is not None:
+                self.stats.missed_urls.append(url)
+
+    def close(self) -> None:
+        with self._lock:
+            for writer in self._writers.values():
+                writer.close()
+            for reader in self._readers.values():
+                if reader is not None:
+                    reader.close()
+            self._writers.clear()
+            self._readers.clear()
+
+
+Archive = Union[ArchiveWriter, ArchiveReader, None]
+
+
+class TrafficInterceptor:
+    """
+    Records or replays a driver's network traffic through the CDP Fetch
+    domain.
+
+    Paused requests have to be answered while the test thread is blocked in
+    driver.get(), so the CDP connection is served by trio in a background
+    thread. `use()` switches the archive and mode, normally from
+    BasePage.open():
+    - record: every response is stored in the page's archive on its way to
+      the browser
+    - replay: requests are fulfilled from the archive without touching the
+      network; anything that was not recorded fails, so a miss shows up
+      instead of silently reaching the live site
+    - passthrough: Fetch is disabled and requests go out as usual
+    """
+
+    def __init__(
+        self, driver: WebDriver, library: TrafficLibrary, default_mode: str
+    ) -> None:
+        if default_mode not in MODES:
+            raise ValueError(
+                f"Unknown traffic mode {default_mode!r}; use one of {MODES}"
+            )
+        self.driver = driver
+        self.library = library
+        self.default_mode = default_mode
+        self.page: Optional[str] = None
+        self.mode = "passthrough"
+        self._archive: Archive = None
+        self._session: Any = None
+        self._devtools: Any = None
+        self._token: Optional[trio.lowlevel.TrioToken] = None
+        self._scope: Optional[trio.CancelScope] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def start(self, timeout: float = 30) -> "TrafficInterceptor":
+        self._thread = threading.Thread(
+            target=trio.run, args=(self._run,), name="traffic-interceptor", daemon=True
+        )
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError("The CDP connection for traffic interception hung.")
+        self._raise_error()
+        return self
+
+    def use(self, page: str, mode: Optional[str] = None) -> None:
+        """Record, replay or pass through `page`'s traffic from now on."""
+        mode = mode or self.default_mode
+        if mode not in MODES:
+            raise ValueError(f"Unknown traffic mode {mode!r}; use one of {MODES}")
+        self._raise_error()
+        if (page, mode) != (self.page, self.mode):
+            try:
+                trio.from_thread.run(self._switch, page, mode, trio_token=self._token)
+            except trio.RunFinishedError:
+                self._raise_error()
+                raise RuntimeError(
+                    "The CDP connection for traffic interception has closed."
+                ) from None
+
+    def stop(self) -> None:
+        """Close the CDP connection; Chrome drops the interception with it."""
+        if self._thread is None:
+            return
+        if self._scope is not None:
+            try:
+                trio.from_thread.run_sync(self._scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+        self._thread.join(timeout=5)
+        self._thread = None
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        # Surface a failure of the background thread once, in the caller
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    async def _run(self) -> None:
+        try:
+            async with self.driver.bidi_connection() as connection:
+                self._session = connection.session
+                self._devtools = connection.devtools
+                # Unbounded: an event dropped for lack of buffer space would
+                # leave its request paused forever
+                events = self._session.listen(
+                    self._devtools.fetch.RequestPaused, buffer_size=math.inf
+                )
+                with trio.CancelScope() as scope:
+                    self._scope = scope
+                    self._token = trio.lowlevel.current_trio_token()
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in events:
+                            nursery.start_soon(
+                                self._respond, event, self.mode, self._archive
+                            )
+        except Exception as exc:
+            self._error = exc
+        finally:
+            self._ready.set()
+
+    async def _switch(self, page: str, mode: str) -> None:
+        # Requests paused from here on are handled in the new mode
+        fetch = self._devtools.fetch
+        self.page, self.mode = page, mode
+        if mode == "record":
+            self._archive = self.library.writer(page)
+            pattern = fetch.RequestPattern(
+                url_pattern="*", request_stage=fetch.RequestStage.RESPONSE
+            )
+            await self._session.execute(fetch.enable(patterns=[pattern]))
+        elif mode == "replay":
+            self._archive = self.library.reader(page)
+            pattern = fetch.RequestPattern(url_pattern="*")
+            await self._session.execute(fetch.enable(patterns=[pattern]))
+        else:
+            self._archive = None
+            await self._session.execute(fetch.disable())
+
+    async def _respond(self, event: Any, mode: str, archive: Archive) -> None:
+        # `mode` and `archive` are the ones active when the request was paused
+        request = event.request
+        key = request_key(request.method, request.url, request.post_data)
+        try:
+            if isinstance(archive, ArchiveWriter):
+                await self._record(event, key, archive)
+            elif mode == "replay":
+                await self._replay(event, key, archive)  # type: ignore[arg-type]
+            else:
+                await self._session.execute(
+                    self._devtools.fetch.continue_request(event.request_id)
+                )
+        except BrowserError:
+            pass  # The request was cancelled, e.g. by a navigation
+        except Exception as exc:
+            # Release the request rather than leave it paused, and keep
+            # serving the others
+            print(f"[TrafficInterceptor] {mode} failed for {request.url}: {exc!r}")
+            self.library.count("errors")
+            await self._release(event, mode)
+
+    async def _release(self, event: Any, mode: str) -> None:
+        fetch = self._devtools.fetch
+        if mode == "replay":
+            command = fetch.fail_request(
+                event.request_id, self._devtools.network.ErrorReason.FAILED
+            )
+        else:
+            command = fetch.continue_request(event.request_id)
+        try:
+            await self._session.execute(command)
+        except BrowserError:
+            pass  # Already continued (record mode) or cancelled
+
+    async def _record(self, event: Any, key: str, archive: ArchiveWriter) -> None:
+        fetch = self._devtools.fetch
+        status = event.response_status_code
+        try:
+            if event.response_error_reason is None and status is not None:
+                body = b""
+                if not 300 <= status < 400:  # Redirects have no body to fetch
+                    data, encoded = await self._session.execute(
+                        fetch.get_response_body(event.request_id)
+                    )
+                    body = base64.b64decode(data) if encoded else data.encode()
+                headers = [
+                    (header.name, header.value)
+                    for header in event.response_headers or []
+                    if header.name.lower() not in _WIRE_HEADERS
+                ]
+                if archive.add(key, RecordedResponse(status, headers, body)):
+                    self.library.count("recorded")
+        finally:
+            await self._session.execute(fetch.continue_request(event.request_id))
+
+    async def _replay(
+        self, event: Any, key: str, archive: Optional[ArchiveReader]
+    ) -> None:
+        fetch = self._devtools.fetch
+        response = archive.get(key) if archive is not None else None
+        if response is None:
+            self.library.count("misses", event.request.url)
+            await self._session.execute(
+                fetch.fail_request(
+                    event.request_id,
+                    self._devtools.network.ErrorReason.INTERNET_DISCONNECTED,
+                )
+            )
+            return
+        self.library.count("hits")
+        await self._session.execute(
+            fetch.fulfill_request(
+                event.request_id,
+                response.status,
+                [fetch.HeaderEntry(name, value) for name, value in response.headers],
+                body=base64.b64encode(response.body).decode(),
+            )
+        )
+
+
+def attach_interceptor(
+    driver: WebDriver, interceptor: Optional[TrafficInterceptor]
+) -> None:
+    """Let page objects on `driver` pick their traffic mode (None detaches)."""
+    driver._traffic_interceptor = interceptor  # type: ignore[attr-defined]
+
+
+def use_traffic(driver: WebDriver, page: str, mode: Optional[str] = None) -> None:
+    """
+    Switch `driver`'s interceptor to `page`'s archive, in `mode` or the
+    session's default. Does nothing when traffic is not being intercepted.
+    """
+    interceptor = getattr(driver, "_traffic_interceptor", None)
+    if interceptor is not None:
+        interceptor.use(page, mode)
@@ -0,0 +1,198 @@
+import json
+import time
+from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+import trio
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from framework.instrumentation import format_locator
+from framework.js_locators import LOCATOR_JS
+from framework.site_urls import site_url
+from framework.snapshot import ElementSnapshot
+
+# Resolves when the element is visible. A MutationObserver plus animation
+# and transition end events wake the check, so nothing polls over the wire.
+# Resolves to null on timeout.
+_WAIT_VISIBLE_JS = """
+const [locator, timeoutMs] = args;
+const read = () => {
+  const element = locate(locator);
+  if (!element || !isVisible(element)) {
+    return null;
+  }
+  return {
+    text: (element.innerText || element.textContent || "").trim(),
+    value: "value" in element ? String(element.value) : null,
+    displayed: true,
+  };
+};
+const found = read();
+if (found) {
+  return found;
+}
+return new Promise((resolve) => {
+  const wakeEvents = ["animationend", "transitionend"];
+  const finish = (result) => {
+    observer.disconnect();
+    wakeEvents.forEach((name) => document.removeEventListener(name, check, true));
+    clearTimeout(timer);
+    resolve(result);
+  };
+  function check() {
+    const result = read();
+    if (result) {
+      finish(result);
+    }
+  }
+  const observer = new MutationObserver(check);
+  observer.observe(document.documentElement, {
+    subtree: true,
+    childList: true,
+    attributes: true,
+    characterData: true,
+  });
+  wakeEvents.forEach((name) => document.addEventListener(name, check, true));
+  const timer = setTimeout(() => finish(null), timeoutMs);
+});
+"""
+
+T = TypeVar("T")
+PageT = TypeVar("PageT", bound="AsyncBasePage")
+
+
+@dataclass
+class ExpectedResponse:
+    # devtools network.Response, set once AsyncBasePage.expect_response exits
+    response: Any = None
+
+
+class AsyncBasePage:
+    """
+    Async counterpart of BasePage for trio tests, talking to the browser over
+    the driver's CDP connection (`driver.bidi_connection()`).
+
+    Waits run inside the page and are woken by DOM events, so independent
+    waits and reads can be awaited concurrently with `gather()`; each one
+    costs a single CDP message rather than a polling loop of WebDriver
+    commands. Browser events (network responses, page loads) are
+    subscribed to rather than polled.
+
+    Interactions (typing, clicking) stay on the sync page objects. Open
+    the async page on a driver that is already in use:
+
+        async with AsyncFormValidationPage.connect(driver) as page:
+            errors = await page.get_error_messages()
+    """
+
+    URL = ""
+    TIMEOUT = 10
+    READY_LOCATORS: tuple[tuple[str, str], ...] = ()
+
+    def __init__(
+        self, driver: WebDriver, session: Any, devtools: Any, timeout: float = TIMEOUT
+    ) -> None:
+        self.driver = driver
+        self.session = session
+        self.devtools = devtools
+        self.timeout = timeout
+        self.open_seconds: Optional[float] = None
+
+    @classmethod
+    @asynccontextmanager
+    async def connect(
+        cls: type[PageT], driver: WebDriver, timeout: float = TIMEOUT
+    ) -> AsyncIterator[PageT]:
+        async with driver.bidi_connection() as connection:
+            yield cls(driver, connection.session, connection.devtools, timeout)
+
+    @property
+    def url(self) -> str:
+        return site_url(self.URL)
+
+    async def open(self) -> None:
+        print(f"[{type(self).__name__}] Opening page")
+        start = time.perf_counter()
+        await self.session.execute(self.devtools.page.enable())
+        async with self.session.wait_for(self.devtools.page.DomContentEventFired):
+            await self.session.execute(self.devtools.page.navigate(url=self.url))
+        await self.gather(
+            *(
+                lambda locator=locator: self.wait_for_visible(locator)
+                for locator in self.READY_LOCATORS
+            )
+        )
+        self.open_seconds = time.perf_counter() - start
+
+    async def evaluate(self, body: str, *args: Any) -> Any:
+        """
+        Run `body` as an async function in the page and return its result by
+        value. `body` reads its JSON-serialisable arguments from `args` and
+        can use the locate()/isVisible() helpers.
+        """
+        expression = (
+            f"(async (args) => {{{LOCATOR_JS}\n{body}}})({json.dumps(list(args))})"
+        )
+        result, exception = await self.session.execute(
+            self.devtools.runtime.evaluate(
+                expression=expression, return_by_value=True, await_promise=True
+            )
+        )
+        if exception is not None:
+            detail = exception.exception.description if exception.exception else None
+            raise JavascriptException(detail or exception.text)
+        return result.value
+
+    async def wait_for_visible(
+        self, locator: tuple[str, str], timeout: Optional[float] = None
+    ) -> ElementSnapshot:
+        timeout = self.timeout if timeout is None else timeout
+        record = await self.evaluate(_WAIT_VISIBLE_JS, list(locator), timeout * 1000)
+        if record is None:
+            raise TimeoutException(
+                f"{format_locator(locator)} not visible after {timeout}s"
+            )
+        return ElementSnapshot(locator, found=True, **record)
+
+    async def get_text(self, locator: tuple[str, str]) -> str:
+        return (await self.wait_for_visible(locator)).text
+
+    async def gather(self, *calls: Callable[[], Awaitable[T]]) -> list[T]:
+        """Run the zero-argument coroutine functions concurrently, in order."""
+        results: list[Any] = [None] * len(calls)
+
+        async def run(index: int, call: Callable[[], Awaitable[T]]) -> None:
+            results[index] = await call()
+
+        async with trio.open_nursery() as nursery:
+            for index, call in enumerate(calls):
+                nursery.start_soon(run, index, call)
+        return results
+
+    @asynccontextmanager
+    async def expect_response(
+        self, url_contains: str, timeout: Optional[float] = None
+    ) -> AsyncIterator[ExpectedResponse]:
+        """
+        Subscribe to network responses, run the body, then wait for the
+        first response whose URL contains `url_contains`:
+
+            async with page.expect_response("/form-confirmation") as expected:
+                await trio.to_thread.run_sync(sync_page.click_register_button)
+            assert expected.response.status == 200
+        """
+        timeout = self.timeout if timeout is None else timeout
+        await self.session.execute(self.devtools.network.enable())
+        expected = ExpectedResponse()
+        # Subscribed before the body runs, so the response cannot be missed;
+        # closing the channel unsubscribes it
+        async with self.session.listen(
+            self.devtools.network.ResponseReceived, buffer_size=100
+        ) as responses:
+            yield expected
+            with trio.move_on_after(timeout):
+                async for event in responses:
+                    if url_contains in event.response.url:
+                        expected.response = event.response
+                        return
+        raise TimeoutException(f"No response from *{url_contains}* after {timeout}s")
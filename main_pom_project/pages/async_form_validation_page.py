@@ -0,0 +1,30 @@
+from functools import partial
+from main_pom_project.pages.async_base_page import AsyncBasePage
+from main_pom_project.pages.form_validation_page import FormValidationPage
+
+
+class AsyncFormValidationPage(AsyncBasePage):
+    """
+    Async reads for https://practice.expandtesting.com/form-validation,
+    sharing FormValidationPage's locators. Fill and submit the form with
+    FormValidationPage, then read its feedback here concurrently.
+    """
+
+    URL = FormValidationPage.URL
+    READY_LOCATORS = FormValidationPage.READY_LOCATORS
+    ERROR_MESSAGES = {
+        "name": FormValidationPage.NAME_ERROR_MSG,
+        "phone": FormValidationPage.PHONE_ERROR_MSG,
+        "date": FormValidationPage.DATE_ERROR_MSG,
+        "payment": FormValidationPage.PAYMENT_ERROR_MSG,
+    }
+
+    async def get_error_messages(self) -> dict[str, str]:
+        """Wait for and read every field's error message at the same time."""
+        texts = await self.gather(
+            *(
+                partial(self.get_text, locator)
+                for locator in self.ERROR_MESSAGES.values()
+            )
+        )
+        return dict(zip(self.ERROR_MESSAGES, texts))
@@ -1,9 +1,17 @@
+from typing import Optional, Sequence
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from framework.adaptive_wait import AdaptiveWait, PollSchedule
+from framework.element_cache import ElementCache
+from framework.instrumentation import step
+from framework.multi_wait import wait_for_all
+from framework.page_ready import navigate_until_ready
+from framework.snapshot import ElementSnapshot, snapshot_elements
+from framework.site_urls import site_url
+from framework.traffic_replay import use_traffic
 
 
 class BasePage:
@@ -11,29 +19,85 @@ class BasePage:
     Abstract base class for all Page Object Model (POM) classes.
 
     Provides shared functionality such as:
-    - WebDriver instance and explicit waits
+    - WebDriver instance and explicit waits, with a timeout and polling
+      schedule each page class can tune (TIMEOUT, POLL)
     - Common utility methods like element waiting and assertions
+    - A per-page cache of found elements, dropped on navigation
+    - Recording or replaying the page's network traffic under --traffic
 
     All page objects should inherit from this class to maintain consistency
     and avoid code duplication across the framework.
     """
 
+    URL = ""
     TIMEOUT = 10
+    POLL = PollSchedule()
+    # open() returns once the document reaches one of READY_STATES and every
+    # READY_LOCATORS element is visible, whatever the page load strategy
+    READY_LOCATORS: tuple[tuple[str, str], ...] = ()
+    READY_STATES = ("interactive", "complete")
+    # Reuse elements found by _wait_for_element until the page navigates
+    use_element_cache = True
+    # "record", "replay" or "passthrough" for this page's traffic; None
+    # follows --traffic
+    traffic_mode: Optional[str] = None
 
-    def __init__(self, driver: WebDriver, timeout: int = TIMEOUT) -> None:
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None) -> None:
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+        self.wait = AdaptiveWait(driver, self.timeout, self.POLL)
+        self.elements = ElementCache(driver)
+        self.open_seconds: Optional[float] = None
+
+    @property
+    def url(self) -> str:
+        """`URL`, rebased onto the local stand-in site when one is configured."""
+        return site_url(self.URL)
+
+    def open(self) -> None:
+        print(f"[{type(self).__name__}] Opening page")
+        use_traffic(self.driver, type(self).__name__, self.traffic_mode)
+        with step(self.driver, "open", list(self.READY_LOCATORS)):
+            self.open_seconds = navigate_until_ready(
+                self.driver,
+                self.url,
+                self.READY_LOCATORS,
+                self.timeout,
+                self.READY_STATES,
+            )
 
     def scroll_to_bottom(self) -> None:
         ActionChains(self.driver).send_keys(Keys.END).perform()
 
     def _wait_for_element(self, locator: tuple[str, str]) -> WebElement:
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        with step(self.driver, "wait_visible", locator):
+            if self.use_element_cache:
+                return self.elements.wait_visible(locator, self.wait)
+            return self.wait.until(EC.visibility_of_element_located(locator))
 
-    def _wait_for_element_to_disappear(self, locator: tuple[str, str]) -> bool:
-        result = WebDriverWait(self.driver, 5).until(
-            EC.invisibility_of_element_located(locator)
+    def _wait_for_elements(self, *locators: tuple[str, str]) -> list[WebElement]:
+        """Wait for all `locators` to be visible in one polling loop."""
+        return wait_for_all(
+            self.driver, list(locators), self.timeout, schedule=self.POLL
         )
+
+    def snapshot_elements(
+        self,
+        *locators: tuple[str, str],
+        attributes: Sequence[str] = (),
+        styles: Sequence[str] = (),
+    ) -> list[ElementSnapshot]:
+        """Text, value, visibility, attributes and styles in one call."""
+        return snapshot_elements(self.driver, list(locators), attributes, styles)
+
+    def _wait_for_element_to_disappear(
+        self, locator: tuple[str, str], timeout: Optional[float] = None
+    ) -> bool:
+        wait = self.wait
+        if timeout is not None:
+            wait = AdaptiveWait(self.driver, timeout, self.POLL)
+        with step(self.driver, "wait_invisible", locator):
+            result = wait.until(EC.invisibility_of_element_located(locator))
         return bool(result)
 
     def _element_is_hidden(self, locator: tuple[str, str]) -> bool:
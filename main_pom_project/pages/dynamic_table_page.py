@@ -1,7 +1,104 @@
+from dataclasses import dataclass, field
+from typing import Optional
+from selenium.common.exceptions import JavascriptException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from main_pom_project.pages.base_page import BasePage
 
+# Reads headers and every cell in one round trip. innerText matches what
+# WebElement.text returns for table cells.
+#
+# The first call also installs a MutationObserver that bumps a generation
+# counter whenever the table's content changes or the table is replaced.
+# The returned version is "<document id>:<generation>"; when the caller
+# already holds that version only the version is sent back, not the data.
+_TABLE_SNAPSHOT_JS = """
+const [selector, knownVersion] = arguments;
+let watch = window.__tableWatch;
+if (!watch) {
+  watch = window.__tableWatch = {
+    id: Math.random().toString(36).slice(2),
+    generation: 0,
+  };
+  const touchesTable = (node) =>
+    node.nodeType === Node.ELEMENT_NODE &&
+    (node.matches(selector) || node.querySelector(selector) !== null);
+  new MutationObserver((mutations) => {
+    const current = document.querySelector(selector);
+    const changed = mutations.some(
+      (m) =>
+        (current !== null && current.contains(m.target)) ||
+        Array.from(m.addedNodes).some(touchesTable) ||
+        Array.from(m.removedNodes).some(touchesTable)
+    );
+    if (changed) {
+      watch.generation += 1;
+    }
+  }).observe(document.documentElement, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+  });
+}
+
+const version = `${watch.id}:${watch.generation}`;
+if (version === knownVersion) {
+  return { version };
+}
+const table = document.querySelector(selector);
+if (!table) {
+  return null;
+}
+const text = (cell) => cell.innerText.trim();
+return {
+  version,
+  headers: Array.from(table.querySelectorAll("thead th"), text),
+  rows: Array.from(table.querySelectorAll("tbody tr"), (row) =>
+    Array.from(row.querySelectorAll("td"), text)
+  ),
+};
+"""
+
+
+@dataclass
+class TableSnapshot:
+    """
+    Header names (lowercased) and cell text of the table at one point in time.
+
+    Lookups by header or process name go through hash indexes built once
+    per snapshot, so they never touch the browser.
+    """
+
+    headers: list[str]
+    rows: list[list[str]]
+    # Render version from the page; None when read without the observer
+    version: Optional[str] = None
+    column_index: dict[str, int] = field(init=False, repr=False)
+    row_index: dict[str, list[str]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.column_index = {header: i for i, header in enumerate(self.headers)}
+        self.row_index = {}
+        for row in self.rows:
+            if row:
+                # Keep the first match, like a top-to-bottom scan would
+                self.row_index.setdefault(row[0].lower(), row)
+
+    def get_row(self, process_name: str) -> Optional[list[str]]:
+        return self.row_index.get(process_name.lower())
+
+    def get_row_dict(self, process_name: str) -> Optional[dict[str, str]]:
+        row = self.get_row(process_name)
+        return None if row is None else dict(zip(self.headers, row))
+
+    def get_cell(self, process_name: str, header: str) -> Optional[str]:
+        row = self.get_row(process_name)
+        column = self.column_index.get(header.lower())
+        if row is None or column is None or column >= len(row):
+            return None
+        return row[column]
+
 
 class DynamicTablePage(BasePage):
     """
@@ -20,13 +117,22 @@ class DynamicTablePage(BasePage):
         By.XPATH,
         "//h1[text()='Dynamic Table page for Automation Testing Practice']",
     )
-    TABLE_ROWS = (By.CSS_SELECTOR, "table.table-striped tbody tr")
+    TABLE_CSS = "table.table-striped"
+    TABLE_ROWS = (By.CSS_SELECTOR, f"{TABLE_CSS} tbody tr")
+    TABLE_HEADERS = (By.CSS_SELECTOR, f"{TABLE_CSS} thead th")
     SUMMARY_TEXT = (By.ID, "chrome-cpu")
+    READY_LOCATORS = (PAGE_TITLE, TABLE_ROWS, SUMMARY_TEXT)
+
+    # Set to False to read the table element by element (one round trip per cell)
+    use_bulk_extraction = True
+
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None) -> None:
+        super().__init__(driver, timeout)
+        self._table_snapshot: Optional[TableSnapshot] = None
 
     def open(self) -> None:
-        print("[DynamicTablePage] Opening page")
-        self.driver.get(self.URL)
-        self._wait_for_element(self.PAGE_TITLE)
+        self._table_snapshot = None
+        super().open()
 
     def get_title_element(self) -> WebElement:
         return self._wait_for_element(self.PAGE_TITLE)
@@ -34,31 +140,62 @@ class DynamicTablePage(BasePage):
     def get_summary_text(self) -> str:
         return self._wait_for_element(self.SUMMARY_TEXT).text.strip()
 
+    def get_table_snapshot(self, use_cache: bool = True) -> TableSnapshot:
+        """
+        Return the current table contents, reusing the cached snapshot when
+        the table has not re-rendered since it was taken.
+        """
+        if not self.use_bulk_extraction:
+            self._wait_for_element(self.TABLE_ROWS)
+            return self._get_table_snapshot_per_element()
+
+        cached = self._table_snapshot if use_cache else None
+        if cached is None:
+            # Wait for at least one row to confirm table is present
+            self._wait_for_element(self.TABLE_ROWS)
+        try:
+            data = self.driver.execute_script(
+                _TABLE_SNAPSHOT_JS, self.TABLE_CSS, cached.version if cached else None
+            )
+        except JavascriptException:
+            data = None
+
+        if data is None:
+            self._table_snapshot = None
+            self._wait_for_element(self.TABLE_ROWS)
+            return self._get_table_snapshot_per_element()
+        if cached is not None and data["version"] == cached.version:
+            return cached
+
+        headers = [header.lower() for header in data["headers"]]
+        self._table_snapshot = TableSnapshot(headers, data["rows"], data["version"])
+        return self._table_snapshot
+
     def get_all_rows(self) -> list[list[str]]:
-        # Wait for at least one row to confirm table is present
-        self._wait_for_element((By.CSS_SELECTOR, "table.table-striped tbody tr"))
-        rows = self.driver.find_elements(*self.TABLE_ROWS)
-        return [
-            [cell.text.strip() for cell in row.find_elements(By.TAG_NAME, "td")]
-            for row in rows
-        ]
+        return self.get_table_snapshot().rows
 
     def get_table_headers(self) -> list[str]:
-        header_cells = self.driver.find_elements(
-            By.CSS_SELECTOR, "table.table-striped thead th"
+        return self.get_table_snapshot().headers
+
+    def _get_table_snapshot_per_element(self) -> TableSnapshot:
+        header_cells = self.driver.find_elements(*self.TABLE_HEADERS)
+        rows = self.driver.find_elements(*self.TABLE_ROWS)
+        return TableSnapshot(
+            headers=[cell.text.strip().lower() for cell in header_cells],
+            rows=[
+                [cell.text.strip() for cell in row.find_elements(By.TAG_NAME, "td")]
+                for row in rows
+            ],
         )
-        return [cell.text.strip().lower() for cell in header_cells]
 
     def get_process_row_dict(self, process_name: str) -> dict[str, str]:
-        headers = self.get_table_headers()
-        for row in self.get_all_rows():
-            if row and row[0].lower() == process_name.lower():
-                return dict(zip(headers, row))
-        raise ValueError(f"Row for process '{process_name}' not found.")
+        row_dict = self.get_table_snapshot().get_row_dict(process_name)
+        if row_dict is None:
+            raise ValueError(f"Row for process '{process_name}' not found.")
+        return row_dict
 
     def get_chrome_cpu_from_table(self) -> str:
-        row_dict = self.get_process_row_dict("chrome")
-        cpu_value = row_dict.get("cpu")
+        cpu_value = self.get_process_row_dict("chrome").get("cpu")
         if not cpu_value:
             raise ValueError("CPU value not found in Chrome row.")
         return cpu_value.strip()
@@ -25,11 +25,7 @@ class FileDownloadPage(BasePage):
         "//h1[text()='File Downloader page for Automation Testing Practice']",
     )
     DOWNLOAD_LINK = (By.CSS_SELECTOR, 'a[data-testid="some-file.txt"]')
-
-    def open(self) -> None:
-        print("[FileDownloadPage] Opening page")
-        self.driver.get(self.URL)
-        self._wait_for_element(self.PAGE_TITLE)
+    READY_LOCATORS = (PAGE_TITLE, DOWNLOAD_LINK)
 
     def get_title_element(self) -> WebElement:
         return self._wait_for_element(self.PAGE_TITLE)
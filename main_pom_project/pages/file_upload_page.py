@@ -38,11 +38,10 @@ class FileUploadPage(BasePage):
         By.CSS_SELECTOR,
         "button.btn-close",
     )
-
-    def open(self) -> None:
-        print("[FileUploadPage] Opening page")
-        self.driver.get(self.URL)
-        self._wait_for_element(self.PAGE_TITLE)
+    READY_LOCATORS = (PAGE_TITLE, FILE_INPUT, UPLOAD_BUTTON)
+    # The upload result echoes the file sent, and multipart bodies (random
+    # boundary, file contents) cannot be matched to a recording
+    traffic_mode = "passthrough"
 
     def get_title_element(self) -> WebElement:
         return self._wait_for_element(self.PAGE_TITLE)
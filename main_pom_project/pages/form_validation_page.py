@@ -1,5 +1,9 @@
+from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
+from framework.fast_fill import fill_fields, read_values
+from framework.instrumentation import format_locator
+from framework.snapshot import ElementSnapshot
 from main_pom_project.pages.base_page import BasePage
 
 
@@ -52,21 +56,47 @@ class FormValidationPage(BasePage):
     )
     REGISTER_BUTTON = (By.CSS_SELECTOR, "button.btn.btn-primary")
     CONFIRM_MSG = (By.CSS_SELECTOR, "div.alert.alert-info > p")
-
-    def open(self) -> None:
-        print("[FormValidationPage] Opening page")
-        self.driver.get(self.URL)
-        self._wait_for_element(self.PAGE_TITLE)
+    READY_LOCATORS = (PAGE_TITLE, NAME_INPUT, REGISTER_BUTTON)
+    # Keyboard entry by default; set True to fill the whole form in one
+    # script call and verify it with one read-back
+    use_fast_fill = False
 
     def get_title_element(self) -> WebElement:
         return self._wait_for_element(self.PAGE_TITLE)
 
     def fill_form(self, name: str, phone: str, date: str, payment_method: str) -> None:
+        if self.use_fast_fill:
+            self._fast_fill_form(name, phone, date, payment_method)
+            return
         self._input_text(self.NAME_INPUT, name)
         self._input_text(self.PHONE_INPUT, phone)
         self._input_text(self.DATE_INPUT, date)
         self._select_dropdown(self.PAYMENT_SELECT, payment_method)
 
+    def _fast_fill_form(
+        self, name: str, phone: str, date: str, payment_method: str
+    ) -> None:
+        self._wait_for_element(self.NAME_INPUT)
+        fields = [
+            (self.NAME_INPUT, name),
+            (self.PHONE_INPUT, phone),
+            (self.DATE_INPUT, self._date_input_value(date)),
+            (self.PAYMENT_SELECT, payment_method),
+        ]
+        fill_fields(self.driver, fields)
+        actual = read_values(self.driver, [locator for locator, _ in fields])
+        expected = {format_locator(locator): value for locator, value in fields}
+        self.assert_equal(expected, actual, "Fast fill read-back mismatch: ")
+
+    @staticmethod
+    def _date_input_value(date: str) -> str:
+        # Typing "07-16-2025" into a date input yields "2025-07-16"; setting
+        # the value directly needs the ISO form up front
+        try:
+            return datetime.strptime(date, "%m-%d-%Y").date().isoformat()
+        except ValueError:
+            return date
+
     def click_register_button(self) -> None:
         self._wait_for_element(self.REGISTER_BUTTON).click()
 
@@ -87,19 +117,35 @@ class FormValidationPage(BasePage):
         return self._wait_for_element(self.PHONE_ERROR_MSG).text.strip()
 
     def get_phone_success_indicator(self) -> bool:
-        return self._element_is_hidden(self.PHONE_ERROR_MSG)
+        return self.snapshot_elements(self.PHONE_ERROR_MSG)[0].hidden
 
     def get_date_error_msg(self) -> str:
         return self._wait_for_element(self.DATE_ERROR_MSG).text.strip()
 
     def get_date_success_indicator(self) -> bool:
-        return self._element_is_hidden(self.DATE_ERROR_MSG)
+        return self.snapshot_elements(self.DATE_ERROR_MSG)[0].hidden
 
     def get_payment_error_msg(self) -> str:
         return self._wait_for_element(self.PAYMENT_ERROR_MSG).text.strip()
 
     def get_payment_success_indicator(self) -> bool:
-        return self._element_is_hidden(self.PAYMENT_ERROR_MSG)
+        return self.snapshot_elements(self.PAYMENT_ERROR_MSG)[0].hidden
+
+    def get_validation_feedback(self) -> dict[str, ElementSnapshot]:
+        """
+        Snapshot every field's feedback message in one call, keyed
+        "name_success", "name_error", "phone_error", "date_error" and
+        "payment_error". A field is valid when its error message is hidden.
+        """
+        feedback = {
+            "name_success": self.NAME_SUCCESS_MSG,
+            "name_error": self.NAME_ERROR_MSG,
+            "phone_error": self.PHONE_ERROR_MSG,
+            "date_error": self.DATE_ERROR_MSG,
+            "payment_error": self.PAYMENT_ERROR_MSG,
+        }
+        snapshots = self.snapshot_elements(*feedback.values())
+        return dict(zip(feedback, snapshots))
 
     def _input_text(self, locator: tuple[str, str], text: str) -> None:
         elem = self._wait_for_element(locator)
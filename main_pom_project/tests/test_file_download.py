@@ -1,7 +1,7 @@
 import pytest
 from selenium.webdriver.remote.webdriver import WebDriver
 from main_pom_project.pages.file_download_page import FileDownloadPage
-from conftest import wait_for_file
+from framework.downloads import DownloadWatcher
 
 
 @pytest.mark.file_download
@@ -29,9 +29,15 @@ def test_file_downloads_successfully(driver: WebDriver) -> None:
     page = FileDownloadPage(driver)
     page.open()
 
-    # Click link to trigger download
-    page.click_download_link()
+    # download_dir is dynamically added in the fixture. Start watching
+    # before the click so the reported duration covers the whole download.
+    with DownloadWatcher(driver.download_dir) as watcher:  # type: ignore[attr-defined]
+        # Click link to trigger download
+        page.click_download_link()
+        result = watcher.wait_for("some-file.txt", timeout=10)
 
-    # This is dynamically added in the fixture
-    download_file_path = driver.download_dir / "some-file.txt"  # type: ignore[attr-defined]
-    assert wait_for_file(download_file_path), f"File not found: {download_file_path}"
+    print(
+        f"[download] {result.path.name}: {result.size_bytes} bytes "
+        f"in {result.seconds:.2f}s"
+    )
+    assert result.size_bytes > 0, f"Downloaded file is empty: {result.path}"
@@ -1,6 +1,12 @@
 import pytest
+import trio
+from main_pom_project.pages.async_form_validation_page import (
+    AsyncFormValidationPage,
+)
 from main_pom_project.pages.form_validation_page import FormValidationPage
 from selenium.webdriver.remote.webdriver import WebDriver
+from framework.fast_fill import read_values
+from framework.site_urls import site_url
 
 
 @pytest.mark.form_validation
@@ -35,7 +41,7 @@ def test_valid_form_submission_redirects(driver: WebDriver) -> None:
     page.click_register_button()
 
     # Assert user is redirected to confirmation page after clicking Register
-    expected_url = "https://practice.expandtesting.com/form-confirmation"
+    expected_url = site_url("https://practice.expandtesting.com/form-confirmation")
     page.assert_equal(expected_url, driver.current_url, "URL mismatch: ")
 
     # Assert confirmation message is correct
@@ -94,6 +100,35 @@ def test_blank_form_submission_shows_errors(driver: WebDriver) -> None:
     )
 
 
+@pytest.mark.form_validation
+def test_blank_form_errors_read_concurrently(driver: WebDriver) -> None:
+    """
+    Submit the blank form, then wait for and read all four error messages
+    at once through the async page.
+    """
+    page = FormValidationPage(driver)
+    page.open()
+    page.clear_name_field()
+
+    async def submit_and_read_errors() -> dict[str, str]:
+        async with AsyncFormValidationPage.connect(driver) as async_page:
+            await trio.to_thread.run_sync(page.click_register_button)
+            return await async_page.get_error_messages()
+
+    errors = trio.run(submit_and_read_errors)
+
+    page.assert_equal(
+        {
+            "name": "Please enter your Contact name.",
+            "phone": "Please provide your Contact number.",
+            "date": "Please provide valid Date.",
+            "payment": "Please select the Payment Method.",
+        },
+        errors,
+        "Error messages mismatch: ",
+    )
+
+
 @pytest.mark.form_validation
 def test_field_validation_feedback(driver: WebDriver) -> None:
     """
@@ -139,3 +174,76 @@ def test_field_validation_feedback(driver: WebDriver) -> None:
         page.get_payment_success_indicator(),
         "Payment method field should suppress error message: ",
     )
+
+
+@pytest.mark.form_validation
+def test_validation_feedback_snapshot_matches_field_reads(driver: WebDriver) -> None:
+    """
+    The one-call feedback snapshot must agree with reading each field's
+    feedback on its own, after a failed submission and a valid fill.
+    """
+    page = FormValidationPage(driver)
+    page.open()
+    page.clear_name_field()
+    page.click_register_button()
+    page.fill_form(
+        name="Brian QA", phone="345-6789190", date="07-16-2025", payment_method="card"
+    )
+
+    feedback = page.get_validation_feedback()
+    page.assert_equal(
+        (
+            page.get_name_success_msg(),
+            page.get_phone_success_indicator(),
+            page.get_date_success_indicator(),
+            page.get_payment_success_indicator(),
+        ),
+        (
+            feedback["name_success"].text,
+            feedback["phone_error"].hidden,
+            feedback["date_error"].hidden,
+            feedback["payment_error"].hidden,
+        ),
+        "Feedback snapshot differs from per-field reads: ",
+    )
+
+
+@pytest.mark.form_validation
+def test_fast_fill_matches_keyboard_feedback(driver: WebDriver) -> None:
+    """
+    Fill the form after a failed submission once by keyboard and once
+    with batched fast fill; both must leave the same values and the same
+    validation feedback on every field.
+    """
+    feedback = {}
+    for use_fast_fill in (False, True):
+        page = FormValidationPage(driver)
+        page.use_fast_fill = use_fast_fill
+        page.open()
+        page.clear_name_field()
+        page.click_register_button()
+        page.fill_form(
+            name="Brian QA",
+            phone="345-6789190",
+            date="07-16-2025",
+            payment_method="card",
+        )
+        feedback[use_fast_fill] = (
+            read_values(
+                driver,
+                [
+                    page.NAME_INPUT,
+                    page.PHONE_INPUT,
+                    page.DATE_INPUT,
+                    page.PAYMENT_SELECT,
+                ],
+            ),
+            page.get_name_success_msg(),
+            page.get_phone_success_indicator(),
+            page.get_date_success_indicator(),
+            page.get_payment_success_indicator(),
+        )
+
+    page.assert_equal(
+        feedback[False], feedback[True], "Fast fill feedback differs from keyboard: "
+    )
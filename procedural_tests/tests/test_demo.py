@@ -1,4 +1,5 @@
-from procedural_tests.utils import form_helpers
+from procedural_tests.utils import form_helpers, form_spec
+from framework.site_urls import site_url
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,7 +7,7 @@ from selenium.webdriver.support import expected_conditions as EC
 
 
 def test_landing_page(driver):
-    driver.get("https://seleniumbase.io/demo_page")
+    driver.get(site_url("https://seleniumbase.io/demo_page"))
 
     WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.XPATH, "//title[text()='Web Testing Page']"))
@@ -20,40 +21,39 @@ def test_landing_page(driver):
 
 
 def test_validate_form_fields(driver):
-    driver.get("https://seleniumbase.io/demo_page")
+    driver.get(site_url("https://seleniumbase.io/demo_page"))
 
-    form_helpers.validate_text_input(
+    # Text entry fields are checked, filled and read back together
+    form_spec.validate_form(
         driver,
-        locator_type=By.ID,
-        locator_value="myTextInput",
-        label_expected_text="Text Input Field:",
-        value_to_type="Learn Selenium",
-    )
-
-    form_helpers.validate_pre_filled_text_input(
-        driver,
-        locator_type=By.ID,
-        locator_value="myTextInput2",
-        pre_filled_text="Text...",
-        label_expected_text="Pre-Filled Text Field:",
-        value_to_type="- appended!",
-    )
-
-    form_helpers.validate_placeholder_field_text_input(
-        driver,
-        locator_type=By.ID,
-        locator_value="placeholderText",
-        placeholder_text="Placeholder Text Field",
-        label_expected_text="Placeholder Text Field:",
-        value_to_type="New text!",
-    )
-
-    form_helpers.validate_textarea_input(
-        driver,
-        locator_type=By.ID,
-        locator_value="myTextarea",
-        label_expected_text="Textarea:",
-        values_to_type=["Line 1", "Line 2"],
+        [
+            form_spec.FieldSpec(
+                kind="text",
+                locator=(By.ID, "myTextInput"),
+                label="Text Input Field:",
+                value="Learn Selenium",
+            ),
+            form_spec.FieldSpec(
+                kind="prefilled",
+                locator=(By.ID, "myTextInput2"),
+                label="Pre-Filled Text Field:",
+                prefill="Text...",
+                value="- appended!",
+            ),
+            form_spec.FieldSpec(
+                kind="placeholder",
+                locator=(By.ID, "placeholderText"),
+                label="Placeholder Text Field:",
+                placeholder="Placeholder Text Field",
+                value="New text!",
+            ),
+            form_spec.FieldSpec(
+                kind="textarea",
+                locator=(By.ID, "myTextarea"),
+                label="Textarea:",
+                value="\n".join(["Line 1", "Line 2"]),
+            ),
+        ],
     )
 
     form_helpers.validate_SVG(
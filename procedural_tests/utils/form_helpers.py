@@ -1,9 +1,10 @@
-import time
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support import expected_conditions as EC
+from framework.adaptive_wait import AdaptiveWait
+from framework.animation import wait_for_style_change
+from framework.instrumentation import step
+from framework.multi_wait import wait_for_all
 
 
 def _assert_equal(expected, actual, message_prefix=""):
@@ -18,160 +19,11 @@ def _assert_not_equal(expected, actual, message_prefix=""):
     ), f"{message_prefix}Expected: '{expected}', Actual: '{actual.strip()}'"
 
 
-def validate_text_input(
-    driver, locator_type, locator_value, label_expected_text, value_to_type, timeout=10
-):
-    # Wait for and locate input
-    input_elem = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((locator_type, locator_value))
-    )
-
-    # Locate corresponding label <td>
-    label_elem = input_elem.find_element(By.XPATH, "./parent::td/preceding-sibling::td")
-
-    # Validate label text
-    _assert_equal(
-        label_elem.text.strip(),
-        label_expected_text,
-        f"Label text mismatch for '{locator_value}'",
-    )
-
-    # Type into field
-    input_elem.clear()
-    print(f"[text_input] Typing '{value_to_type}' into '{locator_value}'")
-    input_elem.send_keys(value_to_type)
-
-    # Validate value was entered
-    _assert_equal(
-        input_elem.get_attribute("value"), value_to_type, "Value not properly set"
-    )
-
-
-def validate_pre_filled_text_input(
-    driver,
-    locator_type,
-    locator_value,
-    pre_filled_text,
-    label_expected_text,
-    value_to_type,
-    timeout=10,
-):
-    # Wait for and locate input
-    input_elem = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((locator_type, locator_value))
-    )
-
-    # Locate corresponding label <td>
-    label_elem = input_elem.find_element(By.XPATH, "./parent::td/preceding-sibling::td")
-
-    # Validate label text
-    _assert_equal(
-        label_elem.text.strip(),
-        label_expected_text,
-        f"Label text mismatch for '{locator_value}'",
-    )
-
-    # Validate pre-filled text
-    _assert_equal(
-        input_elem.get_attribute("value"), pre_filled_text, "Value not properly set"
-    )
-
-    # Append the text
-    print(
-        f"[pre_filled_input] Appending '{value_to_type}' to pre-filled '{pre_filled_text}' in '{locator_value}'"
-    )
-    input_elem.send_keys(Keys.END)
-    input_elem.send_keys(value_to_type)
-
-    # Validate value was entered
-    print(f"[pre_filled_input] Final value: '{input_elem.get_attribute('value')}'")
-    expected = pre_filled_text + value_to_type
-    actual = input_elem.get_attribute("value")
-    _assert_equal(expected, actual, f"Final value mismatch for '{locator_value}': ")
-
-
-def validate_placeholder_field_text_input(
-    driver,
-    locator_type,
-    locator_value,
-    placeholder_text,
-    label_expected_text,
-    value_to_type,
-    timeout=10,
-):
-    # Wait for and locate input
-    input_elem = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((locator_type, locator_value))
-    )
-
-    # Locate corresponding label <td>
-    label_elem = input_elem.find_element(By.XPATH, "./parent::td/preceding-sibling::td")
-
-    # Validate label text
-    _assert_equal(
-        label_elem.text.strip(),
-        label_expected_text,
-        f"Label text mismatch for '{locator_value}'",
-    )
-
-    # Validate placeholder text
-    _assert_equal(
-        input_elem.get_attribute("placeholder"),
-        placeholder_text,
-        f"Placeholder text mismatch for '{locator_value}'",
-    )
-
-    # Enter the text
-    print(
-        f"[placeholder_input] Typing '{value_to_type}' into placeholder '{placeholder_text}' for '{locator_value}'"
-    )
-    input_elem.send_keys(value_to_type)
-
-    # Validate value was entered
-    _assert_equal(
-        input_elem.get_attribute("value"), value_to_type, "Value not properly set"
-    )
-
-
-def validate_textarea_input(
-    driver, locator_type, locator_value, label_expected_text, values_to_type, timeout=10
-):
-    # Wait for and locate Text Area
-    textarea_elem = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((locator_type, locator_value))
-    )
-
-    # Locate corresponding label <td>
-    label_elem = textarea_elem.find_element(
-        By.XPATH, f"./ancestor::tr/td[contains(text(), '{label_expected_text}')]"
-    )
-
-    # Validate label text
-    _assert_equal(
-        label_elem.text.strip(),
-        label_expected_text,
-        f"Label text mismatch for '{locator_value}'",
-    )
-
-    # Validate that it's indeed a textarea
-    textarea_elem.clear()
-    print(
-        f"[textarea_input] Typing into '{locator_value}':\n" + "\n".join(values_to_type)
-    )
-    textarea_elem.send_keys("\n".join(values_to_type))
-    # Ensure that the textarea contains new lines
-    _assert_equal(
-        True,
-        "\n" in textarea_elem.get_attribute("value"),
-        "Textarea is missing newline",  # type: ignore[attr-defined]
-    )
-
-    # Validate value was entered
-    _assert_equal(
-        "\n".join(values_to_type),
-        textarea_elem.get_attribute("value"),
-        "Value not properly set",
-    )
+def _wait_visible(driver, locator, timeout):
+    with step(driver, "wait_visible", locator):
+        return AdaptiveWait(driver, timeout).until(
+            EC.visibility_of_element_located(locator)
+        )
 
 
 def validate_SVG(
@@ -184,9 +36,7 @@ def validate_SVG(
     timeout=10,
 ) -> None:
     # Wait for and locate SVG element
-    svg_rect = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((locator_type, locator_value))
-    )
+    svg_rect = _wait_visible(driver, (locator_type, locator_value), timeout)
 
     # Locate corresponding label <td>
     label_elem = svg_rect.find_element(
@@ -209,16 +59,14 @@ def validate_SVG(
 
     # Click it to re-trigger the animation
     svg_rect.click()
-    # Capture a visual CSS property
+    # Capture a visual CSS property as soon as the animation changes it
     print(f"[SVG] Clicking on '{locator_value}' to trigger animation")
-    initial_opacity = svg_rect.value_of_css_property("opacity")
-    print(f"[SVG] Initial opacity: {initial_opacity}")
-    time.sleep(1.0)  # Wait for the animation to run
-    updated_opacity = svg_rect.value_of_css_property("opacity")
-    print(f"[SVG] Updated opacity: {updated_opacity}")
+    change = wait_for_style_change(driver, svg_rect, "opacity", timeout)
+    print(f"[SVG] Initial opacity: {change.initial}")
+    print(f"[SVG] Updated opacity: {change.final} after {change.seconds:.2f}s")
     _assert_not_equal(
-        initial_opacity,
-        updated_opacity,
+        change.initial,
+        change.final,
         f"Opacity did not change for '{locator_value}', indicating SVG rect animation did not run",
     )
 
@@ -234,8 +82,8 @@ def validate_dropdown(
     timeout=10,
 ):
     # Wait for and locate dropdown
-    dropdown_menu_elem = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((menu_locator_type, menu_locator_value))
+    dropdown_menu_elem = _wait_visible(
+        driver, (menu_locator_type, menu_locator_value), timeout
     )
     dropdown_menu_text = dropdown_menu_elem.text.strip()
 
@@ -243,11 +91,7 @@ def validate_dropdown(
     ActionChains(driver).move_to_element(dropdown_menu_elem).pause(0.5).perform()
 
     # Wait for dropdown items to be visible
-    WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located(
-            (contents_locator_type, contents_locator_value)
-        )
-    )
+    _wait_visible(driver, (contents_locator_type, contents_locator_value), timeout)
 
     # Validate options
     dropdown_contents_elem = driver.find_element(
@@ -283,9 +127,10 @@ def validate_dropdown(
     # Validate header reverts after clicking dropdown menu again
     print(f"[dropdown] Clicking on '{dropdown_menu_text}' to reset the header")
     dropdown_menu_elem.click()
-    WebDriverWait(driver, timeout).until(
-        EC.text_to_be_present_in_element((By.TAG_NAME, "h3"), "Automation Practice")
-    )
+    with step(driver, "wait_text", (By.TAG_NAME, "h3")):
+        AdaptiveWait(driver, timeout).until(
+            EC.text_to_be_present_in_element((By.TAG_NAME, "h3"), "Automation Practice")
+        )
     header_elem = driver.find_element(By.TAG_NAME, "h3")
     _assert_equal(
         header_elem.text.strip(),
@@ -302,11 +147,9 @@ def validate_color_elements(driver, color, timeout=10) -> None:
         ("pText", f"This Text is {color}", "text"),
     ]
 
-    for elem_locator, elem_expected_text, method in elements:
-        elem = WebDriverWait(driver, timeout).until(
-            EC.visibility_of_element_located((By.ID, elem_locator))
-        )
-
+    # Wait for all three at once rather than one polling loop each
+    found = wait_for_all(driver, [(By.ID, e[0]) for e in elements], timeout)
+    for (elem_locator, elem_expected_text, method), elem in zip(elements, found):
         # Get actual text from correct source
         if method == "text":
             elem_actual_text = elem.text.strip()
@@ -335,9 +178,7 @@ def validate_button(
     driver, locator_type, locator_value, button_text, label_expected_text, timeout=10
 ):
     # Wait for and locate button
-    button_elem = WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located((locator_type, locator_value))
-    )
+    button_elem = _wait_visible(driver, (locator_type, locator_value), timeout)
 
     # Validate button text
     button_actual_text = button_elem.text.strip()
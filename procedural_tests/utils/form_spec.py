@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from typing import Optional
+from selenium.webdriver.common.keys import Keys
+from framework.fast_fill import fill_fields, read_values
+from framework.instrumentation import format_locator, step
+from framework.js_locators import LOCATOR_JS
+from framework.multi_wait import wait_for_all
+
+# How the value is entered and what is checked before typing:
+# - text, textarea: cleared, then typed
+# - prefilled: `prefill` checked, then `value` appended to it
+# - placeholder: `placeholder` checked, then typed into the empty field
+FIELD_KINDS = ("text", "textarea", "prefilled", "placeholder")
+
+# Label text, current value and placeholder of every field in one call.
+# The label is the field's <label>, or else the other cell of its table row
+# (the demo page lays the form out as "Label: | field" rows).
+_READ_FIELDS_JS = LOCATOR_JS + """
+const [locators] = arguments;
+const text = (node) => (node.innerText || node.textContent || "").trim();
+return locators.map((locator) => {
+  const element = locate(locator);
+  if (!element) {
+    return null;
+  }
+  let label = element.labels && element.labels.length ? element.labels[0] : null;
+  const row = element.closest("tr");
+  if (!label && row) {
+    label = Array.from(row.cells).find((cell) => !cell.contains(element)) || null;
+  }
+  return {
+    label: label ? text(label) : null,
+    value: "value" in element ? String(element.value) : null,
+    placeholder: element.getAttribute("placeholder"),
+  };
+});
+"""
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    kind: str
+    locator: tuple[str, str]
+    label: str
+    value: str
+    prefill: Optional[str] = None
+    placeholder: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.kind not in FIELD_KINDS:
+            raise ValueError(
+                f"Unknown field kind {self.kind!r}; use one of {FIELD_KINDS}"
+            )
+        if self.kind == "prefilled" and self.prefill is None:
+            raise ValueError(f"prefilled field {self.name} needs `prefill`")
+        if self.kind == "placeholder" and self.placeholder is None:
+            raise ValueError(f"placeholder field {self.name} needs `placeholder`")
+
+    @property
+    def name(self) -> str:
+        return f"'{self.locator[1]}'"
+
+    @property
+    def expected_value(self) -> str:
+        """The field's value once `value` has been entered."""
+        if self.kind == "prefilled":
+            return (self.prefill or "") + self.value
+        return self.value
+
+
+def _mismatch(prefix: str, expected: object, actual: object) -> Optional[str]:
+    if expected == actual:
+        return None
+    return f"{prefix}Expected: '{expected}', Actual: '{actual}'"
+
+
+def validate_form(
+    driver, specs: list[FieldSpec], timeout: float = 10, fast_fill: bool = False
+) -> None:
+    """
+    Check, fill and verify every field in `specs` together.
+
+    All fields are waited for in one polling loop; their labels, prefills
+    and placeholders are read in one call. Values are then typed (or, with
+    `fast_fill`, set in one call), and all results are read back in one
+    call. Every mismatch is reported at the end, one line per problem,
+    rather than stopping at the first.
+    """
+    locators = [spec.locator for spec in specs]
+    elements = wait_for_all(driver, locators, timeout)
+    with step(driver, "read_fields", locators):
+        before = driver.execute_script(_READ_FIELDS_JS, locators)
+
+    errors: list[Optional[str]] = []
+    for spec, field in zip(specs, before):
+        if field is None:
+            errors.append(f"No element for {spec.name}")
+            continue
+        errors.append(
+            _mismatch(
+                f"Label text mismatch for {spec.name}: ", spec.label, field["label"]
+            )
+        )
+        if spec.kind == "prefilled":
+            errors.append(
+                _mismatch(
+                    f"Pre-filled text mismatch for {spec.name}: ",
+                    spec.prefill,
+                    field["value"],
+                )
+            )
+        elif spec.kind == "placeholder":
+            errors.append(
+                _mismatch(
+                    f"Placeholder text mismatch for {spec.name}: ",
+                    spec.placeholder,
+                    field["placeholder"],
+                )
+            )
+
+    if fast_fill:
+        print(f"[form_spec] Filling {len(specs)} fields in one call")
+        fill_fields(driver, [(spec.locator, spec.expected_value) for spec in specs])
+    else:
+        for spec, element in zip(specs, elements):
+            print(f"[form_spec] Typing {spec.value!r} into {spec.name} ({spec.kind})")
+            if spec.kind == "prefilled":
+                element.send_keys(Keys.END, spec.value)
+            else:
+                if spec.kind != "placeholder":
+                    element.clear()
+                element.send_keys(spec.value)
+
+    values = read_values(driver, locators)
+    for spec in specs:
+        errors.append(
+            _mismatch(
+                f"Final value mismatch for {spec.name}: ",
+                spec.expected_value,
+                values[format_locator(spec.locator)],
+            )
+        )
+
+    problems = [error for error in errors if error is not None]
+    assert not problems, "\n".join(problems)